@@ -0,0 +1,118 @@
+"""Headless batch scoring for files shaped like user_profile.csv.
+
+Reads the profiles in chunks straight into the compact uint8/float32 form
+(``compact_profiles``), builds the model's float32 matrix from it, scores
+the chunks with ``predict_proba`` across worker processes and streams the
+top-k careers per ``Profile_ID`` to the output CSV.
+
+    python batch_score.py user_profile.csv --out scores.csv --top-k 3 --workers 4
+"""
+
+import argparse
+import multiprocessing as mp
+import pickle
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from career_schema import ID_COLUMN
+from compact_profiles import read_compact_chunks
+from forest_engine import FlatForest, top_k
+
+# The forest was fitted on a DataFrame; we feed it aligned float32 arrays
+warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+# Per-process model state, filled in by _init_worker
+_worker = {}
+
+
+def load_saved_objects(model_path):
+    with open(model_path, "rb") as f:
+        saved_objects = pickle.load(f)
+    return saved_objects["model"], saved_objects["label_encoder"], saved_objects["features"]
+
+
+def read_profile_chunks(path, chunk_size):
+    """Yield CompactProfiles chunks of a profile CSV, tolerating one trailing extra column.
+
+    Without a ``Profile_ID`` column, rows are identified by their 1-based row number.
+    """
+    # Some saved rows have the predicted career appended without a header entry;
+    # read_compact_chunks uses usecols + index_col=False, which drops those fields
+    for _, compact in read_compact_chunks(path, chunk_size):
+        yield compact
+
+
+def _init_worker(model_path, engine="sklearn", pooled=False):
+    model, label_encoder, feature_names = load_saved_objects(model_path)
+    if engine == "flat":
+        model = FlatForest.from_sklearn(model)
+    elif pooled:
+        # Parallelism comes from the process pool; keep each forest single-threaded
+        model.n_jobs = 1
+    _worker["model"] = model
+    _worker["classes"] = np.asarray(label_encoder.classes_)
+    _worker["feature_names"] = feature_names
+
+
+def _score_chunk(args):
+    compact, k = args
+    X = compact.feature_matrix(_worker["feature_names"])
+    idx, top_probs = top_k(_worker["model"].predict_proba(X), k)
+    out = pd.DataFrame({ID_COLUMN: compact.ids})
+    for rank in range(idx.shape[1]):
+        out[f"career_{rank + 1}"] = _worker["classes"][idx[:, rank]]
+        out[f"prob_{rank + 1}"] = np.round(top_probs[:, rank] * 100, 2)
+    return out
+
+
+def score_file(input_path, output, model_path, top_k_count=3, chunk_size=100_000, workers=1,
+               engine="sklearn"):
+    """Score ``input_path`` into the open file ``output``; returns the number of rows scored."""
+    jobs = ((chunk, top_k_count) for chunk in read_profile_chunks(input_path, chunk_size))
+    rows = 0
+    if workers > 1:
+        with mp.Pool(workers, initializer=_init_worker, initargs=(model_path, engine, True)) as pool:
+            # imap keeps the output in input order while chunks are scored in parallel
+            for i, scored in enumerate(pool.imap(_score_chunk, jobs)):
+                scored.to_csv(output, header=(i == 0), index=False)
+                rows += len(scored)
+    else:
+        _init_worker(model_path, engine)
+        for i, job in enumerate(jobs):
+            scored = _score_chunk(job)
+            scored.to_csv(output, header=(i == 0), index=False)
+            rows += len(scored)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a CSV of student profiles with the career model.")
+    parser.add_argument("input", help="CSV shaped like user_profile.csv")
+    parser.add_argument("--out", default="-", help="Output CSV path ('-' for stdout)")
+    parser.add_argument("--model", default="career_suggestion.pkl", help="Pickled model artifact")
+    parser.add_argument("--top-k", type=int, default=3, help="Number of careers per profile")
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="Rows per predict_proba batch")
+    parser.add_argument("--workers", type=int, default=mp.cpu_count(), help="Worker processes")
+    parser.add_argument("--engine", choices=["sklearn", "flat"], default="sklearn",
+                        help="sklearn predict_proba (best for large chunks) or the FlatForest evaluator")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.out == "-":
+        rows = score_file(args.input, sys.stdout, args.model, args.top_k, args.chunk_size,
+                          args.workers, args.engine)
+    else:
+        with open(args.out, "w", newline="") as f:
+            rows = score_file(args.input, f, args.model, args.top_k, args.chunk_size,
+                              args.workers, args.engine)
+    elapsed = time.perf_counter() - start
+    print(f"Scored {rows} profiles in {elapsed:.2f}s ({rows / max(elapsed, 1e-9):,.0f} rows/s)",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
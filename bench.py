@@ -0,0 +1,251 @@
+"""Benchmark suite for the recommender's hot paths.
+
+Times model loading (cold and warm), single-row encoding as the button
+handler does it, ``predict_proba`` at several batch sizes, top-k selection
+with ``inverse_transform``, dataset generation and end-to-end training.
+Each metric is the median of ``--repeat`` runs. Results are written as JSON
+with environment metadata and compared with a stored baseline. A metric
+more than ``--threshold`` worse than its baseline is reported as a
+regression and the run exits non-zero.
+
+    python bench.py --model career_suggestion.pkl --save-baseline        # record a baseline
+    python bench.py --model career_suggestion.pkl --out bench.json       # compare against it
+    python bench.py --quick                                              # skip the 1M / training runs
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+
+import numpy as np
+
+DEFAULT_BASELINE = "bench_baseline.json"
+DEFAULT_THRESHOLD = 0.25
+# Differences below this are timer noise, whatever the ratio
+MIN_DELTA_MS = 0.01
+BATCH_SIZES = (1, 64, 4096, 1_000_000)
+QUICK_BATCH_SIZES = (1, 64, 4096)
+# FlatForest is the single-profile engine; larger batches go through sklearn
+FLAT_MAX_BATCH = 4096
+
+# The forest was fitted on a DataFrame; it is fed aligned float32 arrays
+warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+
+def _median_ms(fn, repeat, number=1):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number * 1e3)
+    return statistics.median(times)
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    import pandas as pd
+    import sklearn
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "commit": _git_commit(),
+    }
+
+
+class Suite:
+    def __init__(self, repeat=5):
+        self.repeat = repeat
+        self.results = {}
+
+    def record(self, name, value, unit, better="lower"):
+        self.results[name] = {"value": float(value), "unit": unit, "better": better}
+        print(f"  {name:34s} {value:16,.4f} {unit}", flush=True)
+
+    def time_ms(self, name, fn, number=1, repeat=None):
+        self.record(name, _median_ms(fn, repeat or self.repeat, number), "ms")
+
+
+def _handler_profile(feature_names):
+    from career_schema import INTEREST_COLUMN, INTEREST_PREFIX
+
+    profile = {name: 7 for name in feature_names if not name.startswith(INTEREST_PREFIX)}
+    profile["CGPA"] = 8.4
+    profile[INTEREST_COLUMN] = "Coding"
+    return profile
+
+
+def bench_loading(suite, model_path):
+    from model_loader import get_model, load_artifact
+
+    # Import sklearn and warm the page cache first so "cold" measures the load itself
+    load_artifact(model_path)
+    suite.time_ms("load_model_cold_ms", lambda: load_artifact(model_path))
+    get_model(model_path)
+    suite.time_ms("load_model_warm_ms", lambda: get_model(model_path), number=1000)
+
+
+def bench_inference(suite, model_path, batch_sizes):
+    import pickle
+
+    from compact_profiles import CompactProfiles
+    from dataset_generator import generate_chunks
+    from forest_engine import top_k
+    from model_loader import get_model
+
+    loaded = get_model(model_path)
+    profile = _handler_profile(loaded.feature_names)
+    # The button handler encodes a one-element batch via the recommender
+    suite.time_ms("encode_single_ms", lambda: loaded.encoder.encode_batch([profile]), number=2000)
+
+    largest = max(batch_sizes)
+    profiles = CompactProfiles.concat(CompactProfiles.from_frame(c) for c in generate_chunks(largest, seed=0))
+    X = profiles.feature_matrix(loaded.feature_names)
+
+    sklearn_model = None
+    if model_path.endswith(".pkl"):
+        with open(model_path, "rb") as f:
+            sklearn_model = pickle.load(f)["model"]
+    for n in batch_sizes:
+        batch = X[:n]
+        number = max(1, 256 // n)
+        # A 1M-row batch takes tens of seconds; a couple of runs is enough
+        repeat = min(suite.repeat, 2) if n > 100_000 else None
+        if n <= FLAT_MAX_BATCH:
+            suite.time_ms(f"predict_proba_flat_b{n}_ms", lambda: loaded.model.predict_proba(batch),
+                          number=number, repeat=repeat)
+        if sklearn_model is not None and n >= 64:
+            suite.time_ms(f"predict_proba_sklearn_b{n}_ms", lambda: sklearn_model.predict_proba(batch),
+                          number=number, repeat=repeat)
+
+    probs = loaded.model.predict_proba(X[:4096])
+    label_encoder = loaded.label_encoder
+
+    def select(p):
+        idx, _ = top_k(p, 3)
+        return label_encoder.inverse_transform(idx.ravel())
+
+    suite.time_ms("top3_inverse_transform_b1_ms", lambda: select(probs[:1]), number=2000)
+    suite.time_ms("top3_inverse_transform_b4096_ms", lambda: select(probs), number=20)
+
+
+def bench_generation(suite, rows):
+    from dataset_generator import generate_btech_career_data
+
+    ms = _median_ms(lambda: generate_btech_career_data(rows, seed=0), suite.repeat)
+    suite.record("generate_rows_per_s", rows / (ms / 1e3), "rows/s", better="higher")
+
+
+def bench_training(suite, data_path, n_jobs):
+    from train_model import train
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out = os.path.join(tmpdir, "model.pkl")
+        start = time.perf_counter()
+        manifest = train(data_path, out, params={"n_jobs": n_jobs})
+        total_s = time.perf_counter() - start
+    suite.record("train_end_to_end_s", total_s, "s")
+    suite.record("train_fit_s", manifest["timings_s"]["fit"], "s")
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Metrics more than ``threshold`` worse than the baseline: [(name, baseline, current, ratio)]."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None or base["value"] <= 0 or current["value"] <= 0:
+            continue
+        if current["better"] == "higher":
+            ratio = base["value"] / current["value"]
+        else:
+            ratio = current["value"] / base["value"]
+        if current["unit"] == "ms" and abs(current["value"] - base["value"]) < MIN_DELTA_MS:
+            continue
+        if ratio > 1 + threshold:
+            regressions.append((name, base["value"], current["value"], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the recommender's hot paths.")
+    parser.add_argument("--model", default="career_suggestion.pkl", help="Model artifact (.pkl or .cfa)")
+    parser.add_argument("--data", default="BTech_Career_Path_Dataset.csv", help="CSV for the training run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per metric (the median is kept)")
+    parser.add_argument("--generate-rows", type=int, default=200_000, help="Rows per generation run")
+    parser.add_argument("--train-jobs", type=int, default=-1, help="n_jobs for the training run")
+    parser.add_argument("--quick", action="store_true", help="Skip the 1M-row batch and training")
+    parser.add_argument("--out", help="Write results JSON here")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown before a metric counts as a regression (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    suite = Suite(args.repeat)
+    print("loading")
+    bench_loading(suite, args.model)
+    print("inference")
+    bench_inference(suite, args.model, QUICK_BATCH_SIZES if args.quick else BATCH_SIZES)
+    print("generation")
+    bench_generation(suite, args.generate_rows)
+    if not args.quick:
+        print("training")
+        bench_training(suite, args.data, args.train_jobs)
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "config": {"model": args.model, "repeat": args.repeat, "quick": args.quick},
+        "results": suite.results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("environment", {}).get("platform") != report["environment"]["platform"]:
+        print("warning: baseline was recorded on a different platform", file=sys.stderr)
+    regressions = compare(suite.results, baseline["results"], args.threshold)
+    if regressions:
+        print(f"\nREGRESSION: {len(regressions)} metric(s) more than {args.threshold:.0%} worse than "
+              f"{args.baseline}", file=sys.stderr)
+        for name, base, current, ratio in regressions:
+            print(f"  {name}: {base:,.3f} -> {current:,.3f} ({ratio:.2f}x worse)", file=sys.stderr)
+        raise SystemExit(1)
+    print(f"No regressions against {args.baseline} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
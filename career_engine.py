@@ -0,0 +1,218 @@
+"""Importable inference API for the career model, independent of Streamlit.
+
+    from career_engine import recommend, recommend_batch
+
+    recommend(profile, k=3)          # [(career, probability), ...] best first
+    recommend_batch(profiles, k=3)   # one such list per profile
+
+Importing this module only pulls in the standard library; NumPy, the model
+loader and the forest evaluator are imported the first time a prediction is
+made. ``python career_engine.py --check-import`` enforces the import budget.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+
+from latency_metrics import stage
+from prediction_cache import DEFAULT_MAXSIZE, PredictionCache, profile_key
+
+# Budget for a bare ``import career_engine`` in a fresh interpreter
+IMPORT_BUDGET_MS = 50.0
+HEAVY_MODULES = ("numpy", "pandas", "sklearn", "streamlit")
+
+
+ENGINES = ("forest", "rules")
+
+
+class Recommender:
+    def __init__(self, model_path=None, cache_size=None, engine=None):
+        self._model_path = model_path
+        if cache_size is None:
+            cache_size = int(os.environ.get("CAREER_CACHE_SIZE", DEFAULT_MAXSIZE))
+        self.cache = PredictionCache(maxsize=cache_size)
+        # "forest" scores with the model; "rules" with the dataset's labelling rules
+        self.engine = engine or os.environ.get("CAREER_ENGINE", "forest")
+        if self.engine not in ENGINES:
+            raise ValueError(f"unknown engine {self.engine!r}; expected one of {ENGINES}")
+        self._rules = None
+        # Optional InferencePool; misses are scored in-process when it is unset or busy
+        self.pool = None
+
+    @property
+    def model_path(self):
+        if self._model_path is None:
+            from model_loader import default_model_path
+
+            self._model_path = default_model_path()
+        return self._model_path
+
+    @property
+    def model_version(self):
+        """Identifier of the loaded artifact and engine, stored next to saved predictions."""
+        return f"{self.loaded.version}:{self.engine}"
+
+    @property
+    def loaded(self):
+        """The shared LoadedModel for ``model_path`` (loaded on first access)."""
+        from model_loader import get_model
+
+        return get_model(self.model_path)
+
+    def preload(self):
+        from model_loader import preload
+
+        return preload(self.model_path)
+
+    def predict_proba(self, profiles, loaded=None):
+        """Class probabilities for a list of profile dicts, served from the cache where possible.
+
+        ``loaded`` pins the LoadedModel (default: the current one), so callers
+        that also read its ``classes`` stay on one model across a hot reload.
+        """
+        import numpy as np
+
+        if loaded is None:
+            loaded = self.loaded
+        self.cache.check_model(loaded)
+        probs = np.empty((len(profiles), len(loaded.classes)), dtype=np.float64)
+        missing = []
+        with stage("cache_lookup"):
+            for i, profile in enumerate(profiles):
+                cached = self.cache.get(profile_key(profile), loaded.generation)
+                if cached is None:
+                    missing.append(i)
+                else:
+                    probs[i] = cached
+        if missing:
+            # All cache misses are scored together in one model call
+            with stage("encode"):
+                X = loaded.encoder.encode_batch([profiles[i] for i in missing])
+            with stage("predict_proba"):
+                scored = self._score(loaded, X)
+            probs[missing] = scored
+            for i, row in zip(missing, scored):
+                # Copy so a cached row does not pin the whole batch in memory
+                row = row.copy()
+                row.setflags(write=False)
+                self.cache.put(profile_key(profiles[i]), row, loaded.generation)
+        return probs
+
+    def score_matrix(self, X, loaded=None):
+        """Class probabilities for already-encoded rows, scored by this recommender's engine.
+
+        Uses the inference pool when one is running. Nothing is cached; callers
+        that search many profiles keep their own memo.
+        """
+        return self._score(self.loaded if loaded is None else loaded, X)
+
+    def _score(self, loaded, X):
+        if self.engine == "rules":
+            if self._rules is None or self._rules.feature_names != loaded.feature_names:
+                from rule_engine import RuleClassifier
+
+                self._rules = RuleClassifier.from_loaded(loaded)
+            return self._rules.predict_proba(X)
+        pool = self.pool
+        # A pool started for another model generation is skipped while it is being replaced
+        if pool is not None and pool.generation in (None, loaded.generation):
+            try:
+                return pool.predict_proba(X)
+            except (RuntimeError, EOFError, OSError):
+                # Queue full (PoolBusy), a worker died or failed: score in-process instead
+                pass
+        return loaded.model.predict_proba(X)
+
+    def model_swapped(self, old, new):
+        """Hot-reload callback: restart the inference pool on the new artifact.
+
+        Misses are scored in-process until the new workers are ready. The old
+        workers finish their queued requests before they are shut down.
+        """
+        old_pool = self.pool
+        if old_pool is None:
+            return
+        from inference_pool import InferencePool
+
+        self.pool = None
+        pool = InferencePool(self.model_path, old_pool.n_workers, old_pool.queue_depth).start()
+        pool.generation = new.generation
+        self.pool = pool
+        old_pool.close(drain_timeout=30)
+
+    def recommend_batch(self, profiles, k=3):
+        from forest_engine import top_k
+
+        loaded = self.loaded
+        probs = self.predict_proba(profiles, loaded)
+        with stage("top_k_labels"):
+            idx, top_probs = top_k(probs, k)
+            classes = loaded.classes
+            # The rules name exactly one career; the others score 0 and are not suggestions
+            keep_zero = self.engine != "rules"
+            return [
+                [(str(classes[j]), float(p)) for j, p in zip(row_idx, row_probs) if keep_zero or p > 0]
+                for row_idx, row_probs in zip(idx, top_probs)
+            ]
+
+    def recommend(self, profile, k=3):
+        return self.recommend_batch([profile], k)[0]
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_recommender():
+    """The process-wide Recommender shared by every caller (and every Streamlit session)."""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = Recommender()
+    return _default
+
+
+def recommend(profile, k=3):
+    """Top-``k`` ``(career, probability)`` pairs for one profile dict, best first."""
+    return get_recommender().recommend(profile, k)
+
+
+def recommend_batch(profiles, k=3):
+    """Top-``k`` ``(career, probability)`` pairs for each profile dict in ``profiles``."""
+    return get_recommender().recommend_batch(profiles, k)
+
+
+def measure_import_ms():
+    """Import this module in a fresh interpreter; returns (milliseconds, heavy modules loaded)."""
+    code = (
+        "import sys, time; t = time.perf_counter(); import career_engine; "
+        "ms = (time.perf_counter() - t) * 1e3; "
+        f"print(ms); print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    here = os.path.dirname(os.path.abspath(__file__))
+    out = subprocess.run([sys.executable, "-c", code], cwd=here, capture_output=True, text=True, check=True)
+    lines = out.stdout.splitlines() + [""]
+    return float(lines[0]), [m for m in lines[1].split(",") if m]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Career recommendation engine.")
+    parser.add_argument("--check-import", action="store_true",
+                        help=f"Fail if importing the engine takes over {IMPORT_BUDGET_MS:.0f} ms "
+                             "or loads heavy dependencies")
+    args = parser.parse_args()
+
+    if args.check_import:
+        ms, heavy = measure_import_ms()
+        print(f"import career_engine: {ms:.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)")
+        if heavy:
+            print(f"heavy modules imported eagerly: {', '.join(heavy)}")
+        raise SystemExit(1 if ms > IMPORT_BUDGET_MS or heavy else 0)
+    parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
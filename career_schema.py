@@ -0,0 +1,45 @@
+"""Column schema shared by the generator, encoders and the inference engine.
+
+Deliberately free of third-party imports so lightweight callers can use it.
+"""
+
+# Career options for BTech students
+CAREERS = [
+    "Software Engineer", "Web Developer", "Mobile App Developer", "Data Analyst",
+    "Data Scientist", "AI/ML Engineer", "Cybersecurity Specialist", "Cloud Engineer",
+    "Database Administrator", "Game Developer", "Blockchain Developer", "IoT Engineer",
+    "Embedded Systems Engineer", "Robotics Engineer", "Network Engineer",
+    "UI/UX Designer", "Project Manager"
+]
+
+INTERESTS = ["Coding", "Analytics", "Research", "Networking", "Design", "Management", "Systems"]
+
+# Short names used by the rules, in dataset column order
+SKILL_COLUMNS = {
+    "prog_skill": "Programming Skill (1-10)",
+    "math_skill": "Math Skill (1-10)",
+    "problem_solving": "Problem Solving (1-10)",
+    "comm_skill": "Communication Skill (1-10)",
+    "cybersecurity": "Cybersecurity Knowledge (1-10)",
+    "database": "Database Knowledge (1-10)",
+    "ai_ml": "AI/ML Knowledge (1-10)",
+    "networking": "Networking Skill (1-10)",
+    "creativity": "Creativity (1-10)",
+    "leadership": "Leadership (1-10)",
+    "mobile_dev": "Mobile Dev Skill (1-10)",
+    "cloud_computing": "Cloud Computing Skill (1-10)",
+    "blockchain": "Blockchain Knowledge (1-10)",
+    "robotics": "Robotics Skill (1-10)",
+    "system_design": "System Design (1-10)",
+    "design": "Design Skill (1-10)",
+}
+
+NUMERIC_COLUMNS = ["CGPA"] + list(SKILL_COLUMNS.values())
+# Valid (low, high) of each numeric input: CGPA on a 10-point scale, skills rated 1-10
+VALUE_RANGES = {name: (1, 10) for name in NUMERIC_COLUMNS}
+VALUE_RANGES["CGPA"] = (0.0, 10.0)
+INTEREST_COLUMN = "Preferred Interest"
+INTEREST_PREFIX = INTEREST_COLUMN + "_"
+TARGET_COLUMN = "Suggested Career"
+ID_COLUMN = "Profile_ID"
+COLUMNS = NUMERIC_COLUMNS + [INTEREST_COLUMN, TARGET_COLUMN]
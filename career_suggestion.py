@@ -1,8 +1,18 @@
 import streamlit as st
-import pickle
-import pandas as pd
 
 import os
+import time
+
+from career_engine import get_recommender
+from latency_metrics import recorder as latency, stage
+
+# Full-page runs are timed as the "rerun" stage (recorded at the end of the script);
+# fragment reruns are timed as the "sidebar" and "prediction_panel" stages
+rerun_start = time.perf_counter()
+
+# Start loading the shared model while the page is being laid out
+recommender = get_recommender()
+recommender.preload()
 
 # Set page configuration
 st.set_page_config(
@@ -12,8 +22,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for beautiful styling
-st.markdown("""
+# All page styling in one stylesheet. Widget changes only rerun the fragments below, so
+# this is sent once per session (on the first full run) instead of on every slider move.
+PAGE_CSS = """
 <style>
     /* Main background gradient */
     .stApp {
@@ -126,7 +137,7 @@ st.markdown("""
     }
     
     /* Button styling */
-    .stButton > button {
+    .stButton > button, .stFormSubmitButton > button {
         background: linear-gradient(135deg, #667eea, #764ba2);
         color: white;
         border: none;
@@ -137,93 +148,156 @@ st.markdown("""
         transition: all 0.3s ease;
     }
     
-    .stButton > button:hover {
+    .stButton > button:hover, .stFormSubmitButton > button:hover {
         box-shadow: 0 10px 25px rgba(102, 126, 234, 0.4);
         transform: translateY(-2px);
     }
+
+    /* Header badge shine */
+    @keyframes shine {
+        0% { background-position: 200% 0; }
+        100% { background-position: -200% 0; }
+    }
+
+    /* Full page animated background */
+    .stApp {
+        height: 100%;
+        background: linear-gradient(-45deg, #667eea, #764ba2, #ff5f6d, #ffc371);
+        background-size: 400% 400%;
+        animation: gradientBG 15s ease infinite;
+    }
+
+    /* Gradient animation keyframes */
+    @keyframes gradientBG {
+        0% { background-position: 0% 50%; }
+        50% { background-position: 100% 50%; }
+        100% { background-position: 0% 50%; }
+    }
+
+    /* Floating animations (optional) */
+    @keyframes float {
+        0%, 100% { transform: translateY(0px) rotate(0deg); }
+        50% { transform: translateY(-20px) rotate(180deg); }
+    }
+
+    .stApp::before {
+        content: '';
+        position: fixed;
+        top: 20%;
+        right: 20%;
+        width: 80px;
+        height: 80px;
+        background: rgba(255, 255, 255, 0.1);
+        border-radius: 50%;
+        animation: float 6s ease-in-out infinite;
+        pointer-events: none;
+        z-index: -1;
+    }
+
+    .stApp::after {
+        content: '';
+        position: fixed;
+        bottom: 20%;
+        right: 30%;
+        width: 60px;
+        height: 60px;
+        background: rgba(255, 255, 255, 0.1);
+        border-radius: 50%;
+        animation: float 6s ease-in-out infinite 4s;
+        pointer-events: none;
+        z-index: -1;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
 # Initialize session state
 if 'prediction_made' not in st.session_state:
     st.session_state.prediction_made = False
 if 'predicted_careers' not in st.session_state:
     st.session_state.predicted_careers = []
+if 'clear_clicked' not in st.session_state:
+    st.session_state.clear_clicked = False
 
-# Load Model + Encoders
-@st.cache_data
-def load_model():
-    try:
-        if os.path.exists("career_suggestion.pkl"):
-            with open("career_suggestion.pkl", "rb") as f:
-                saved_objects = pickle.load(f)
-            return saved_objects["model"], saved_objects["label_encoder"], saved_objects["features"]
-        else:
-            st.error("Model file 'career_suggestion.pkl' not found. Please ensure the file is in the correct directory.")
-            return None, None, None
-    except Exception as e:
-        st.error(f"Error loading model: {str(e)}")
-        return None, None, None
-
-model, label_encoder, feature_names = load_model()
-
-# Sidebar Information Hub
-with st.sidebar:
-    st.markdown("# 📚 Information Hub")
-    
-    info_tab = st.radio("", ["🤖 How It Works", "✨ Features", "📋 Usage Guide"])
-    
-    if info_tab == "🤖 How It Works":
-        st.markdown("""
-        <div class="sidebar-content">
-        <h4>AI Career Suggestion Process</h4>
-        <p>Our advanced machine learning model analyzes your profile:</p>
-        <ol>
-        <li><strong>Data Collection:</strong> Gather technical skills, soft skills, and interests</li>
-        <li><strong>Feature Processing:</strong> Apply feature engineering and encoding</li>
-        <li><strong>ML Prediction:</strong> Calculate probability scores using trained algorithms</li>
-        <li><strong>Results Ranking:</strong> Present top 3 careers with match percentages</li>
-        </ol>
-        </div>
-        """, unsafe_allow_html=True)
+# The model finishes loading in the background (see preload above) while the page is drawn;
+# only a prediction, or the model services at the end of this script, waits for it
+model_ready = os.path.exists(recommender.model_path)
+if not model_ready:
+    st.error("Model file 'career_suggestion.pkl' not found. Please ensure the file is in the correct directory.")
+
+# Sidebar Information Hub. A fragment: switching tabs or pressing a sidebar button
+# reruns only this function, not the page.
+@st.fragment
+def information_hub():
+    with stage("sidebar"):
+        st.markdown("# 📚 Information Hub")
+    
+        info_tab = st.radio("", ["🤖 How It Works", "✨ Features", "📋 Usage Guide"])
+    
+        if info_tab == "🤖 How It Works":
+            st.markdown("""
+            <div class="sidebar-content">
+            <h4>AI Career Suggestion Process</h4>
+            <p>Our advanced machine learning model analyzes your profile:</p>
+            <ol>
+            <li><strong>Data Collection:</strong> Gather technical skills, soft skills, and interests</li>
+            <li><strong>Feature Processing:</strong> Apply feature engineering and encoding</li>
+            <li><strong>ML Prediction:</strong> Calculate probability scores using trained algorithms</li>
+            <li><strong>Results Ranking:</strong> Present top 3 careers with match percentages</li>
+            </ol>
+            </div>
+            """, unsafe_allow_html=True)
     
-    elif info_tab == "✨ Features":
-        st.markdown("""
-        <div class="sidebar-content">
-        <h4>System Capabilities</h4>
-        </div>
-        """, unsafe_allow_html=True)
+        elif info_tab == "✨ Features":
+            st.markdown("""
+            <div class="sidebar-content">
+            <h4>System Capabilities</h4>
+            </div>
+            """, unsafe_allow_html=True)
         
-        features_data = [
-            ("🎯", "AI-Powered Analysis", "Advanced ML algorithms trained on career patterns"),
-            ("📊", "Comprehensive Assessment", "Evaluates 17+ skills and attributes"),
-            ("🚀", "Real-time Results", "Instant suggestions with confidence percentages"),
-            ("🎨", "Intuitive Interface", "Beautiful design for enjoyable assessment")
-        ]
+            features_data = [
+                ("🎯", "AI-Powered Analysis", "Advanced ML algorithms trained on career patterns"),
+                ("📊", "Comprehensive Assessment", "Evaluates 17+ skills and attributes"),
+                ("🚀", "Real-time Results", "Instant suggestions with confidence percentages"),
+                ("🎨", "Intuitive Interface", "Beautiful design for enjoyable assessment")
+            ]
         
-        for icon, title, desc in features_data:
-            st.markdown(f"""
-            <div class="feature-item">
-            <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">{icon}</div>
-            <h4 style="margin-bottom: 0.5rem; color: #2d3748;">{title}</h4>
-            <p style="font-size: 0.9rem; color: #4a5568; margin: 0;">{desc}</p>
+            for icon, title, desc in features_data:
+                st.markdown(f"""
+                <div class="feature-item">
+                <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">{icon}</div>
+                <h4 style="margin-bottom: 0.5rem; color: #2d3748;">{title}</h4>
+                <p style="font-size: 0.9rem; color: #4a5568; margin: 0;">{desc}</p>
+                </div>
+                """, unsafe_allow_html=True)
+    
+        elif info_tab == "📋 Usage Guide":
+            st.markdown("""
+            <div class="sidebar-content">
+            <h4>Step-by-Step Guide</h4>
+            <ol>
+            <li><strong>Rate Your Skills:</strong> Use sliders honestly (1-10 scale)</li>
+            <li><strong>Set CGPA:</strong> Adjust academic performance (6.0-10.0)</li>
+            <li><strong>Choose Interest:</strong> Select primary area from dropdown</li>
+            <li><strong>Get Suggestions:</strong> Click the suggestion button</li>
+            <li><strong>Review Results:</strong> Analyze top 3 career matches</li>
+            </ol>
+            <p><strong>💡 Tip:</strong> Be realistic about current skills for best results.</p>
             </div>
             """, unsafe_allow_html=True)
-    
-    elif info_tab == "📋 Usage Guide":
-        st.markdown("""
-        <div class="sidebar-content">
-        <h4>Step-by-Step Guide</h4>
-        <ol>
-        <li><strong>Rate Your Skills:</strong> Use sliders honestly (1-10 scale)</li>
-        <li><strong>Set CGPA:</strong> Adjust academic performance (6.0-10.0)</li>
-        <li><strong>Choose Interest:</strong> Select primary area from dropdown</li>
-        <li><strong>Get Suggestions:</strong> Click the suggestion button</li>
-        <li><strong>Review Results:</strong> Analyze top 3 career matches</li>
-        </ol>
-        <p><strong>💡 Tip:</strong> Be realistic about current skills for best results.</p>
-        </div>
-        """, unsafe_allow_html=True)
+
+        # Admin panel, only when CAREER_METRICS is set
+        if latency.enabled:
+            with st.expander("⏱️ Stage latency"):
+                for stage_name, row in sorted(latency.summary().items()):
+                    st.write(f"**{stage_name}** ({row['count']}): p50 {row['p50_ms']:.2f} ms · "
+                             f"p90 {row['p90_ms']:.2f} ms · p99 {row['p99_ms']:.2f} ms")
+                if st.button("Log metrics", key="log_metrics"):
+                    latency.log_summary()
+                st.code(latency.prometheus_text(), language="text")
+
+with st.sidebar:
+    information_hub()
 
 # Main Content Area
 st.markdown("""
@@ -242,172 +316,213 @@ st.markdown("""
   Only For Computer Science Student
 </h5>
 
-<style>
-@keyframes shine {
-  0% { background-position: 200% 0; }
-  100% { background-position: -200% 0; }
-}
-</style>
 <p>Discover your perfect career path with AI-powered recommendations</p>
 </div>
 """, unsafe_allow_html=True)
 
 # Check if model is loaded
-if model is None:
+if not model_ready:
     st.error("Unable to load the machine learning model. Please check if 'career_suggestion.pkl' exists.")
     st.stop()
 
-# Create two columns for the form
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
-    st.markdown("## 📊 Your Skills & Preferences")
-    
-    cgpa = st.slider("CGPA", 6.0, 10.0, 8.0, 0.1, help="Your current CGPA on a 10.0 scale")
-    prog_skill = st.slider("Programming Skill (1-10)", 1, 10, 5, help="Rate your programming abilities")
-    math_skill = st.slider("Math Skill (1-10)", 1, 10, 5, help="Rate your mathematical abilities")
-    problem_solving = st.slider("Problem Solving (1-10)", 1, 10, 5, help="Rate your problem-solving skills")
-    comm_skill = st.slider("Communication Skill (1-10)", 1, 10, 5, help="Rate your communication abilities")
-    leadership = st.slider("Leadership (1-10)", 1, 10, 5, help="Rate your leadership skills")
-    cybersecurity = st.slider("Cybersecurity Knowledge (1-10)", 1, 10, 5, help="Rate your cybersecurity knowledge")
-    database = st.slider("Database Knowledge (1-10)", 1, 10, 5, help="Rate your database management skills")
-    ai_ml = st.slider("AI/ML Knowledge (1-10)", 1, 10, 5, help="Rate your AI/Machine Learning knowledge")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-
-with col2:
-    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
-    st.markdown("## 🔧 Additional Skills")
-    
-    networking = st.slider("Networking Skill (1-10)", 1, 10, 5, help="Rate your networking abilities")
-    creativity = st.slider("Creativity (1-10)", 1, 10, 5, help="Rate your creative thinking")
-    mobile_dev = st.slider("Mobile Development Skill (1-10)", 1, 10, 5, help="Rate your mobile development skills")
-    cloud_computing = st.slider("Cloud Computing Skill (1-10)", 1, 10, 5, help="Rate your cloud computing knowledge")
-    blockchain = st.slider("Blockchain Knowledge (1-10)", 1, 10, 5, help="Rate your blockchain knowledge")
-    robotics = st.slider("Robotics Skill (1-10)", 1, 10, 5, help="Rate your robotics knowledge")
-    system_design = st.slider("System Design (1-10)", 1, 10, 5, help="Rate your system design skills")
-    design = st.slider("Design Skill (1-10)", 1, 10, 5, help="Rate your design abilities")
-    
-    interest = st.selectbox(
-        "Preferred Interest",
-        ["Coding", "Analytics", "Research", "Networking", "Design", "Management", "Systems"],
-        help="Select your primary area of interest"
-    )
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-
-# Predict button
-st.markdown('<div style="text-align: center; margin: 2rem 0;">', unsafe_allow_html=True)
-if st.button("🔍 Get My Career Suggestions", key="predict_btn"):
-    # Prepare input data
-    input_dict = {
-        "CGPA": cgpa,
-        "Programming Skill (1-10)": prog_skill,
-        "Math Skill (1-10)": math_skill,
-        "Problem Solving (1-10)": problem_solving,
-        "Communication Skill (1-10)": comm_skill,
-        "Cybersecurity Knowledge (1-10)": cybersecurity,
-        "Database Knowledge (1-10)": database,
-        "AI/ML Knowledge (1-10)": ai_ml,
-        "Networking Skill (1-10)": networking,
-        "Creativity (1-10)": creativity,
-        "Leadership (1-10)": leadership,
-        "Mobile Dev Skill (1-10)": mobile_dev,
-        "Cloud Computing Skill (1-10)": cloud_computing,
-        "Blockchain Knowledge (1-10)": blockchain,
-        "Robotics Skill (1-10)": robotics,
-        "System Design (1-10)": system_design,
-        "Design Skill (1-10)": design,
-        "Preferred Interest": interest
-    }
-    
-    try:
-        # Convert to DataFrame
-        input_df = pd.DataFrame([input_dict])
-        
-        # One-hot encode the "Preferred Interest" column
-        input_df = pd.get_dummies(input_df, columns=["Preferred Interest"])
+# Inputs and results. A fragment: submitting the form reruns only this function, so the
+# page header, stylesheet and sidebar are not rebuilt for each prediction.
+@st.fragment
+def prediction_panel():
+    with stage("prediction_panel"):
+        # Sliders live in a form: moving them changes nothing on the server until the form is submitted
+        with st.form("profile_form", border=False):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+                st.markdown("## 📊 Your Skills & Preferences")
+    
+                cgpa = st.slider("CGPA", 6.0, 10.0, 8.0, 0.1, help="Your current CGPA on a 10.0 scale")
+                prog_skill = st.slider("Programming Skill (1-10)", 1, 10, 5, help="Rate your programming abilities")
+                math_skill = st.slider("Math Skill (1-10)", 1, 10, 5, help="Rate your mathematical abilities")
+                problem_solving = st.slider("Problem Solving (1-10)", 1, 10, 5, help="Rate your problem-solving skills")
+                comm_skill = st.slider("Communication Skill (1-10)", 1, 10, 5, help="Rate your communication abilities")
+                leadership = st.slider("Leadership (1-10)", 1, 10, 5, help="Rate your leadership skills")
+                cybersecurity = st.slider("Cybersecurity Knowledge (1-10)", 1, 10, 5, help="Rate your cybersecurity knowledge")
+                database = st.slider("Database Knowledge (1-10)", 1, 10, 5, help="Rate your database management skills")
+                ai_ml = st.slider("AI/ML Knowledge (1-10)", 1, 10, 5, help="Rate your AI/Machine Learning knowledge")
+    
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+                st.markdown("## 🔧 Additional Skills")
+    
+                networking = st.slider("Networking Skill (1-10)", 1, 10, 5, help="Rate your networking abilities")
+                creativity = st.slider("Creativity (1-10)", 1, 10, 5, help="Rate your creative thinking")
+                mobile_dev = st.slider("Mobile Development Skill (1-10)", 1, 10, 5, help="Rate your mobile development skills")
+                cloud_computing = st.slider("Cloud Computing Skill (1-10)", 1, 10, 5, help="Rate your cloud computing knowledge")
+                blockchain = st.slider("Blockchain Knowledge (1-10)", 1, 10, 5, help="Rate your blockchain knowledge")
+                robotics = st.slider("Robotics Skill (1-10)", 1, 10, 5, help="Rate your robotics knowledge")
+                system_design = st.slider("System Design (1-10)", 1, 10, 5, help="Rate your system design skills")
+                design = st.slider("Design Skill (1-10)", 1, 10, 5, help="Rate your design abilities")
+    
+                interest = st.selectbox(
+                    "Preferred Interest",
+                    ["Coding", "Analytics", "Research", "Networking", "Design", "Management", "Systems"],
+                    help="Select your primary area of interest"
+                )
+    
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            # Predict button
+            st.markdown('<div style="text-align: center; margin: 2rem 0;">', unsafe_allow_html=True)
+            submitted = st.form_submit_button("🔍 Get My Career Suggestions", key="predict_btn")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        if submitted:
+            # Prepare input data
+            input_dict = {
+                "CGPA": cgpa,
+                "Programming Skill (1-10)": prog_skill,
+                "Math Skill (1-10)": math_skill,
+                "Problem Solving (1-10)": problem_solving,
+                "Communication Skill (1-10)": comm_skill,
+                "Cybersecurity Knowledge (1-10)": cybersecurity,
+                "Database Knowledge (1-10)": database,
+                "AI/ML Knowledge (1-10)": ai_ml,
+                "Networking Skill (1-10)": networking,
+                "Creativity (1-10)": creativity,
+                "Leadership (1-10)": leadership,
+                "Mobile Dev Skill (1-10)": mobile_dev,
+                "Cloud Computing Skill (1-10)": cloud_computing,
+                "Blockchain Knowledge (1-10)": blockchain,
+                "Robotics Skill (1-10)": robotics,
+                "System Design (1-10)": system_design,
+                "Design Skill (1-10)": design,
+                "Preferred Interest": interest
+            }
+    
+            try:
+                # Make prediction (cached per profile, shared by every session)
+                top_careers = recommender.recommend(input_dict, k=3)
         
-        # Ensure all expected columns exist (missing ones → 0)
-        for col in feature_names:
-            if col not in input_df.columns:
-                input_df[col] = 0
+                # Store results in session state
+                st.session_state.predicted_careers = [
+                        (career, probability * 100) for career, probability in top_careers
+                    ]
         
-        # Reorder columns to match model's training
-        input_df = input_df[feature_names]
-        
-        # Make prediction
-        probs = model.predict_proba(input_df)[0]
-        top_indices = probs.argsort()[-3:][::-1]
-        
-        # Store results in session state
-        st.session_state.predicted_careers = [
-                (label_encoder.inverse_transform([i])[0], probs[i] * 100)
-                for i in top_indices
-            ]
-        
-        st.session_state.prediction_made = True
-        st.session_state.input_dict = input_dict
+                st.session_state.prediction_made = True
+                st.session_state.input_dict = input_dict
+                # Kept after the results are cleared, for the target career search
+                st.session_state.last_profile = input_dict
 
         
-    except Exception as e:
-        st.error(f"Error making prediction: {str(e)}")
-
-st.markdown('</div>', unsafe_allow_html=True)
-
-
-
-# Initialize session state
-if 'prediction_made' not in st.session_state:
-    st.session_state.prediction_made = False
-if 'predicted_careers' not in st.session_state:
-    st.session_state.predicted_careers = []
-if 'clear_clicked' not in st.session_state:
-    st.session_state.clear_clicked = False
-
-    
-
-# Display results
-if st.session_state.prediction_made and st.session_state.predicted_careers:
-    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
-    st.markdown("""
-    <div class="success-banner">
-    <h2>🎯 Your Career Recommendations</h2>
-    <p>Based on your skills and preferences, here are your top career matches:</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    for i, (career, match_percentage) in enumerate(st.session_state.predicted_careers):
-        st.markdown(f"""
-        <div class="result-card">
-        <div class="career-name">{i+1}. {career}</div>
-        <div class="career-match">{match_percentage:.1f}% match</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Additional insights
-    st.markdown("---")
-    st.markdown("### 📈 What this means:")
-    best_career = st.session_state.predicted_careers[0][0]
-    st.write(f"Your top recommendation is **{best_career}** with a {st.session_state.predicted_careers[0][1]:.1f}% compatibility match.")
-    st.write("Consider exploring these career paths further by researching job requirements, salary expectations, and growth opportunities in your area.")
-    
-    # Save prediction to session state for potential future use
-    st.session_state["predicted_career"] = best_career
-
-    
-    st.session_state.clear_clicked = True
-    
-    # If clear was clicked, reset relevant states immediately
-    if st.session_state.clear_clicked:
-        st.session_state.prediction_made = False
-        st.session_state.predicted_careers = []
-        if 'input_dict' in st.session_state:
-            del st.session_state['input_dict']
-        st.session_state.clear_clicked = False
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+            except Exception as e:
+                st.error(f"Error making prediction: {str(e)}")
+
+        # Display results. "render" times only the page elements; the panels that call
+        # the model or the neighbour index are timed as stages of their own.
+        if st.session_state.prediction_made and st.session_state.predicted_careers:
+            with stage("render"):
+                st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+                st.markdown("""
+                <div class="success-banner">
+                <h2>🎯 Your Career Recommendations</h2>
+                <p>Based on your skills and preferences, here are your top career matches:</p>
+                </div>
+                """, unsafe_allow_html=True)
+    
+                for i, (career, match_percentage) in enumerate(st.session_state.predicted_careers):
+                    st.markdown(f"""
+                    <div class="result-card">
+                    <div class="career-name">{i+1}. {career}</div>
+                    <div class="career-match">{match_percentage:.1f}% match</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                # Additional insights
+                st.markdown("---")
+                st.markdown("### 📈 What this means:")
+                best_career = st.session_state.predicted_careers[0][0]
+                st.write(f"Your top recommendation is **{best_career}** with a {st.session_state.predicted_careers[0][1]:.1f}% compatibility match.")
+                st.write("Consider exploring these career paths further by researching job requirements, salary expectations, and growth opportunities in your area.")
+
+            # Which inputs drove each match, read off the trees' split statistics. The rules
+            # engine has no trees to attribute, so its predictions are not explained.
+            if 'input_dict' in st.session_state and recommender.engine == "forest":
+                with stage("explain_panel"):
+                    from explain import get_explainer
+                    with st.expander("🔍 Why these careers?"):
+                        for entry in get_explainer().explain(st.session_state.input_dict, top=3):
+                            drivers = " · ".join(f"{name.split(' (')[0]} {value * 100:+.1f} pts"
+                                                 for name, value in entry["drivers"])
+                            st.write(f"**{entry['career']}** ({entry['base']:.1%} base rate → "
+                                     f"{entry['probability']:.1%}): {drivers}")
+
+            # Similar students from the dataset, if an index was built next to the model
+            with stage("neighbors_panel"):
+                from neighbor_index import get_index
+                neighbor_index = get_index(recommender.model_path) if 'input_dict' in st.session_state else None
+                if neighbor_index is not None:
+                    st.markdown("### 🧑‍🎓 Students like you")
+                    for neighbor in neighbor_index.query(st.session_state.input_dict, k=5):
+                        skills = ", ".join(s.split(" (")[0] for s in neighbor["top_skills"])
+                        st.write(f"**{neighbor['career']}** · CGPA {neighbor['CGPA']:.1f} · "
+                                 f"{neighbor['Preferred Interest']} · strongest in {skills}")
+
+            # Every one-step change of the profile, scored in one batch
+            if 'input_dict' in st.session_state:
+                with stage("what_if_panel"):
+                    from what_if import sensitivity
+                    report = sensitivity(recommender, st.session_state.input_dict)
+                    with st.expander("🔀 What if I change one thing?"):
+                        for change in report["changes"][:8]:
+                            if change["top_career"] != report["career"]:
+                                st.write(f"**{change['label']}** → **{change['top_career']}** becomes your top "
+                                         f"match ({change['top_probability']:.1%})")
+                            else:
+                                st.write(f"**{change['label']}** → {report['career']} "
+                                         f"{change['current_probability']:.1%} ({change['delta']:+.1%})")
+                        if report["skipped"]:
+                            st.caption(f"{report['skipped']} changes skipped to stay within the latency budget")
+
+            # Save prediction to session state for potential future use
+            st.session_state["predicted_career"] = best_career
+
+    
+            st.session_state.clear_clicked = True
+    
+            # If clear was clicked, reset relevant states immediately
+            if st.session_state.clear_clicked:
+                st.session_state.prediction_made = False
+                st.session_state.predicted_careers = []
+                if 'input_dict' in st.session_state:
+                    del st.session_state['input_dict']
+                st.session_state.clear_clicked = False
+    
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        # Skill increases that lead to a chosen career
+        if 'last_profile' in st.session_state:
+            with st.form("target_form", border=False):
+                st.markdown("### 🧭 Path to another career")
+                target = st.selectbox("Target career", [str(c) for c in recommender.loaded.classes])
+                goal = st.radio("Goal", ["Top match", "In my top 3"], horizontal=True)
+                find_clicked = st.form_submit_button("🔎 Find skill increases")
+            if find_clicked:
+                from counterfactual import find_path
+                path = find_path(st.session_state.last_profile, target,
+                                 goal_rank=1 if goal == "Top match" else 3)
+                if not path["changes"] and path["found"]:
+                    st.success(f"**{target}** is already there for your last submitted profile.")
+                elif path["found"]:
+                    st.success(f"Raising {path['total_increase']} skill point(s) in total reaches **{target}** "
+                               f"({path['probability']:.1%}, rank {path['rank']}):")
+                else:
+                    st.warning(f"The search did not find skill increases that reach **{target}**; the closest "
+                               f"profile it tried puts it at rank {path['rank']} ({path['probability']:.1%}). "
+                               "A longer search or a different preferred interest may still get there.")
+                for column, before, after in path["changes"]:
+                    st.write(f"**{column.split(' (')[0]}**: {before} → {after}")
+
+prediction_panel()
 
 # Footer
 st.markdown("---")
@@ -432,74 +547,80 @@ st.markdown("""
 ">
     Rhythm forever ❤️
 </div>
-
-<style>
-@keyframes gradientBG {
-    0% { background-position: 0% 50%; }
-    50% { background-position: 100% 50%; }
-    100% { background-position: 0% 50%; }
-}
-</style>
 """, unsafe_allow_html=True)
 
-# Add some floating animation elements (CSS only)
-st.markdown("""
-<style>
-/* Full page animated background */
-.stApp {
-    height: 100%;
-    background: linear-gradient(-45deg, #667eea, #764ba2, #ff5f6d, #ffc371);
-    background-size: 400% 400%;
-    animation: gradientBG 15s ease infinite;
-}
-
-/* Gradient animation keyframes */
-@keyframes gradientBG {
-    0% { background-position: 0% 50%; }
-    50% { background-position: 100% 50%; }
-    100% { background-position: 0% 50%; }
-}
-
-/* Optional: maintain existing blur/frosted sidebar */
-.css-1d391kg {
-    background: rgba(255, 255, 255, 0.95);
-    backdrop-filter: blur(15px);
-}
-
-/* Floating animations (optional) */
-@keyframes float {
-    0%, 100% { transform: translateY(0px) rotate(0deg); }
-    50% { transform: translateY(-20px) rotate(180deg); }
-}
-
-.stApp::before {
-    content: '';
-    position: fixed;
-    top: 20%;
-    right: 20%;
-    width: 80px;
-    height: 80px;
-    background: rgba(255, 255, 255, 0.1);
-    border-radius: 50%;
-    animation: float 6s ease-in-out infinite;
-    pointer-events: none;
-    z-index: -1;
-}
-
-.stApp::after {
-    content: '';
-    position: fixed;
-    bottom: 20%;
-    right: 30%;
-    width: 60px;
-    height: 60px;
-    background: rgba(255, 255, 255, 0.1);
-    border-radius: 50%;
-    animation: float 6s ease-in-out infinite 4s;
-    pointer-events: none;
-    z-index: -1;
-}
-</style>
-""", unsafe_allow_html=True)
+# Load Model + Encoders (one read-only instance shared by every session). Everything from
+# here on needs the loaded model, so it runs after the page above is already on screen.
+def load_model():
+    try:
+        return recommender.loaded
+    except Exception as e:
+        st.error(f"Error loading model: {str(e)}")
+        return None
+
+# Only a flag is kept: holding the LoadedModel here would pin it after a hot reload
+model_loaded = model_ready and load_model() is not None
+
+# Optional pool of inference worker processes (CAREER_POOL_WORKERS > 0)
+@st.cache_resource
+def start_inference_pool(model_path):
+    from inference_pool import pool_from_env
+    pool = pool_from_env(model_path)
+    if pool is not None:
+        pool.generation = recommender.loaded.generation
+    # Set once per process; a hot reload replaces it via recommender.model_swapped
+    recommender.pool = pool
+    return pool
+
+# Reload a retrained artifact in the background (CAREER_RELOAD_INTERVAL seconds, 0 = off)
+@st.cache_resource
+def start_model_watcher(model_path):
+    from model_loader import DEFAULT_RELOAD_INTERVAL, watch
+    interval = float(os.environ.get("CAREER_RELOAD_INTERVAL", DEFAULT_RELOAD_INTERVAL))
+    if interval <= 0:
+        return None
+    watcher = watch(model_path, interval)
+    watcher.on_swap(recommender.model_swapped)
+    return watcher
+
+model_watcher = None
+if model_loaded:
+    start_inference_pool(recommender.model_path)
+    model_watcher = start_model_watcher(recommender.model_path)
+
+# Model, cache and pool status. Its own fragment, refreshed every watcher interval, so a hot
+# reload shows up in the sidebar even while only the prediction panel is being rerun.
+@st.fragment(run_every=model_watcher.interval if model_watcher is not None else None)
+def model_status():
+    with st.expander("⚙️ Model & cache"):
+        if model_loaded:
+            current = recommender.loaded
+            st.write(f"Model version: `{current.version}`"
+                     + (f" · sha256 `{current.digest[:12]}`" if current.digest else ""))
+            st.write(f"Model loaded in {current.load_seconds:.2f}s "
+                     f"using {current.memory_bytes / 2**20:.1f} MB")
+        if model_watcher is not None:
+            reload_stats = model_watcher.status()
+            st.write(f"Hot reload: checked every {model_watcher.interval:g}s · "
+                     f"{reload_stats['reloads']} reload(s) · "
+                     f"{reload_stats['retired_in_memory']} old version(s) still in memory")
+            if reload_stats["last_error"]:
+                st.warning(f"New model rejected, still serving the current one: {reload_stats['last_error']}")
+        cache_stats = recommender.cache.stats()
+        st.write(f"Entries: {cache_stats['size']} / {cache_stats['maxsize']}")
+        st.write(f"Hits: {cache_stats['hits']} · Misses: {cache_stats['misses']} · "
+                 f"Evictions: {cache_stats['evictions']}")
+        st.write(f"Hit rate: {cache_stats['hit_rate']:.1%}")
+        if recommender.pool is not None:
+            pool_stats = recommender.pool.stats()
+            st.write(f"Inference pool: {pool_stats['workers']} workers · "
+                     f"{pool_stats['in_flight']} in flight · {pool_stats['rejected']} overflowed")
+            for worker in pool_stats["per_worker"]:
+                st.write(f"Worker {worker['worker']}: {worker['calls']} calls · "
+                         f"p50 {worker['p50_ms']:.1f} ms · p95 {worker['p95_ms']:.1f} ms")
 
+with st.sidebar:
+    model_status()
 
+if latency.enabled:
+    latency.observe("rerun", (time.perf_counter() - rerun_start) * 1e3)
@@ -0,0 +1,185 @@
+"""Compact, schema-typed in-memory representation of profile datasets.
+
+Every input is small: the 16 skills are integers 1-10 (uint8), CGPA lies in
+6.0-10.0 (float32) and ``Preferred Interest`` is one of 7 categories (uint8
+code). Loading with pandas defaults stores them as int64/float64/object and
+the one-hot expansion adds more columns on top. ``CompactProfiles`` keeps
+~22 bytes per profile and builds the float32 model matrix block by block
+only when it is needed.
+
+    python compact_profiles.py --rows 1000000   # memory per million profiles
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from career_schema import (
+    CAREERS, ID_COLUMN, INTEREST_COLUMN, INTEREST_PREFIX, INTERESTS, NUMERIC_COLUMNS, SKILL_COLUMNS,
+    TARGET_COLUMN,
+)
+
+SKILL_NAMES = list(SKILL_COLUMNS.values())
+UNKNOWN_CODE = 255
+
+# pandas dtypes for reading CSV chunks directly into the compact types
+CSV_DTYPES = {
+    "CGPA": np.float32,
+    **{name: np.uint8 for name in SKILL_NAMES},
+    INTEREST_COLUMN: pd.CategoricalDtype(INTERESTS),
+}
+
+
+def _codes(values, categories):
+    cat = pd.Categorical(values, categories=categories)
+    return np.where(cat.codes < 0, UNKNOWN_CODE, cat.codes).astype(np.uint8)
+
+
+def training_feature_names():
+    """Feature order produced by the notebook's ``pd.get_dummies`` on the full dataset."""
+    return NUMERIC_COLUMNS + [INTEREST_PREFIX + name for name in sorted(INTERESTS)]
+
+
+class CompactProfiles:
+    def __init__(self, skills, cgpa, interest, target=None, ids=None):
+        self.skills = skills        # (n, 16) uint8, columns in SKILL_NAMES order
+        self.cgpa = cgpa            # (n,) float32
+        self.interest = interest    # (n,) uint8 index into INTERESTS
+        self.target = target        # (n,) uint8 index into CAREERS, or None
+        self.ids = ids              # (n,) object array of Profile_IDs, or None
+
+    def __len__(self):
+        return len(self.cgpa)
+
+    @classmethod
+    def from_frame(cls, df):
+        skills = np.empty((len(df), len(SKILL_NAMES)), dtype=np.uint8)
+        for j, name in enumerate(SKILL_NAMES):
+            skills[:, j] = df[name].to_numpy()
+        target = _codes(df[TARGET_COLUMN], CAREERS) if TARGET_COLUMN in df.columns else None
+        ids = df[ID_COLUMN].to_numpy(dtype=object) if ID_COLUMN in df.columns else None
+        return cls(skills, df["CGPA"].to_numpy(dtype=np.float32),
+                   _codes(df[INTEREST_COLUMN], INTERESTS), target, ids)
+
+    @classmethod
+    def load(cls, path):
+        """Load a dataset CSV through the repairing, cached ingestion layer."""
+        from data_ingest import load_csv
+
+        return cls.from_frame(load_csv(path)[0])
+
+    @classmethod
+    def concat(cls, parts):
+        parts = list(parts)
+        target = None if parts[0].target is None else np.concatenate([p.target for p in parts])
+        ids = None if parts[0].ids is None else np.concatenate([p.ids for p in parts])
+        return cls(np.concatenate([p.skills for p in parts]), np.concatenate([p.cgpa for p in parts]),
+                   np.concatenate([p.interest for p in parts]), target, ids)
+
+    @property
+    def nbytes(self):
+        total = self.skills.nbytes + self.cgpa.nbytes + self.interest.nbytes
+        if self.target is not None:
+            total += self.target.nbytes
+        return total
+
+    def target_labels(self):
+        return np.asarray(CAREERS, dtype=object)[self.target]
+
+    def feature_matrix(self, feature_names, start=0, stop=None, out=None):
+        """float32 model input for rows ``start:stop`` in ``feature_names`` order."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        n = stop - start
+        if out is None:
+            out = np.zeros((n, len(feature_names)), dtype=np.float32)
+        else:
+            out[:n] = 0
+        skill_pos = {name: j for j, name in enumerate(SKILL_NAMES)}
+        interest_pos = {name: j for j, name in enumerate(INTERESTS)}
+        codes = self.interest[start:stop]
+        for i, name in enumerate(feature_names):
+            if name == "CGPA":
+                out[:n, i] = self.cgpa[start:stop]
+            elif name in skill_pos:
+                out[:n, i] = self.skills[start:stop, skill_pos[name]]
+            elif name.startswith(INTEREST_PREFIX):
+                code = interest_pos.get(name[len(INTEREST_PREFIX):])
+                if code is not None:
+                    out[:n, i] = codes == code
+        return out[:n]
+
+    def iter_blocks(self, feature_names, block_size=65_536):
+        """Yield ``(start, float32 block)`` pairs; one buffer is reused for every block."""
+        buf = np.zeros((min(block_size, len(self)), len(feature_names)), dtype=np.float32)
+        for start in range(0, len(self), block_size):
+            yield start, self.feature_matrix(feature_names, start, start + block_size, out=buf)
+
+    def describe(self):
+        """Cheap cohort analytics straight from the compact arrays."""
+        summary = {
+            "rows": len(self),
+            "cgpa_mean": float(self.cgpa.mean()) if len(self) else 0.0,
+            "skill_means": dict(zip(SKILL_NAMES, self.skills.mean(axis=0).round(3).tolist())),
+            "interests": dict(zip(INTERESTS, np.bincount(self.interest[self.interest != UNKNOWN_CODE],
+                                                         minlength=len(INTERESTS)).tolist())),
+        }
+        if self.target is not None:
+            counts = np.bincount(self.target[self.target != UNKNOWN_CODE], minlength=len(CAREERS))
+            summary["careers"] = dict(zip(CAREERS, counts.tolist()))
+        return summary
+
+
+def read_compact_chunks(path, chunk_size=250_000):
+    """Stream a large CSV straight into CompactProfiles chunks (no int64/object columns).
+
+    Without a ``Profile_ID`` column, rows are identified by their 1-based row number.
+    """
+    header = pd.read_csv(path, nrows=0).columns.tolist()
+    dtypes = {k: v for k, v in CSV_DTYPES.items() if k in header}
+    if TARGET_COLUMN in header:
+        dtypes[TARGET_COLUMN] = pd.CategoricalDtype(CAREERS)
+    start = 0
+    for chunk in pd.read_csv(path, usecols=header, index_col=False, dtype=dtypes, chunksize=chunk_size):
+        compact = CompactProfiles.from_frame(chunk)
+        if compact.ids is None:
+            compact.ids = np.arange(start + 1, start + len(compact) + 1)
+        start += len(compact)
+        yield chunk, compact
+
+
+def memory_report(rows=1_000_000, seed=0):
+    """Bytes for ``rows`` profiles: default pandas load + one-hot vs the compact form."""
+    from dataset_generator import generate_btech_career_data
+
+    df = generate_btech_career_data(rows, seed=seed)
+    # What pd.read_csv would give: int64/float64 numbers and Python string objects
+    df = df.astype({name: np.int64 for name in SKILL_NAMES} | {INTEREST_COLUMN: object, TARGET_COLUMN: object})
+    default_bytes = int(df.memory_usage(deep=True).sum())
+    one_hot = pd.get_dummies(df.drop(TARGET_COLUMN, axis=1))
+    one_hot_bytes = int(one_hot.memory_usage(deep=True).sum())
+    compact = CompactProfiles.from_frame(df)
+    return {
+        "rows": rows,
+        "pandas_bytes": default_bytes,
+        "pandas_one_hot_bytes": one_hot_bytes,
+        "compact_bytes": compact.nbytes,
+        "float32_block_bytes_per_row": 4 * len(training_feature_names()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report memory per profile dataset, default vs compact.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Generated profiles to measure")
+    args = parser.parse_args()
+
+    report = memory_report(args.rows)
+    mb = 2 ** 20
+    print(f"{report['rows']:,} profiles")
+    print(f"  pandas defaults (int64/float64/object): {report['pandas_bytes'] / mb:8.1f} MB")
+    print(f"  + get_dummies model frame:              {report['pandas_one_hot_bytes'] / mb:8.1f} MB")
+    print(f"  compact (uint8/float32/uint8 codes):    {report['compact_bytes'] / mb:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
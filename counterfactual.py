@@ -0,0 +1,243 @@
+"""Counterfactual "path to a target career" search.
+
+Given a profile and a target career from the label encoder's classes, the
+search looks for a small total increase of the skill sliders that makes
+the target the top prediction (``goal_rank=1``) or puts it in the top 3
+(``goal_rank=3``). It is a beam search by total increase: each
+round raises one skill of each kept profile by one step and scores every
+new profile in one batch with the recommender's engine (and its inference
+pool, when one is running). The ``beam_width`` profiles closest to the goal
+are then kept. The first round that reaches the goal gives the answer.
+Being a beam search, it does not guarantee the smallest possible increase,
+and a target it does not find may still be reachable with a wider beam.
+
+Profiles already scored are memoized in a ``PredictionCache`` shared by
+later searches on the same model. ``max_candidates`` caps the profiles
+explored per search, whether or not they were memoized, so a query gets
+the same answer on a cold or warm memo. When the cap is hit, the closest
+profile found so far is returned.
+
+    python counterfactual.py --model career_suggestion.pkl --target "Data Scientist" --goal-rank 3
+    python counterfactual.py --model career_suggestion.pkl --all-targets    # timing over every career
+"""
+
+import argparse
+import json
+import threading
+import time
+
+import numpy as np
+
+from career_schema import INTEREST_COLUMN, NUMERIC_COLUMNS, SKILL_COLUMNS
+from latency_metrics import stage
+from prediction_cache import PredictionCache
+
+DEFAULT_BEAM_WIDTH = 8
+DEFAULT_MAX_CANDIDATES = 2000
+MEMO_SIZE = 50_000
+SKILL_MAX = 10
+
+
+class PathSearch:
+    def __init__(self, recommender, memo_size=MEMO_SIZE):
+        self.recommender = recommender
+        # Scored profiles, keyed like profile_key(); cleared when a newer model is loaded
+        self.memo = PredictionCache(maxsize=memo_size)
+
+    def _evaluate(self, loaded, base_row, skill_pos, prefix, suffix, states):
+        """Probabilities for skill vectors ``states``; returns (probs, rows scored by the model)."""
+        keys = [prefix + tuple(s) + suffix for s in states.tolist()]
+        probs = np.empty((len(states), len(loaded.classes)), dtype=np.float64)
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self.memo.get(key, loaded.generation)
+            if cached is None:
+                missing.append(i)
+            else:
+                probs[i] = cached
+        if missing:
+            X = np.repeat(base_row, len(missing), axis=0)
+            X[:, skill_pos] = states[missing]
+            with stage("counterfactual_batch"):
+                # The recommender's engine (and inference pool), so the search ranks careers as predictions do
+                scored = self.recommender.score_matrix(X, loaded)
+            probs[missing] = scored
+            for i, row in zip(missing, scored):
+                row = row.copy()
+                row.setflags(write=False)
+                self.memo.put(keys[i], row, loaded.generation)
+        return probs, len(missing)
+
+    def search(self, profile, target, goal_rank=1, beam_width=DEFAULT_BEAM_WIDTH,
+               max_candidates=DEFAULT_MAX_CANDIDATES):
+        """Skill increases, found by beam search, that bring ``target`` into the top ``goal_rank``.
+
+        Returns a dict with ``found``, ``changes`` ([(column, from, to)]),
+        ``total_increase``, the target's ``probability`` and ``rank``, the
+        resulting ``top`` 3 careers, and ``candidates`` (profiles explored),
+        ``evaluations`` (of those, rows scored by the model), ``rounds``,
+        ``exhausted`` (cap reached) and ``elapsed_ms``.
+        """
+        start = time.perf_counter()
+        recommender = self.recommender
+        loaded = recommender.loaded
+        self.memo.check_model(loaded)
+        classes = [str(c) for c in loaded.classes]
+        if target not in classes:
+            raise ValueError(f"unknown career {target!r}; expected one of {classes}")
+        t = classes.index(target)
+
+        skill_columns = list(SKILL_COLUMNS.values())
+        position = dict(loaded.encoder.numeric)
+        skill_pos = [position[c] for c in skill_columns]
+        base_row = loaded.encoder.encode(profile)
+        # Memo keys match profile_key(): CGPA, the skills in schema order (NUMERIC_COLUMNS[1:]), interest
+        prefix = (float(profile.get("CGPA", 0)),)
+        suffix = (profile.get(INTEREST_COLUMN),)
+
+        def margin(probs):
+            # Target probability minus the goal_rank-th best other career
+            others = probs.copy()
+            others[:, t] = -1.0
+            kth = -np.partition(-others, goal_rank - 1, axis=1)[:, goal_rank - 1]
+            return probs[:, t] - kth
+
+        start_state = np.array([[int(profile.get(c, 0)) for c in skill_columns]], dtype=np.int64)
+        probs, evaluations = self._evaluate(loaded, base_row, skill_pos, prefix, suffix, start_state)
+        candidates = 1
+        margins = margin(probs)
+        frontier = start_state
+        best = (margins[0], start_state[0], probs[0])
+        seen = {tuple(start_state[0])}
+        rounds = 0
+        exhausted = False
+        found = margins[0] > 0
+
+        while not found:
+            # Every +1 step of every kept profile, best parents first
+            children = []
+            for state in frontier:
+                for j in range(len(skill_columns)):
+                    if state[j] < SKILL_MAX:
+                        child = state.copy()
+                        child[j] += 1
+                        key = tuple(child)
+                        if key not in seen:
+                            seen.add(key)
+                            children.append(child)
+            if not children:
+                break
+            remaining = max_candidates - candidates
+            if remaining <= 0:
+                exhausted = True
+                break
+            if len(children) > remaining:
+                # Children are in best-parent order, so the cut drops the least promising ones
+                children = children[:remaining]
+                exhausted = True
+            states = np.array(children)
+            probs, scored = self._evaluate(loaded, base_row, skill_pos, prefix, suffix, states)
+            candidates += len(children)
+            evaluations += scored
+            rounds += 1
+            margins = margin(probs)
+            order = np.argsort(-margins, kind="stable")
+            if margins[order[0]] > best[0]:
+                best = (margins[order[0]], states[order[0]], probs[order[0]])
+            if margins[order[0]] > 0:
+                # Among the goal-reaching profiles of this round, the one with the target most likely
+                winners = np.flatnonzero(margins > 0)
+                w = winners[np.argmax(probs[winners, t])]
+                best = (margins[w], states[w], probs[w])
+                found = True
+                break
+            if exhausted:
+                break
+            keep = order[:beam_width]
+            frontier = states[keep]
+
+        _, state, row = best
+        changes = [(column, int(before), int(after))
+                   for column, before, after in zip(skill_columns, start_state[0], state) if after != before]
+        top = np.argsort(-row, kind="stable")[:3]
+        return {
+            "target": target,
+            "goal_rank": goal_rank,
+            "found": bool(found),
+            "changes": changes,
+            "total_increase": int(sum(after - before for _, before, after in changes)),
+            "probability": float(row[t]),
+            "rank": int((row > row[t]).sum()) + 1,
+            "top": [(classes[j], float(row[j])) for j in top],
+            "candidates": candidates,
+            "evaluations": evaluations,
+            "rounds": rounds,
+            "exhausted": exhausted,
+            "elapsed_ms": (time.perf_counter() - start) * 1e3,
+        }
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_search():
+    """The process-wide PathSearch over the shared recommender (its memo is shared too)."""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                from career_engine import get_recommender
+
+                _default = PathSearch(get_recommender())
+    return _default
+
+
+def find_path(profile, target, goal_rank=1, **kwargs):
+    """Skill increases bringing ``target`` into the top ``goal_rank`` (see ``PathSearch.search``)."""
+    return get_search().search(profile, target, goal_rank, **kwargs)
+
+
+def main():
+    from career_engine import Recommender
+
+    parser = argparse.ArgumentParser(description="Find skill increases that lead to a target career.")
+    parser.add_argument("--model",
+                        help="Model artifact (.pkl or .cfa); defaults to career_suggestion.cfa when current, else .pkl")
+    parser.add_argument("--profile", help="Profile as JSON (missing inputs default to 5, CGPA 8.0, Coding)")
+    parser.add_argument("--target", help="Target career")
+    parser.add_argument("--all-targets", action="store_true", help="Search every career and report timings")
+    parser.add_argument("--goal-rank", type=int, default=1, help="1 = top prediction, 3 = in the top 3")
+    parser.add_argument("--beam-width", type=int, default=DEFAULT_BEAM_WIDTH)
+    parser.add_argument("--max-candidates", type=int, default=DEFAULT_MAX_CANDIDATES,
+                        help="Profiles explored per search")
+    args = parser.parse_args()
+
+    profile = {name: 5 for name in NUMERIC_COLUMNS}
+    profile.update({"CGPA": 8.0, INTEREST_COLUMN: "Coding"})
+    if args.profile:
+        profile.update(json.loads(args.profile))
+
+    searcher = PathSearch(Recommender(args.model))
+    targets = [str(c) for c in searcher.recommender.loaded.classes] if args.all_targets else [args.target]
+    options = {"beam_width": args.beam_width, "max_candidates": args.max_candidates}
+    times = []
+    for target in targets:
+        result = searcher.search(profile, target, args.goal_rank, **options)
+        times.append(result["elapsed_ms"])
+        steps = ", ".join(f"{column.split(' (')[0]} {before}→{after}" for column, before, after in result["changes"])
+        status = "found" if result["found"] else ("cap reached" if result["exhausted"] else "not found by beam search")
+        print(f"{target:26s} {status:24s} +{result['total_increase']:<3d} rank {result['rank']:2d} "
+              f"p={result['probability']:.2f}  {result['candidates']:5d} explored, {result['evaluations']:5d} scored "
+              f"{result['elapsed_ms']:7.1f} ms"
+              f"  {steps or '(no change needed)'}")
+    if len(times) > 1:
+        print(f"p50 {np.median(times):.1f} ms, max {max(times):.1f} ms over {len(times)} searches")
+        start = time.perf_counter()
+        for target in targets:
+            searcher.search(profile, target, args.goal_rank, **options)
+        print(f"repeated with a warm memo: {(time.perf_counter() - start) * 1e3 / len(targets):.1f} ms per search")
+
+
+if __name__ == "__main__":
+    main()
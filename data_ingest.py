@@ -0,0 +1,196 @@
+"""Robust CSV ingestion with a binary columnar cache.
+
+The checked-in ``BTech_Career_Path_Dataset.csv`` still contains git conflict
+markers (``<<<<<<< HEAD`` / ``=======`` / ``>>>>>>>``) around two ~1200-row
+halves, and ``user_profile.csv`` has rows with a predicted career appended
+past the header. This module drops marker lines, merges and deduplicates
+the conflict halves, truncates ragged rows and validates the values. It
+then writes a ``.npz`` columnar cache next to the CSV, so later loads skip
+text parsing entirely.
+
+    python data_ingest.py BTech_Career_Path_Dataset.csv
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from career_schema import CAREERS, INTEREST_COLUMN, INTERESTS, NUMERIC_COLUMNS, TARGET_COLUMN, VALUE_RANGES
+
+CACHE_SUFFIX = ".cache.npz"
+CACHE_VERSION = 1
+_MARKER = re.compile(r"^(<{7}|={7}|>{7})(\s.*)?$")
+
+
+def cache_path_for(path):
+    return path + CACHE_SUFFIX
+
+
+def _source_token(path, conflict):
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "conflict": conflict}
+
+
+def clean_rows(lines, conflict="both"):
+    """Split raw CSV lines into (header, rows, report) with markers and ragged rows handled.
+
+    ``conflict`` chooses which side of a merge conflict to keep: ``"ours"``
+    (HEAD), ``"theirs"`` or ``"both"`` (the default, deduplicated later).
+    """
+    reader = csv.reader(lines)
+    header = None
+    rows = []
+    report = {"marker_lines": 0, "repeated_headers": 0, "ragged_rows": 0, "short_rows": 0}
+    side = None  # None outside a conflict, else "ours"/"theirs"
+    for fields in reader:
+        if len(fields) == 1 and _MARKER.match(fields[0].strip()):
+            report["marker_lines"] += 1
+            marker = fields[0][:7]
+            side = {"<<<<<<<": "ours", "=======": "theirs", ">>>>>>>": None}[marker]
+            continue
+        if not fields or all(not f.strip() for f in fields):
+            continue
+        if header is None:
+            header = fields
+            continue
+        if fields == header:
+            report["repeated_headers"] += 1
+            continue
+        if side is not None and conflict != "both" and side != conflict:
+            continue
+        if len(fields) > len(header):
+            report["ragged_rows"] += 1
+            fields = fields[:len(header)]
+        elif len(fields) < len(header):
+            report["short_rows"] += 1
+            continue
+        rows.append(fields)
+    return header, rows, report
+
+
+def validate(df, report):
+    """Coerce types and drop rows whose values fall outside the dataset schema."""
+    valid = pd.Series(True, index=df.index)
+    for column in NUMERIC_COLUMNS:
+        if column not in df.columns:
+            continue
+        df[column] = pd.to_numeric(df[column], errors="coerce")
+        low, high = VALUE_RANGES[column]
+        valid &= df[column].between(low, high)
+    if INTEREST_COLUMN in df.columns:
+        valid &= df[INTEREST_COLUMN].isin(INTERESTS)
+    if TARGET_COLUMN in df.columns:
+        valid &= df[TARGET_COLUMN].isin(CAREERS)
+    report["invalid_rows"] = int((~valid).sum())
+    df = df[valid]
+    for column in NUMERIC_COLUMNS[1:]:
+        if column in df.columns:
+            df[column] = df[column].astype(np.int64)
+    return df.reset_index(drop=True)
+
+
+def parse_csv(path, conflict="both"):
+    """Parse ``path`` into a validated DataFrame and an ingestion report."""
+    with open(path, newline="") as f:
+        header, rows, report = clean_rows(f, conflict)
+    if header is None:
+        raise ValueError(f"{path} has no header row")
+    buf = io.StringIO()
+    csv.writer(buf).writerows([header] + rows)
+    buf.seek(0)
+    df = pd.read_csv(buf, dtype=str, keep_default_na=False)
+    before = len(df)
+    df = df.drop_duplicates(ignore_index=True)
+    report["duplicate_rows"] = before - len(df)
+    df = validate(df, report)
+    report["rows"] = len(df)
+    return df, report
+
+
+def write_cache(df, path, source, report):
+    """Store each column as a NumPy array (strings as category codes) in one .npz."""
+    arrays = {}
+    columns = []
+    for i, column in enumerate(df.columns):
+        key = f"c{i}"
+        series = df[column]
+        if pd.api.types.is_numeric_dtype(series):
+            arrays[key] = series.to_numpy()
+            columns.append({"name": column, "kind": "numeric"})
+        else:
+            cat = pd.Categorical(series)
+            arrays[key] = cat.codes.astype(np.int16)
+            columns.append({"name": column, "kind": "category", "categories": list(cat.categories)})
+    meta = {"version": CACHE_VERSION, "source": source, "columns": columns, "report": report}
+    arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+    tmp_path = path + ".tmp.npz"
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, path)
+
+
+def read_cache(path, source=None):
+    """Load a columnar cache, or return None if it is missing, stale or malformed."""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+            if meta.get("version") != CACHE_VERSION:
+                return None
+            if source is not None and meta.get("source") != source:
+                return None
+            frame = {}
+            for i, column in enumerate(meta["columns"]):
+                values = data[f"c{i}"]
+                if column["kind"] == "category":
+                    values = pd.Categorical.from_codes(values, column["categories"]).astype(str)
+                frame[column["name"]] = values
+    except (OSError, KeyError, ValueError):
+        return None
+    return pd.DataFrame(frame), meta["report"]
+
+
+def load_csv(path, use_cache=True, conflict="both"):
+    """Return ``(DataFrame, report)`` for ``path``, served from the columnar cache when fresh."""
+    source = _source_token(path, conflict)
+    cache_path = cache_path_for(path)
+    if use_cache:
+        cached = read_cache(cache_path, source)
+        if cached is not None:
+            return cached
+    df, report = parse_csv(path, conflict)
+    if use_cache:
+        try:
+            write_cache(df, cache_path, source, report)
+        except OSError:
+            pass
+    return df, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Repair a dataset CSV and build its columnar cache.")
+    parser.add_argument("csv", help="CSV to ingest")
+    parser.add_argument("--conflict", choices=["both", "ours", "theirs"], default="both",
+                        help="Which side of leftover merge-conflict blocks to keep")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore an existing cache")
+    args = parser.parse_args()
+
+    if args.rebuild and os.path.exists(cache_path_for(args.csv)):
+        os.remove(cache_path_for(args.csv))
+    start = time.perf_counter()
+    df, report = load_csv(args.csv, conflict=args.conflict)
+    parse_ms = (time.perf_counter() - start) * 1e3
+    start = time.perf_counter()
+    load_csv(args.csv, conflict=args.conflict)
+    cached_ms = (time.perf_counter() - start) * 1e3
+    print(json.dumps(report, indent=2))
+    print(f"first load {parse_ms:.1f} ms, cached load {cached_ms:.1f} ms -> {cache_path_for(args.csv)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Vectorized synthetic dataset generator for the career path model.
+
+Same rule semantics as ``generate_btech_career_data`` in the notebook, but the
+columns are drawn with NumPy a chunk at a time and the if/elif cascade is
+resolved with one ``np.select`` call, so millions of rows can be streamed to
+disk with flat memory.
+
+    python dataset_generator.py --rows 5000000 --out BTech_Career_Path_Dataset.csv
+    python dataset_generator.py --check
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from career_schema import (  # noqa: F401  (re-exported for callers of this module)
+    CAREERS, COLUMNS, INTEREST_COLUMN, INTERESTS, NUMERIC_COLUMNS, SKILL_COLUMNS, TARGET_COLUMN,
+)
+
+DEFAULT_CAREER = "Software Engineer"
+
+
+def rule_conditions(c):
+    """Return the notebook's rules as ``(career, mask)`` pairs in cascade order.
+
+    ``c`` maps the short skill names (and ``interest``) to arrays, so the same
+    rules work on a whole chunk at once.
+    """
+    return [
+        ("Web Developer", (c["prog_skill"] > 7) & (c["database"] > 6)),
+        ("Mobile App Developer", (c["prog_skill"] > 7) & (c["mobile_dev"] > 6)),
+        ("Data Scientist", (c["math_skill"] > 7) & (c["problem_solving"] > 7) & (c["ai_ml"] > 6)),
+        ("Data Analyst", (c["math_skill"] > 7) & (c["problem_solving"] > 6)),
+        ("AI/ML Engineer", (c["ai_ml"] > 8) & (c["prog_skill"] > 7)),
+        ("Cybersecurity Specialist", (c["cybersecurity"] > 8) & (c["networking"] > 6)),
+        ("Cloud Engineer", (c["networking"] > 7) & (c["cloud_computing"] > 6)),
+        ("Database Administrator", (c["database"] > 8) & (c["problem_solving"] > 6)),
+        ("Game Developer", (c["prog_skill"] > 8) & (c["creativity"] > 7)),
+        ("Blockchain Developer", (c["blockchain"] > 7) & (c["prog_skill"] > 6)),
+        ("IoT Engineer", (c["interest"] == "Research") & (c["ai_ml"] > 7)),
+        ("Embedded Systems Engineer", (c["interest"] == "Systems") & (c["prog_skill"] > 6)),
+        ("Robotics Engineer", (c["robotics"] > 7) & (c["prog_skill"] > 6)),
+        ("Network Engineer", (c["networking"] > 8) & (c["system_design"] > 6)),
+        ("UI/UX Designer", (c["creativity"] > 8) & (c["design"] > 7)),
+        ("Project Manager", (c["comm_skill"] > 8) & (c["leadership"] > 7)),
+    ]
+
+
+def assign_careers(c):
+    """Resolve the whole rule cascade for a chunk with a single masked selection."""
+    rules = rule_conditions(c)
+    return np.select(
+        [mask for _, mask in rules],
+        np.array([career for career, _ in rules], dtype=object),
+        default=DEFAULT_CAREER,
+    )
+
+
+def _reference_career(c):
+    # Literal copy of the notebook's per-row cascade, kept to check rule order
+    if c["prog_skill"] > 7 and c["database"] > 6:
+        return "Web Developer"
+    elif c["prog_skill"] > 7 and c["mobile_dev"] > 6:
+        return "Mobile App Developer"
+    elif c["math_skill"] > 7 and c["problem_solving"] > 7 and c["ai_ml"] > 6:
+        return "Data Scientist"
+    elif c["math_skill"] > 7 and c["problem_solving"] > 6:
+        return "Data Analyst"
+    elif c["ai_ml"] > 8 and c["prog_skill"] > 7:
+        return "AI/ML Engineer"
+    elif c["cybersecurity"] > 8 and c["networking"] > 6:
+        return "Cybersecurity Specialist"
+    elif c["networking"] > 7 and c["cloud_computing"] > 6:
+        return "Cloud Engineer"
+    elif c["database"] > 8 and c["problem_solving"] > 6:
+        return "Database Administrator"
+    elif c["prog_skill"] > 8 and c["creativity"] > 7:
+        return "Game Developer"
+    elif c["blockchain"] > 7 and c["prog_skill"] > 6:
+        return "Blockchain Developer"
+    elif c["interest"] == "Research" and c["ai_ml"] > 7:
+        return "IoT Engineer"
+    elif c["interest"] == "Systems" and c["prog_skill"] > 6:
+        return "Embedded Systems Engineer"
+    elif c["robotics"] > 7 and c["prog_skill"] > 6:
+        return "Robotics Engineer"
+    elif c["networking"] > 8 and c["system_design"] > 6:
+        return "Network Engineer"
+    elif c["creativity"] > 8 and c["design"] > 7:
+        return "UI/UX Designer"
+    elif c["comm_skill"] > 8 and c["leadership"] > 7:
+        return "Project Manager"
+    else:
+        return "Software Engineer"
+
+
+def draw_columns(rng, n):
+    """Draw ``n`` random profiles as a dict of column arrays keyed by short name."""
+    c = {"cgpa": np.round(rng.uniform(6.0, 10.0, n), 2)}
+    for name in SKILL_COLUMNS:
+        c[name] = rng.integers(1, 11, n, dtype=np.int64)
+    c["interest"] = np.array(INTERESTS, dtype=object)[rng.integers(0, len(INTERESTS), n)]
+    return c
+
+
+def generate_chunks(num_samples, chunk_size=250_000, seed=None):
+    """Yield DataFrames of at most ``chunk_size`` rows until ``num_samples`` are produced."""
+    rng = np.random.default_rng(seed)
+    remaining = num_samples
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        c = draw_columns(rng, n)
+        frame = {"CGPA": c["cgpa"]}
+        for name, column in SKILL_COLUMNS.items():
+            frame[column] = c[name]
+        frame[INTEREST_COLUMN] = c["interest"]
+        frame[TARGET_COLUMN] = assign_careers(c)
+        yield pd.DataFrame(frame, columns=COLUMNS)
+        remaining -= n
+
+
+def generate_btech_career_data(num_samples=1000, seed=None):
+    """In-memory drop-in for the notebook function (fine for small datasets)."""
+    return pd.concat(list(generate_chunks(num_samples, seed=seed)), ignore_index=True)
+
+
+def write_btech_career_data(path, num_samples, chunk_size=250_000, seed=None):
+    """Stream ``num_samples`` generated rows to ``path`` as CSV, one chunk at a time."""
+    tmp_path = path + ".tmp"
+    written = 0
+    with open(tmp_path, "w", newline="") as f:
+        for i, chunk in enumerate(generate_chunks(num_samples, chunk_size, seed)):
+            chunk.to_csv(f, header=(i == 0), index=False)
+            written += len(chunk)
+    os.replace(tmp_path, path)
+    return written
+
+
+def check_rule_order(num_samples=100_000, seed=0):
+    """Compare the vectorized labels against the literal cascade on the same values.
+
+    Returns the number of mismatching rows (0 means the rule order is identical).
+    """
+    c = draw_columns(np.random.default_rng(seed), num_samples)
+    fast = assign_careers(c)
+    mismatches = 0
+    for i in range(num_samples):
+        row = {name: values[i] for name, values in c.items()}
+        if _reference_career(row) != fast[i]:
+            mismatches += 1
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the synthetic BTech career dataset.")
+    parser.add_argument("--rows", type=int, default=1200, help="Number of rows to generate")
+    parser.add_argument("--out", default="BTech_Career_Path_Dataset.csv", help="Output CSV path")
+    parser.add_argument("--chunk-size", type=int, default=250_000, help="Rows generated per chunk")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--check", action="store_true",
+                        help="Only verify the vectorized rules against the original cascade")
+    args = parser.parse_args()
+
+    if args.check:
+        mismatches = check_rule_order(seed=args.seed or 0)
+        print(f"Rule order check: {mismatches} mismatching rows")
+        raise SystemExit(1 if mismatches else 0)
+
+    start = time.perf_counter()
+    written = write_btech_career_data(args.out, args.rows, args.chunk_size, args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {written} rows to {args.out} in {elapsed:.2f}s ({written / max(elapsed, 1e-9):,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
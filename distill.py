@@ -0,0 +1,189 @@
+"""Distil the 300-tree forest into a small student model.
+
+The teacher's ``predict_proba`` is recorded on dense synthetic samples from
+the generator. Each candidate student, a single decision tree or a few
+shallow trees, is a multi-output regressor fitted to those probability
+vectors. Every candidate is scored on held-out samples for accuracy
+(against the generator's labels), top-1 and top-3 agreement with the
+teacher, ``.cfa`` artifact size and FlatForest latency per row and per
+batch. The chosen student is saved in the notebook's pickle layout plus a
+``.cfa``, so ``model_loader``, ``batch_score`` and the app can load it like
+the forest.
+
+    python distill.py --teacher career_suggestion.pkl --samples 300000 --out career_suggestion_student.pkl
+"""
+
+import argparse
+import json
+import os
+import pickle
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+from compact_profiles import CompactProfiles
+from dataset_generator import generate_chunks
+from forest_engine import FlatForest, ProbabilityStudent, top_k
+from model_artifact import export_artifact, write_artifact
+
+DEFAULT_MIN_AGREEMENT = 0.95
+
+# The teacher was fitted on a DataFrame; it is fed aligned float32 arrays
+warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+# name -> (estimator kind, params)
+CANDIDATES = {
+    "tree-d10": ("tree", {"max_depth": 10}),
+    "tree-d14": ("tree", {"max_depth": 14}),
+    "tree-d18": ("tree", {"max_depth": 18, "min_samples_leaf": 2}),
+    "forest-8xd10": ("forest", {"n_estimators": 8, "max_depth": 10}),
+    "forest-16xd12": ("forest", {"n_estimators": 16, "max_depth": 12}),
+}
+
+
+def _make_regressor(kind, params, seed):
+    if kind == "tree":
+        from sklearn.tree import DecisionTreeRegressor
+
+        return DecisionTreeRegressor(random_state=seed, **params)
+    from sklearn.ensemble import RandomForestRegressor
+
+    return RandomForestRegressor(random_state=seed, n_jobs=-1, **params)
+
+
+def sample_teacher(teacher, feature_names, label_codes, samples, seed=0):
+    """Generator samples as (X, teacher probabilities, true class codes)."""
+    parts = list(CompactProfiles.from_frame(chunk) for chunk in generate_chunks(samples, seed=seed))
+    profiles = CompactProfiles.concat(parts)
+    X = profiles.feature_matrix(feature_names)
+    y = label_codes[profiles.target]
+    return X, teacher.predict_proba(X), y
+
+
+def _latency_us(model, X, batch_size, rows):
+    X = X[:rows]
+    model.predict_proba(X[:batch_size])
+    start = time.perf_counter()
+    for i in range(0, len(X), batch_size):
+        model.predict_proba(X[i:i + batch_size])
+    return (time.perf_counter() - start) / len(X) * 1e6
+
+
+def _artifact_bytes(flat, classes, feature_names):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "model.cfa")
+        write_artifact(path, flat, classes, feature_names)
+        return os.path.getsize(path)
+
+
+def evaluate(flat, X, teacher_probs, y, classes, feature_names):
+    """Accuracy, agreement, size and latency for one model (as a FlatForest)."""
+    probs = flat.predict_proba(X)
+    teacher_top3 = top_k(teacher_probs, 3)[0]
+    student_top3 = top_k(probs, 3)[0]
+    overlap = (student_top3[:, :, None] == teacher_top3[:, None, :]).any(axis=2).sum(axis=1)
+    return {
+        "accuracy": float((probs.argmax(axis=1) == y).mean()),
+        "top1_agreement": float((probs.argmax(axis=1) == teacher_probs.argmax(axis=1)).mean()),
+        "top3_agreement": float((overlap == 3).mean()),
+        "top3_overlap": float(overlap.mean() / 3),
+        "nodes": int(len(flat.feature)),
+        "artifact_bytes": _artifact_bytes(flat, classes, feature_names),
+        "row_us": _latency_us(flat, X, 1, 500),
+        "batch4096_row_us": _latency_us(flat, X, 4096, 16_384),
+    }
+
+
+def distill(teacher_path, samples=300_000, holdout=50_000, candidates=None, seed=0):
+    """Fit every candidate; returns (report, {name: ProbabilityStudent}, teacher saved objects)."""
+    with open(teacher_path, "rb") as f:
+        saved_objects = pickle.load(f)
+    teacher = saved_objects["model"]
+    feature_names = saved_objects["features"]
+    classes = saved_objects["label_encoder"].classes_
+    code = {str(c): i for i, c in enumerate(classes)}
+    from career_schema import CAREERS
+
+    label_codes = np.array([code[c] for c in CAREERS])
+
+    start = time.perf_counter()
+    X, teacher_probs, y = sample_teacher(teacher, feature_names, label_codes, samples + holdout, seed)
+    print(f"teacher labelled {len(X):,} samples in {time.perf_counter() - start:.1f}s")
+    train = slice(0, samples)
+    test = slice(samples, None)
+
+    report = {"teacher": evaluate(FlatForest.from_sklearn(teacher), X[test], teacher_probs[test], y[test],
+                                  classes, feature_names)}
+    students = {}
+    for name in candidates or CANDIDATES:
+        kind, params = CANDIDATES[name]
+        start = time.perf_counter()
+        regressor = _make_regressor(kind, params, seed).fit(X[train], teacher_probs[train])
+        fit_s = time.perf_counter() - start
+        students[name] = ProbabilityStudent(regressor, len(classes))
+        flat = FlatForest.from_sklearn(students[name])
+        report[name] = {**evaluate(flat, X[test], teacher_probs[test], y[test], classes, feature_names),
+                        "fit_s": fit_s, "params": params}
+    return report, students, saved_objects
+
+
+def choose(report, min_agreement=DEFAULT_MIN_AGREEMENT):
+    """Smallest student within ``min_agreement`` top-1 agreement, else the most faithful.
+
+    Single-row latency is dominated by per-call overhead and barely differs
+    between candidates, so size decides.
+    """
+    names = [n for n in report if n != "teacher"]
+    good = [n for n in names if report[n]["top1_agreement"] >= min_agreement]
+    if good:
+        return min(good, key=lambda n: report[n]["artifact_bytes"])
+    return max(names, key=lambda n: report[n]["top1_agreement"])
+
+
+def save_student(student, saved_objects, out_path, metrics):
+    """Write the student in the notebook's pickle layout and as a .cfa next to it."""
+    manifest = {**saved_objects.get("manifest", {}), "distilled": metrics}
+    student_objects = {"model": student, "label_encoder": saved_objects["label_encoder"],
+                       "features": saved_objects["features"], "manifest": manifest}
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(student_objects, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, out_path)
+    # Exported from the pickle just written, so the .cfa records its (mtime, size) and counts as current
+    return export_artifact(out_path, os.path.splitext(out_path)[0] + ".cfa", {"distilled": metrics})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distil the career forest into a small student model.")
+    parser.add_argument("--teacher", default="career_suggestion.pkl", help="Pickled teacher forest")
+    parser.add_argument("--samples", type=int, default=300_000, help="Generated training samples")
+    parser.add_argument("--holdout", type=int, default=50_000, help="Generated evaluation samples")
+    parser.add_argument("--candidates", nargs="+", choices=sorted(CANDIDATES), help="Subset to try")
+    parser.add_argument("--min-agreement", type=float, default=DEFAULT_MIN_AGREEMENT,
+                        help="Top-1 agreement a student needs to be chosen on artifact size")
+    parser.add_argument("--out", help="Write the chosen student here (pickle + .cfa)")
+    parser.add_argument("--report", help="Write the full report as JSON")
+    args = parser.parse_args()
+
+    report, students, saved_objects = distill(args.teacher, args.samples, args.holdout, args.candidates)
+    print(f"{'model':14s} {'acc':>7s} {'top1':>7s} {'top3':>7s} {'top3 ovl':>8s} {'nodes':>9s} {'size':>9s} "
+          f"{'row':>9s} {'batch':>9s}")
+    for name, r in report.items():
+        print(f"{name:14s} {r['accuracy']:7.2%} {r['top1_agreement']:7.2%} {r['top3_agreement']:7.2%} "
+              f"{r['top3_overlap']:8.2%} "
+              f"{r['nodes']:9,d} {r['artifact_bytes'] / 2 ** 20:7.2f}MB {r['row_us']:7.0f}us "
+              f"{r['batch4096_row_us']:7.2f}us")
+    chosen = choose(report, args.min_agreement)
+    print(f"chosen: {chosen}")
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"chosen": chosen, "candidates": report}, f, indent=2)
+    if args.out:
+        cfa_path = save_student(students[chosen], saved_objects, args.out, {"student": chosen, **report[chosen]})
+        print(f"Wrote {args.out} and {cfa_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Per-feature explanations of the forest's career probabilities.
+
+Contributions come straight from the fitted trees (``FlatForest.contributions``,
+Saabas path attribution). In every tree, the change in the node class
+distribution at each split on a profile's path is credited to that split's
+feature. For each career, the base rate plus the sum of the credits is
+exactly the model's probability. The seven ``Preferred Interest`` one-hot
+columns are reported as one input.
+
+Explanations are cached per profile like predictions. Batch mode explains a
+whole cohort in one traversal and summarises which inputs pushed each
+predicted career.
+
+    python explain.py --model career_suggestion.pkl --profile '{"Math Skill (1-10)": 9, ...}'
+    python explain.py --model career_suggestion.pkl --data BTech_Career_Path_Dataset.csv --rows 20000
+"""
+
+import argparse
+import json
+import threading
+import time
+
+import numpy as np
+
+from career_schema import INTEREST_COLUMN, INTEREST_PREFIX, NUMERIC_COLUMNS
+from latency_metrics import stage
+from prediction_cache import PredictionCache, profile_key
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+def feature_groups(feature_names):
+    """(input names, group index per model feature): one-hot interest columns share a group."""
+    names, index = [], []
+    for name in feature_names:
+        group = INTEREST_COLUMN if name.startswith(INTEREST_PREFIX) else name
+        if group not in names:
+            names.append(group)
+        index.append(names.index(group))
+    return names, np.asarray(index)
+
+
+def group_contributions(contributions, group_index, n_groups):
+    """Sum the feature axis of (rows, features, classes) contributions into input groups."""
+    out = np.zeros((contributions.shape[0], n_groups, contributions.shape[2]), dtype=np.float64)
+    np.add.at(out, (slice(None), group_index), contributions)
+    return out
+
+
+class Explainer:
+    def __init__(self, recommender, cache_size=DEFAULT_CACHE_SIZE):
+        self.recommender = recommender
+        # profile_key -> (probabilities, grouped contributions) for every class
+        self.cache = PredictionCache(maxsize=cache_size)
+
+    def _groups(self, loaded):
+        return feature_groups(loaded.feature_names)
+
+    def _check_engine(self):
+        # Rules predictions have no tree paths; explaining the forest would describe probabilities never shown
+        if self.recommender.engine != "forest":
+            raise ValueError(f"only the forest engine can be explained, not {self.recommender.engine!r}")
+
+    def contributions(self, profile, loaded=None):
+        """(bias, probabilities, grouped contributions (inputs, classes)) for one profile, cached."""
+        self._check_engine()
+        if loaded is None:
+            loaded = self.recommender.loaded
+        self.cache.check_model(loaded)
+        names, group_index = self._groups(loaded)
+        key = profile_key(profile)
+        cached = self.cache.get(key, loaded.generation)
+        if cached is None:
+            with stage("explain"):
+                bias, contrib = loaded.model.contributions(loaded.encoder.encode(profile))
+                grouped = group_contributions(contrib, group_index, len(names))[0]
+                probs = bias + grouped.sum(axis=0)
+            for array in (bias, probs, grouped):
+                array.setflags(write=False)
+            cached = (bias, probs, grouped)
+            self.cache.put(key, cached, loaded.generation)
+        return cached
+
+    def explain(self, profile, k=3, top=5):
+        """For each of the top-``k`` careers: probability, base rate and the ``top`` inputs by impact.
+
+        Each driver is ``(input, contribution)`` in probability units; positive
+        values pushed the career up.
+        """
+        loaded = self.recommender.loaded
+        bias, probs, grouped = self.contributions(profile, loaded)
+        names, _ = self._groups(loaded)
+        out = []
+        for j in np.argsort(-probs, kind="stable")[:k]:
+            column = grouped[:, j]
+            order = np.argsort(-np.abs(column), kind="stable")[:top]
+            out.append({
+                "career": str(loaded.classes[j]),
+                "probability": float(probs[j]),
+                "base": float(bias[j]),
+                "drivers": [(names[i], float(column[i])) for i in order],
+            })
+        return out
+
+    def explain_batch(self, X):
+        """Grouped contributions towards each row's predicted career: (input names, careers, (rows, inputs))."""
+        self._check_engine()
+        loaded = self.recommender.loaded
+        names, group_index = self._groups(loaded)
+        bias, contrib = loaded.model.contributions(X)
+        grouped = group_contributions(contrib, group_index, len(names))
+        predicted = (bias + grouped.sum(axis=1)).argmax(axis=1)
+        towards = grouped[np.arange(len(X)), :, predicted]
+        return names, loaded.classes[predicted], towards
+
+
+def cohort_report(names, careers, towards, top=3):
+    """Per predicted career: row count and the inputs with the largest mean contribution towards it."""
+    report = {}
+    for career in np.unique(careers):
+        mask = careers == career
+        mean = towards[mask].mean(axis=0)
+        order = np.argsort(-mean, kind="stable")[:top]
+        report[str(career)] = {"rows": int(mask.sum()), "drivers": [(names[i], float(mean[i])) for i in order]}
+    return report
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_explainer():
+    """The process-wide Explainer over the shared recommender."""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                from career_engine import get_recommender
+
+                _default = Explainer(get_recommender())
+    return _default
+
+
+def _median_ms(fn, number):
+    times = []
+    for _ in range(number):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1e3)
+    return float(np.median(times))
+
+
+def main():
+    from career_engine import Recommender
+
+    parser = argparse.ArgumentParser(description="Explain career predictions from the tree structure.")
+    parser.add_argument("--model",
+                        help="Model artifact (.pkl or .cfa); defaults to career_suggestion.cfa when current, else .pkl")
+    parser.add_argument("--profile", help="Profile as JSON (missing inputs default to 5, CGPA 8.0, Coding)")
+    parser.add_argument("--data", help="CSV of profiles for a cohort report")
+    parser.add_argument("--rows", type=int, default=20_000, help="Rows of --data to explain")
+    parser.add_argument("--top", type=int, default=5, help="Inputs listed per career")
+    args = parser.parse_args()
+
+    explainer = Explainer(Recommender(args.model, engine="forest"))
+    loaded = explainer.recommender.loaded
+
+    if args.data:
+        from compact_profiles import CompactProfiles
+
+        profiles = CompactProfiles.load(args.data)
+        X = profiles.feature_matrix(loaded.feature_names, 0, min(args.rows, len(profiles.cgpa)))
+        start = time.perf_counter()
+        names, careers, towards = explainer.explain_batch(X)
+        explain_s = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded.model.predict_proba(X)
+        proba_s = time.perf_counter() - start
+        print(f"explained {len(X):,} rows in {explain_s:.2f}s (predict_proba {proba_s:.2f}s, "
+              f"{explain_s / proba_s:.1f}x)")
+        for career, row in sorted(cohort_report(names, careers, towards, args.top).items(),
+                                  key=lambda kv: -kv[1]["rows"]):
+            drivers = ", ".join(f"{name.split(' (')[0]} {value:+.1%}" for name, value in row["drivers"])
+            print(f"  {career:26s} {row['rows']:7,d}  {drivers}")
+        return
+
+    profile = {name: 5 for name in NUMERIC_COLUMNS}
+    profile.update({"CGPA": 8.0, INTEREST_COLUMN: "Coding"})
+    if args.profile:
+        profile.update(json.loads(args.profile))
+    for entry in explainer.explain(profile, top=args.top):
+        print(f"{entry['career']}: {entry['probability']:.1%} (base rate {entry['base']:.1%})")
+        for name, value in entry["drivers"]:
+            print(f"  {name:32s} {value:+7.1%}")
+
+    x = loaded.encoder.encode(profile)
+    proba_ms = _median_ms(lambda: loaded.model.predict_proba(x), 200)
+    explain_ms = _median_ms(lambda: loaded.model.contributions(x), 200)
+    cached_ms = _median_ms(lambda: explainer.explain(profile), 200)
+    print(f"one profile: predict_proba {proba_ms:.2f} ms, contributions {explain_ms:.2f} ms "
+          f"({explain_ms / proba_ms:.1f}x), cached explain {cached_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
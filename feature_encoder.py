@@ -0,0 +1,120 @@
+"""Precompiled feature encoder for the career model.
+
+Built once from the ``features`` list stored in the pickle, it writes profiles
+straight into a float32 array in training column order. The ``Preferred
+Interest`` one-hot is set by index lookup, so no DataFrame or
+``pd.get_dummies`` call is needed on the prediction path.
+
+    python feature_encoder.py --model career_suggestion.pkl   # micro-benchmark
+"""
+
+import argparse
+import pickle
+import timeit
+
+import numpy as np
+
+from career_schema import INTEREST_COLUMN, INTEREST_PREFIX
+
+
+class FeatureEncoder:
+    def __init__(self, feature_names):
+        self.feature_names = list(feature_names)
+        self.n_features = len(self.feature_names)
+        # (column name, position) for every numeric input
+        self.numeric = []
+        # interest value -> position of its one-hot column
+        self.interest_index = {}
+        for i, name in enumerate(self.feature_names):
+            if name.startswith(INTEREST_PREFIX):
+                self.interest_index[name[len(INTEREST_PREFIX):]] = i
+            else:
+                self.numeric.append((name, i))
+
+    def encode(self, profile, out=None):
+        """Encode one profile dict into a (1, n_features) float32 row."""
+        if out is None:
+            out = np.zeros((1, self.n_features), dtype=np.float32)
+        row = out[0]
+        for name, i in self.numeric:
+            row[i] = profile.get(name, 0)
+        # Unknown interests leave every one-hot column at 0, like reindex(fill_value=0)
+        j = self.interest_index.get(profile.get(INTEREST_COLUMN))
+        if j is not None:
+            row[j] = 1.0
+        return out
+
+    def encode_batch(self, profiles, out=None):
+        """Encode a sequence of profile dicts into an (n, n_features) float32 array."""
+        n = len(profiles)
+        if out is None:
+            out = np.zeros((n, self.n_features), dtype=np.float32)
+        for name, i in self.numeric:
+            out[:, i] = [p.get(name, 0) for p in profiles]
+        cols = [self.interest_index.get(p.get(INTEREST_COLUMN), -1) for p in profiles]
+        self._set_interests(out, np.asarray(cols, dtype=np.intp))
+        return out
+
+    def encode_frame(self, df, out=None):
+        """Encode a DataFrame with the raw dataset columns (extra columns are ignored)."""
+        n = len(df)
+        if out is None:
+            out = np.zeros((n, self.n_features), dtype=np.float32)
+        for name, i in self.numeric:
+            if name in df.columns:
+                out[:, i] = df[name].to_numpy()
+        if INTEREST_COLUMN in df.columns:
+            cols = df[INTEREST_COLUMN].map(self.interest_index).fillna(-1).to_numpy(dtype=np.intp)
+            self._set_interests(out, cols)
+        return out
+
+    @staticmethod
+    def _set_interests(out, cols):
+        known = cols >= 0
+        out[np.flatnonzero(known), cols[known]] = 1.0
+
+
+def _pandas_encode(input_dict, feature_names):
+    # The predict-button handler's original encoding, kept for comparison
+    import pandas as pd
+
+    input_df = pd.DataFrame([input_dict])
+    input_df = pd.get_dummies(input_df, columns=[INTEREST_COLUMN])
+    for col in feature_names:
+        if col not in input_df.columns:
+            input_df[col] = 0
+    return input_df[feature_names]
+
+
+def benchmark(feature_names, number=2000):
+    """Time the pandas handler path against the encoder for one profile (microseconds)."""
+    profile = {name: 5 for name in feature_names if not name.startswith(INTEREST_PREFIX)}
+    profile["CGPA"] = 8.0
+    profile[INTEREST_COLUMN] = "Coding"
+    encoder = FeatureEncoder(feature_names)
+
+    expected = _pandas_encode(profile, feature_names).to_numpy(dtype=np.float32)
+    if not np.array_equal(expected, encoder.encode(profile)):
+        raise AssertionError("FeatureEncoder output differs from the pandas encoding")
+
+    pandas_us = timeit.timeit(lambda: _pandas_encode(profile, feature_names), number=number) / number * 1e6
+    encoder_us = timeit.timeit(lambda: encoder.encode(profile), number=number) / number * 1e6
+    return {"pandas_us": pandas_us, "encoder_us": encoder_us, "speedup": pandas_us / encoder_us}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FeatureEncoder against the pandas path.")
+    parser.add_argument("--model", default="career_suggestion.pkl", help="Pickled model artifact")
+    parser.add_argument("--number", type=int, default=2000, help="Iterations per timing")
+    args = parser.parse_args()
+
+    with open(args.model, "rb") as f:
+        feature_names = pickle.load(f)["features"]
+    result = benchmark(feature_names, args.number)
+    print(f"pandas get_dummies path: {result['pandas_us']:9.1f} us/profile")
+    print(f"FeatureEncoder.encode:   {result['encoder_us']:9.1f} us/profile")
+    print(f"speedup:                 {result['speedup']:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
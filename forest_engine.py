@@ -0,0 +1,303 @@
+"""Flattened, array-based evaluator for the fitted RandomForestClassifier.
+
+The fitted trees are exported once into contiguous node arrays (feature,
+threshold, children, per-node class distribution) and all trees are walked
+together with vectorized NumPy indexing. This skips sklearn's input
+validation and per-tree dispatch, which dominate the latency for one row.
+
+    python forest_engine.py --model career_suggestion.pkl   # parity check + timings
+"""
+
+import argparse
+import pickle
+import timeit
+
+import numpy as np
+
+# Rows evaluated per traversal pass; bounds the (rows, trees, classes) gather
+ROW_BLOCK = 256
+# Trees evaluated between early-exit checks
+EARLY_EXIT_CHUNK = 25
+# Probabilities equal to this many decimals are ranked as ties (see rank_classes)
+TIE_DECIMALS = 12
+
+
+class FlatForest:
+    def __init__(self, feature, threshold, left, right, value, roots, max_depth, classes):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.classes_ = classes
+        self.n_trees = len(roots)
+        self.n_classes = value.shape[1]
+        self.is_leaf = left == np.arange(len(left))
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """Export every fitted tree of ``model`` into one set of node arrays.
+
+        Besides classifier forests this accepts multi-output regressors fitted on
+        class probabilities (the distilled students), whose leaves hold one
+        probability per output.
+        """
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            n = tree.node_count
+            ids = np.arange(offset, offset + n, dtype=np.int32)
+            leaf = tree.children_left == -1
+            # Leaves point at themselves so extra traversal steps are no-ops
+            left = np.where(leaf, ids, tree.children_left + offset).astype(np.int32)
+            right = np.where(leaf, ids, tree.children_right + offset).astype(np.int32)
+            if tree.n_outputs > 1 and tree.value.shape[2] == 1:
+                value = np.clip(tree.value[:, :, 0], 0, None).astype(np.float64)
+            else:
+                value = tree.value[:, 0, :].astype(np.float64)
+            value /= value.sum(axis=1, keepdims=True)
+
+            features.append(np.where(leaf, 0, tree.feature).astype(np.int32))
+            thresholds.append(tree.threshold.astype(np.float64))
+            lefts.append(left)
+            rights.append(right)
+            values.append(value)
+            roots.append(offset)
+            max_depth = max(max_depth, tree.max_depth)
+            offset += n
+        return cls(
+            np.concatenate(features), np.concatenate(thresholds),
+            np.concatenate(lefts), np.concatenate(rights),
+            np.concatenate(values), np.asarray(roots, dtype=np.int32),
+            max_depth, np.asarray(model.classes_),
+        )
+
+    def apply(self, X, roots=None):
+        """Return the leaf index reached in every tree (or just ``roots``), shape (n_rows, n_trees)."""
+        X = np.asarray(X, dtype=np.float32)
+        roots = self.roots if roots is None else roots
+        rows = np.arange(len(X))[:, None]
+        node = np.broadcast_to(roots, (len(X), len(roots)))
+        for _ in range(self.max_depth):
+            # Same comparison as sklearn: float32 input against float64 threshold
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+            if self.is_leaf[node].all():
+                break
+        return node
+
+    def predict_proba(self, X):
+        """Average the leaf class distributions over all trees, like predict_proba."""
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X[None, :]
+        out = np.empty((len(X), self.n_classes), dtype=np.float64)
+        for start in range(0, len(X), ROW_BLOCK):
+            leaves = self.apply(X[start:start + ROW_BLOCK])
+            out[start:start + ROW_BLOCK] = self.value[leaves].mean(axis=1)
+        return out
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+    def contributions(self, X, classes=None):
+        """Per-feature path attributions (Saabas): ``(bias, contributions)``.
+
+        Walking each tree from the root, the change in the node class
+        distribution at every split is credited to the split's feature, and
+        the credits are averaged over the trees. ``bias`` (n_classes,) is the
+        mean root distribution. ``contributions`` has shape (n_rows,
+        n_features, n_classes), and ``bias + contributions.sum(axis=1)``
+        equals ``predict_proba(X)``. ``classes`` restricts both to those
+        class indices.
+        """
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X[None, :]
+        classes = np.arange(self.n_classes) if classes is None else np.asarray(classes)
+        n_rows, n_features = X.shape
+        n_classes = len(classes)
+        out = np.empty((n_rows, n_features, n_classes), dtype=np.float64)
+        for start in range(0, n_rows, ROW_BLOCK):
+            block = X[start:start + ROW_BLOCK]
+            rows = np.arange(len(block))[:, None]
+            node = np.broadcast_to(self.roots, (len(block), self.n_trees))
+            sums = np.zeros(len(block) * n_features * n_classes, dtype=np.float64)
+            for _ in range(self.max_depth):
+                feature = self.feature[node]
+                go_left = block[rows, feature] <= self.threshold[node]
+                child = np.where(go_left, self.left[node], self.right[node])
+                # Only trees still at a split move; leaves point at themselves
+                live = ~self.is_leaf[node]
+                parent, child_live = node[live][:, None], child[live][:, None]
+                delta = self.value[child_live, classes] - self.value[parent, classes]
+                slot = (np.broadcast_to(rows, node.shape)[live] * n_features + feature[live]) * n_classes
+                sums += np.bincount((slot[:, None] + np.arange(n_classes)).ravel(), weights=delta.ravel(),
+                                    minlength=len(sums))
+                node = child
+                if self.is_leaf[node].all():
+                    break
+            out[start:start + ROW_BLOCK] = sums.reshape(len(block), n_features, n_classes) / self.n_trees
+        bias = self.value[self.roots[:, None], classes].mean(axis=0)
+        return bias, out
+
+    def predict_top_k_early(self, X, k=1, chunk=EARLY_EXIT_CHUNK, tolerance=0.0):
+        """Top-``k`` classes, evaluating trees in chunks until each row's top-k order is settled.
+
+        Each remaining tree can move the gap between two classes' summed
+        probabilities by at most 1. A row stops when every adjacent gap in its
+        top k, and the gap from the k-th class to the best class outside, is
+        larger than the trees left. With ``tolerance=0`` the result equals
+        ``top_k(predict_proba(X), k)``, ties included. A positive
+        ``tolerance`` (in probability units) also stops when the only possible
+        reorderings are between classes whose final probabilities differ by
+        less than it.
+
+        Only ``k=1`` has trees to skip on the career forest: most rows settle
+        their best class after about three quarters of the trees, but almost
+        none settle a top 3 before the last tree. It is an experiment measured
+        by ``--early-exit`` below, slower than sklearn's ``predict_proba`` for
+        large batches.
+
+        Returns ``(indices, partial probabilities, trees used)``. The partial
+        probabilities average only the trees each row used, so they differ
+        from ``predict_proba`` for rows that stopped early.
+        """
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X[None, :]
+        k = min(k, self.n_classes)
+        sums = np.zeros((len(X), self.n_classes), dtype=np.float64)
+        used = np.zeros(len(X), dtype=np.int64)
+        active = np.arange(len(X))
+        slack = tolerance * self.n_trees
+        for start in range(0, self.n_trees, chunk):
+            stop = min(start + chunk, self.n_trees)
+            roots = self.roots[start:stop]
+            for b in range(0, len(active), ROW_BLOCK):
+                rows = active[b:b + ROW_BLOCK]
+                sums[rows] += self.value[self.apply(X[rows], roots)].sum(axis=1)
+            used[active] = stop
+            remaining = self.n_trees - stop
+            if remaining == 0:
+                break
+            part = sums[active]
+            ranked = np.take_along_axis(part, rank_classes(part / stop, k + 1), axis=1)
+            gaps = ranked[:, :-1] - ranked[:, 1:]
+            settled = (gaps > remaining - slack).all(axis=1) if k < self.n_classes else \
+                (gaps[:, :k - 1] > remaining - slack).all(axis=1)
+            active = active[~settled]
+            if len(active) == 0:
+                break
+        partial = sums / used[:, None]
+        return rank_classes(partial, k), partial, used
+
+
+class ProbabilityStudent:
+    """Regressor fitted on a teacher's class probabilities, behaving like the forest classifier.
+
+    Written by ``distill.py``; ``FlatForest.from_sklearn`` reads its ``estimators_``.
+    """
+
+    def __init__(self, regressor, n_classes):
+        self.regressor = regressor
+        self.classes_ = np.arange(n_classes)
+
+    @property
+    def estimators_(self):
+        return getattr(self.regressor, "estimators_", [self.regressor])
+
+    def predict_proba(self, X):
+        probs = np.clip(self.regressor.predict(X), 0, None)
+        return probs / probs.sum(axis=1, keepdims=True)
+
+    def predict(self, X):
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+def rank_classes(probs, k):
+    """Indices of the ``k`` largest values per row, best first.
+
+    Values equal to ``TIE_DECIMALS`` places count as tied, and ties go to the
+    lower class index. Summing the same trees in a different order changes
+    the last bits, so this keeps exact ties in the same order in every path.
+    """
+    return np.argsort(-np.round(probs, TIE_DECIMALS), axis=1, kind="stable")[:, :k]
+
+
+def top_k(probs, k):
+    """Return (indices, probabilities) of the ``k`` most likely classes per row, best first."""
+    idx = rank_classes(probs, min(k, probs.shape[1]))
+    return idx, np.take_along_axis(probs, idx, axis=1)
+
+
+def check_parity(model, X, atol=1e-9):
+    """Return the largest absolute difference between FlatForest and sklearn on ``X``."""
+    flat = FlatForest.from_sklearn(model)
+    diff = np.abs(flat.predict_proba(X) - model.predict_proba(X)).max()
+    if diff > atol:
+        raise AssertionError(f"FlatForest differs from predict_proba by {diff:.3g}")
+    return diff
+
+
+def main():
+    import warnings
+
+    from dataset_generator import generate_btech_career_data
+    from feature_encoder import FeatureEncoder
+
+    warnings.filterwarnings("ignore", message="X does not have valid feature names")
+    parser = argparse.ArgumentParser(description="Check FlatForest against sklearn and time both.")
+    parser.add_argument("--model", default="career_suggestion.pkl", help="Pickled model artifact")
+    parser.add_argument("--rows", type=int, default=5000, help="Generated rows for the parity check")
+    parser.add_argument("--early-exit", action="store_true",
+                        help="Also report trees used, speedup and top-k agreement of early exit")
+    parser.add_argument("--tolerance", type=float, default=0.0, help="Early-exit tolerance")
+    args = parser.parse_args()
+
+    with open(args.model, "rb") as f:
+        saved_objects = pickle.load(f)
+    model = saved_objects["model"]
+    encoder = FeatureEncoder(saved_objects["features"])
+    X = encoder.encode_frame(generate_btech_career_data(args.rows, seed=0))
+
+    print(f"max |FlatForest - predict_proba| = {check_parity(model, X):.3g}")
+    flat = FlatForest.from_sklearn(model)
+    for n in (1, 64, len(X)):
+        batch = X[:n]
+        number = max(1, 2000 // n)
+        sk = timeit.timeit(lambda: model.predict_proba(batch), number=number) / number * 1e3
+        ff = timeit.timeit(lambda: flat.predict_proba(batch), number=number) / number * 1e3
+        print(f"batch {n:>6}: sklearn {sk:8.2f} ms   FlatForest {ff:8.2f} ms")
+
+    # Path attributions must add up to the probabilities
+    bias, contributions = flat.contributions(X[:500])
+    gap = np.abs(bias + contributions.sum(axis=1) - flat.predict_proba(X[:500])).max()
+    print(f"max |bias + contributions - predict_proba| = {gap:.3g}")
+
+    if args.early_exit:
+        # Held-out rows: a different seed from the parity sample
+        X = encoder.encode_frame(generate_btech_career_data(args.rows, seed=1))
+        start = timeit.default_timer()
+        model.predict_proba(X)
+        sklearn_s = timeit.default_timer() - start
+        start = timeit.default_timer()
+        probs = flat.predict_proba(X)
+        full_s = timeit.default_timer() - start
+        for k in (1, 3):
+            start = timeit.default_timer()
+            idx, partial, used = flat.predict_top_k_early(X, k, tolerance=args.tolerance)
+            early_s = timeit.default_timer() - start
+            same = (idx == top_k(probs, k)[0]).all(axis=1).mean()
+            drift = np.abs(np.take_along_axis(partial - probs, idx, axis=1)).max()
+            print(f"early exit top-{k}: {used.mean():.1f} / {flat.n_trees} trees on average, "
+                  f"{full_s / early_s:.2f}x FlatForest, {sklearn_s / early_s:.2f}x sklearn, "
+                  f"same top-{k} on {same:.2%} of {len(X)} rows, "
+                  f"partial probabilities off by up to {drift:.3f}")
+
+if __name__ == "__main__":
+    main()
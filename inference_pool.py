@@ -0,0 +1,306 @@
+"""Pool of inference worker processes shared by every Streamlit session.
+
+Streamlit runs each session's script in a thread of one process, so every
+model call competes for the same GIL. This pool moves scoring into worker
+processes. Each worker memory-maps the same ``.cfa`` artifact, so the forest
+is shared through the page cache rather than copied. Callers send encoded
+float32 batches over a per-worker pipe and get probabilities back.
+
+    CAREER_POOL_WORKERS=4 CAREER_POOL_QUEUE_DEPTH=64 streamlit run career_suggestion.py
+    python inference_pool.py --model career_suggestion.cfa --workers 4   # throughput check
+"""
+
+import argparse
+import atexit
+import multiprocessing as mp
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import types
+from collections import deque
+from contextlib import contextmanager
+
+DEFAULT_QUEUE_DEPTH = 64
+# Longest wait for a free worker (e.g. while dead ones are being replaced)
+WORKER_WAIT_SECONDS = 30
+# Recent calls kept per worker for the latency percentiles
+LATENCY_WINDOW = 1024
+
+
+class PoolBusy(RuntimeError):
+    """Raised when more than ``queue_depth`` requests are already waiting for a worker."""
+
+
+def _worker_main(conn, artifact_path):
+    from model_artifact import open_artifact
+
+    model = open_artifact(artifact_path)[0]
+    conn.send("ready")
+    while True:
+        try:
+            X = conn.recv()
+        except EOFError:
+            return
+        if X is None:
+            return
+        start = time.perf_counter()
+        try:
+            probs = model.predict_proba(X)
+            conn.send((probs, time.perf_counter() - start, None))
+        except Exception as e:
+            conn.send((None, time.perf_counter() - start, repr(e)))
+
+
+@contextmanager
+def _bare_main():
+    # Streamlit installs the page script as __main__, and spawn would re-run it
+    # in every worker; workers only need this module, so hide it while starting.
+    # Run as a script, this module is __main__ itself and must stay visible.
+    if __name__ == "__main__":
+        yield
+        return
+    main = sys.modules.get("__main__")
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main
+
+
+class _WorkerStats:
+    def __init__(self):
+        self.calls = 0
+        self.rows = 0
+        self.latencies_ms = deque(maxlen=LATENCY_WINDOW)
+
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+class InferencePool:
+    def __init__(self, model_path, workers=2, queue_depth=DEFAULT_QUEUE_DEPTH):
+        self.model_path = model_path
+        self.n_workers = workers
+        self.queue_depth = queue_depth
+        self._tmpdir = None
+        self._artifact = None
+        self._closed = False
+        self._processes = []
+        self._conns = []
+        self._idle = queue.Queue()
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+        self._lock = threading.Lock()
+        self._stats = [_WorkerStats() for _ in range(workers)]
+        self._in_flight = 0
+        self.rejected = 0
+        self.respawns = 0
+        # Model generation the workers serve (set by whoever tracks hot reloads; None = any)
+        self.generation = None
+
+    def _artifact_path(self):
+        if self.model_path.endswith(".cfa"):
+            return self.model_path
+        # Workers need a mappable artifact; export the pickle once for them
+        from model_artifact import export_artifact
+
+        self._tmpdir = tempfile.mkdtemp(prefix="career-pool-")
+        return export_artifact(self.model_path, os.path.join(self._tmpdir, "model.cfa"))
+
+    def _spawn(self, i):
+        # spawn, not fork: the parent is a multi-threaded Streamlit server
+        ctx = mp.get_context("spawn")
+        parent, child = ctx.Pipe()
+        with _bare_main():
+            process = ctx.Process(target=_worker_main, args=(child, self._artifact),
+                                  name=f"career-inference-{i}", daemon=True)
+            process.start()
+        child.close()
+        return process, parent
+
+    def start(self):
+        # Registered first, so the exported artifact and any started workers go even if startup fails
+        atexit.register(self.close)
+        self._artifact = self._artifact_path()
+        for i in range(self.n_workers):
+            process, conn = self._spawn(i)
+            self._processes.append(process)
+            self._conns.append(conn)
+        for i, conn in enumerate(self._conns):
+            conn.recv()
+            self._idle.put(i)
+        return self
+
+    def _replace(self, worker):
+        # A worker died: start a replacement in the background and hand it out once it is ready
+        def respawn():
+            try:
+                process, conn = self._spawn(worker)
+                conn.recv()
+            except (EOFError, OSError):
+                return
+            with self._lock:
+                if self._closed:
+                    conn.send(None)
+                    return
+                self._processes[worker], self._conns[worker] = process, conn
+            self._idle.put(worker)
+
+        with self._lock:
+            self.respawns += 1
+        self._conns[worker].close()
+        threading.Thread(target=respawn, name=f"career-inference-respawn-{worker}", daemon=True).start()
+
+    def predict_proba(self, X):
+        """Score an encoded batch on the next free worker; raises PoolBusy when the queue is full."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PoolBusy(f"inference pool queue is full ({self.queue_depth} waiting)")
+        try:
+            with self._lock:
+                self._in_flight += 1
+            try:
+                worker = self._idle.get(timeout=WORKER_WAIT_SECONDS)
+            except queue.Empty:
+                raise RuntimeError(f"no inference worker free after {WORKER_WAIT_SECONDS}s") from None
+            start = time.perf_counter()
+            try:
+                conn = self._conns[worker]
+                conn.send(X)
+                probs, _, error = conn.recv()
+            except (EOFError, OSError):
+                # Not put back: callers fall back to in-process scoring until it is replaced
+                self._replace(worker)
+                raise
+            except BaseException:
+                self._idle.put(worker)
+                raise
+            self._idle.put(worker)
+            elapsed_ms = (time.perf_counter() - start) * 1e3
+            with self._lock:
+                stats = self._stats[worker]
+                stats.calls += 1
+                stats.rows += len(X)
+                stats.latencies_ms.append(elapsed_ms)
+            if error is not None:
+                raise RuntimeError(f"inference worker {worker} failed: {error}")
+            return probs
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    def stats(self):
+        with self._lock:
+            workers = [
+                {
+                    "worker": i,
+                    "alive": self._processes[i].is_alive() if i < len(self._processes) else False,
+                    "calls": s.calls,
+                    "rows": s.rows,
+                    "p50_ms": _percentile(s.latencies_ms, 50),
+                    "p95_ms": _percentile(s.latencies_ms, 95),
+                }
+                for i, s in enumerate(self._stats)
+            ]
+            in_flight = self._in_flight
+        return {
+            "workers": self.n_workers,
+            "queue_depth": self.queue_depth,
+            "in_flight": in_flight,
+            "waiting": max(in_flight - self.n_workers, 0),
+            "rejected": self.rejected,
+            "respawns": self.respawns,
+            "per_worker": workers,
+        }
+
+    def close(self, drain_timeout=0):
+        """Stop the workers, first waiting up to ``drain_timeout`` seconds for requests in flight."""
+        deadline = time.monotonic() + drain_timeout
+        while self._in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        atexit.unregister(self.close)
+        with self._lock:
+            self._closed = True
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+        self._processes, self._conns = [], []
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+
+def pool_from_env(model_path):
+    """Start a pool sized by CAREER_POOL_WORKERS / CAREER_POOL_QUEUE_DEPTH, or None if disabled."""
+    workers = int(os.environ.get("CAREER_POOL_WORKERS", 0))
+    if workers <= 0:
+        return None
+    depth = int(os.environ.get("CAREER_POOL_QUEUE_DEPTH", DEFAULT_QUEUE_DEPTH))
+    return InferencePool(model_path, workers, depth).start()
+
+
+def main():
+    import numpy as np
+
+    from dataset_generator import generate_btech_career_data
+    from model_loader import get_model
+
+    parser = argparse.ArgumentParser(description="Compare in-process scoring with the inference pool.")
+    parser.add_argument("--model", default="career_suggestion.cfa", help="Model artifact (.cfa or .pkl)")
+    parser.add_argument("--workers", type=int, default=mp.cpu_count(), help="Worker processes")
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent client threads")
+    parser.add_argument("--requests", type=int, default=2000, help="Single-row requests to send")
+    args = parser.parse_args()
+
+    loaded = get_model(args.model)
+    X = loaded.encoder.encode_frame(generate_btech_career_data(args.requests, seed=0))
+
+    def run(score):
+        rows = iter(range(len(X)))
+        lock = threading.Lock()
+
+        def client():
+            while True:
+                with lock:
+                    i = next(rows, None)
+                if i is None:
+                    return
+                score(X[i:i + 1])
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=client) for _ in range(args.threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return len(X) / (time.perf_counter() - start)
+
+    in_process = run(loaded.model.predict_proba)
+    pool = InferencePool(args.model, args.workers, queue_depth=args.threads)
+    try:
+        pool.start()
+        pooled = run(pool.predict_proba)
+        diff = np.abs(pool.predict_proba(X[:256]) - loaded.model.predict_proba(X[:256])).max()
+        print(f"in-process: {in_process:8,.0f} rows/s")
+        print(f"pool x{args.workers}:    {pooled:8,.0f} rows/s   (max diff {diff:.1g})")
+        for w in pool.stats()["per_worker"]:
+            print(f"  worker {w['worker']}: {w['calls']} calls, p50 {w['p50_ms']:.2f} ms, p95 {w['p95_ms']:.2f} ms")
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Opt-in per-stage latency instrumentation for the prediction path.
+
+Set ``CAREER_METRICS=1`` to record how long each stage of a request takes:
+the script rerun, encoding, cache lookup, ``predict_proba``, top-k and
+label lookup, and result rendering. Each stage keeps a rolling window of
+recent timings, summarised as percentiles. They can be exported as
+Prometheus text (``/metrics`` on the scoring service) or as one JSON log
+line, and are shown in the app's sidebar admin panel.
+
+When disabled, ``stage()`` returns one shared no-op context manager, so an
+instrumented block costs a function call and a ``with``.
+
+    with stage("predict_proba"):
+        probs = model.predict_proba(X)
+
+Standard library only, so ``career_engine`` can import it within its import budget.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+# Recent timings kept per stage for the percentiles
+WINDOW = 2048
+QUANTILES = (0.5, 0.9, 0.99)
+
+_NOOP = nullcontext()
+LOGGER_NAME = "career.latency"
+
+
+def _percentile(ordered, q):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class _StageStats:
+    __slots__ = ("recent", "count", "total_ms")
+
+    def __init__(self):
+        self.recent = deque(maxlen=WINDOW)
+        self.count = 0
+        self.total_ms = 0.0
+
+
+class _Timer:
+    __slots__ = ("recorder", "name", "start")
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder.observe(self.name, (time.perf_counter() - self.start) * 1e3)
+        return False
+
+
+class LatencyRecorder:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name):
+        """Context manager timing one stage (a shared no-op while disabled)."""
+        if not self.enabled:
+            return _NOOP
+        return _Timer(self, name)
+
+    def observe(self, name, ms):
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = _StageStats()
+            stats.recent.append(ms)
+            stats.count += 1
+            stats.total_ms += ms
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+
+    def summary(self):
+        """``{stage: {count, sum_ms, p50_ms, p90_ms, p99_ms, max_ms}}`` over each rolling window."""
+        with self._lock:
+            snapshot = {name: (sorted(s.recent), s.count, s.total_ms) for name, s in self._stages.items()}
+        out = {}
+        for name, (ordered, count, total_ms) in snapshot.items():
+            row = {"count": count, "sum_ms": total_ms}
+            for q in QUANTILES:
+                row[f"p{int(q * 100)}_ms"] = _percentile(ordered, q)
+            row["max_ms"] = ordered[-1] if ordered else 0.0
+            out[name] = row
+        return out
+
+    def prometheus_text(self):
+        """Prometheus text exposition: one summary metric labelled by stage."""
+        lines = [
+            "# HELP career_stage_latency_ms Latency of each prediction stage in milliseconds.",
+            "# TYPE career_stage_latency_ms summary",
+        ]
+        for name, row in sorted(self.summary().items()):
+            for q in QUANTILES:
+                lines.append(f'career_stage_latency_ms{{stage="{name}",quantile="{q}"}} '
+                             f'{row[f"p{int(q * 100)}_ms"]:.6f}')
+            lines.append(f'career_stage_latency_ms_sum{{stage="{name}"}} {row["sum_ms"]:.6f}')
+            lines.append(f'career_stage_latency_ms_count{{stage="{name}"}} {row["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def log_summary(self, log=None):
+        """Emit the summary as one structured JSON log line."""
+        if log is None:
+            # logging is imported here, not at the top, to keep the engine's import cheap
+            import logging
+
+            log = logging.getLogger(LOGGER_NAME)
+        log.info(json.dumps({"event": "stage_latency", "stages": self.summary()}, sort_keys=True))
+
+
+recorder = LatencyRecorder(enabled=os.environ.get("CAREER_METRICS", "") not in ("", "0", "false"))
+
+
+def stage(name):
+    return recorder.stage(name)
+
+
+def overhead_ns(iterations=200_000):
+    """Cost of one disabled ``with stage(...)`` block, in nanoseconds."""
+    probe = LatencyRecorder(enabled=False)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with probe.stage("probe"):
+            pass
+    return (time.perf_counter() - start) / iterations * 1e9
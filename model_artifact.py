@@ -0,0 +1,156 @@
+"""Memory-mappable on-disk format for the career model.
+
+Layout of a ``.cfa`` file::
+
+    b"CAREERFA"  uint32 version  uint32 header_len  header JSON  padding
+    array data, each array starting on a 64-byte boundary
+
+The JSON header records the dtype, shape and offset of every FlatForest node
+array together with the class labels and the feature schema. Opening the
+file memory-maps it, so startup does no parsing beyond the header and
+several processes share the same page-cache pages.
+
+    python model_artifact.py career_suggestion.pkl career_suggestion.cfa
+"""
+
+import argparse
+import json
+import os
+import pickle
+import struct
+
+import numpy as np
+
+from forest_engine import FlatForest
+
+MAGIC = b"CAREERFA"
+VERSION = 1
+ALIGNMENT = 64
+ARRAYS = ("feature", "threshold", "left", "right", "value", "roots")
+_PREFIX = struct.Struct("<8sII")
+
+
+class ClassLabels:
+    """Stand-in for the fitted LabelEncoder: only ``classes_`` and ``inverse_transform``."""
+
+    def __init__(self, classes):
+        self.classes_ = np.asarray(classes)
+
+    def inverse_transform(self, y):
+        return self.classes_[np.asarray(y, dtype=np.intp)]
+
+
+def _align(n):
+    return (n + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def write_artifact(path, flat, classes, feature_names, source=None):
+    """Write ``flat`` plus its label/feature schema to ``path`` atomically."""
+    arrays = {name: np.ascontiguousarray(getattr(flat, name)) for name in ARRAYS}
+    header = {
+        "max_depth": flat.max_depth,
+        "model_classes": np.asarray(flat.classes_).tolist(),
+        "classes": [str(c) for c in classes],
+        "features": list(feature_names),
+        "source": source or {},
+        "arrays": {},
+    }
+    # Offsets depend on the header size, so lay out twice until it is stable
+    data_start = 0
+    while True:
+        offset = data_start
+        for name, arr in arrays.items():
+            header["arrays"][name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset}
+            offset = _align(offset + arr.nbytes)
+        header_bytes = json.dumps(header).encode("utf-8")
+        needed = _align(_PREFIX.size + len(header_bytes))
+        if needed == data_start:
+            break
+        data_start = needed
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, arr in arrays.items():
+            f.seek(header["arrays"][name]["offset"])
+            f.write(arr.tobytes())
+        f.truncate(offset)
+    os.replace(tmp_path, path)
+
+
+def export_artifact(pickle_path, out_path, extra_source=None):
+    """Convert the notebook's pickle into a memory-mappable artifact.
+
+    ``extra_source`` adds keys to the header's ``source`` record next to the
+    pickle's name, mtime and size.
+    """
+    with open(pickle_path, "rb") as f:
+        saved_objects = pickle.load(f)
+    flat = FlatForest.from_sklearn(saved_objects["model"])
+    st = os.stat(pickle_path)
+    source = {**(extra_source or {}), "path": os.path.basename(pickle_path), "mtime_ns": st.st_mtime_ns,
+              "size": st.st_size}
+    write_artifact(out_path, flat, saved_objects["label_encoder"].classes_, saved_objects["features"], source)
+    return out_path
+
+
+def read_header(path):
+    """The JSON header of the artifact at ``path``, without mapping its arrays."""
+    with open(path, "rb") as f:
+        magic, version, header_len = _PREFIX.unpack(f.read(_PREFIX.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a career model artifact")
+        if version != VERSION:
+            raise ValueError(f"Unsupported artifact version {version} in {path}")
+        return json.loads(f.read(header_len).decode("utf-8"))
+
+
+def stale_source(path):
+    """Path of the pickle ``path`` was exported from if that pickle has changed since, else None.
+
+    The header records the source's (mtime, size) at export time; a missing
+    source, or an artifact written without one, counts as current.
+    """
+    source = read_header(path).get("source") or {}
+    if not source.get("path"):
+        return None
+    pickle_path = os.path.join(os.path.dirname(path), source["path"])
+    try:
+        st = os.stat(pickle_path)
+    except OSError:
+        return None
+    if (st.st_mtime_ns, st.st_size) != (source.get("mtime_ns"), source.get("size")):
+        return pickle_path
+    return None
+
+
+def open_artifact(path):
+    """Memory-map ``path`` and return ``(FlatForest, ClassLabels, feature_names, header)``."""
+    header = read_header(path)
+    mm = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays = {}
+    for name in ARRAYS:
+        spec = header["arrays"][name]
+        arrays[name] = np.ndarray(
+            shape=tuple(spec["shape"]), dtype=np.dtype(spec["dtype"]), buffer=mm, offset=spec["offset"]
+        )
+    flat = FlatForest(
+        arrays["feature"], arrays["threshold"], arrays["left"], arrays["right"], arrays["value"],
+        arrays["roots"], header["max_depth"], np.asarray(header["model_classes"]),
+    )
+    return flat, ClassLabels(header["classes"]), header["features"], header
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the pickled model to a memory-mappable artifact.")
+    parser.add_argument("pickle", nargs="?", default="career_suggestion.pkl", help="Pickled model artifact")
+    parser.add_argument("out", nargs="?", default="career_suggestion.cfa", help="Output .cfa path")
+    args = parser.parse_args()
+
+    export_artifact(args.pickle, args.out)
+    print(f"Wrote {args.out} ({os.path.getsize(args.out) / 2**20:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
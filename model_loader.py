@@ -0,0 +1,484 @@
+"""Process-wide model loading for the career model.
+
+``st.cache_data`` pickles its cached value and hands every caller a freshly
+deserialized copy, so each rerun paid for a large unpickle and a duplicate
+forest. This module keeps exactly one read-only model per process and
+artifact path, shared by every session, and records how long the load took
+and how much memory it used.
+
+``watch(path)`` reloads a retrained artifact without a restart. A background
+thread checks the file's (mtime, size) and then its content hash. It loads a
+changed file off the request path and checks that the new model takes the
+same inputs, then swaps it in. Callers that already hold the old
+``LoadedModel`` finish on it, and it is freed once the last of them is done.
+When a ``.cfa`` export is being served, the pickle it was exported from is
+watched too: a retrained pickle is re-exported next to it and then reloaded.
+
+    python model_loader.py --model career_suggestion.pkl                # cold vs warm benchmark
+    python model_loader.py --model career_suggestion.pkl --reload-check  # hot reload under load
+"""
+
+import argparse
+import gc
+import hashlib
+import itertools
+import os
+import pickle
+import threading
+import time
+import weakref
+
+import numpy as np
+
+from career_schema import INTEREST_COLUMN, INTEREST_PREFIX, INTERESTS, NUMERIC_COLUMNS
+from feature_encoder import FeatureEncoder
+from forest_engine import FlatForest
+from model_artifact import export_artifact, open_artifact, stale_source, write_artifact
+
+DEFAULT_MODEL_PATH = "career_suggestion.pkl"
+MAPPED_MODEL_PATH = "career_suggestion.cfa"
+
+DEFAULT_RELOAD_INTERVAL = 5.0
+
+_models = {}
+_watchers = {}
+_lock = threading.Lock()
+# Increases with every load, so caches can tell a newer model from an older one
+_generations = itertools.count(1)
+
+
+class LoadedModel:
+    def __init__(self, path, model, label_encoder, feature_names, load_seconds, memory_bytes, token=None):
+        self.path = path
+        self.model = model
+        self.label_encoder = label_encoder
+        self.feature_names = list(feature_names)
+        self.classes = np.asarray(label_encoder.classes_)
+        self.encoder = FeatureEncoder(self.feature_names)
+        self.load_seconds = load_seconds
+        self.memory_bytes = memory_bytes
+        # (mtime_ns, size) of the file this was loaded from; the content hash is filled in by a watcher
+        self.token = token
+        self.digest = None
+        self.generation = next(_generations)
+        self.loaded_at = time.time()
+
+    @property
+    def version(self):
+        """``<file>@<mtime>-<size>`` of the artifact this model was loaded from."""
+        if self.token is None:
+            return None
+        return f"{os.path.basename(self.path)}@{self.token[0]:x}-{self.token[1]:x}"
+
+
+def artifact_token(path):
+    """Cheap change detector for a model file: (mtime_ns, size), or None if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _rss_bytes():
+    # Resident set size from /proc where available, else peak RSS from getrusage
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _freeze(flat):
+    for name in ("feature", "threshold", "left", "right", "value", "roots", "is_leaf"):
+        getattr(flat, name).setflags(write=False)
+
+
+def default_model_path():
+    """Prefer the memory-mapped artifact when it exists and is current, else the notebook's pickle.
+
+    A ``.cfa`` exported from an older ``career_suggestion.pkl`` is skipped, so
+    a retrained pickle is never shadowed by a stale export.
+    """
+    if not os.path.exists(MAPPED_MODEL_PATH):
+        return DEFAULT_MODEL_PATH
+    try:
+        if stale_source(MAPPED_MODEL_PATH) is not None:
+            return DEFAULT_MODEL_PATH
+    except (OSError, ValueError):
+        return DEFAULT_MODEL_PATH
+    return MAPPED_MODEL_PATH
+
+
+def load_artifact(path=DEFAULT_MODEL_PATH):
+    """Load ``path`` (pickle or memory-mapped ``.cfa``) into read-only flat arrays (uncached)."""
+    rss_before = _rss_bytes()
+    token = artifact_token(path)
+    start = time.perf_counter()
+    if path.endswith(".cfa"):
+        model, label_encoder, feature_names, _ = open_artifact(path)
+        _freeze(model)
+        return LoadedModel(
+            path, model, label_encoder, feature_names,
+            time.perf_counter() - start, max(_rss_bytes() - rss_before, 0), token,
+        )
+    with open(path, "rb") as f:
+        saved_objects = pickle.load(f)
+    model = FlatForest.from_sklearn(saved_objects["model"])
+    _freeze(model)
+    # Drop the sklearn estimators; only the flat arrays are kept alive
+    del saved_objects["model"]
+    load_seconds = time.perf_counter() - start
+    return LoadedModel(
+        path, model, saved_objects["label_encoder"], saved_objects["features"],
+        load_seconds, max(_rss_bytes() - rss_before, 0), token,
+    )
+
+
+def get_model(path=DEFAULT_MODEL_PATH):
+    """Return the shared model for ``path``, loading it on first use."""
+    loaded = _models.get(path)
+    if loaded is not None:
+        return loaded
+    with _lock:
+        if path not in _models:
+            _models[path] = load_artifact(path)
+        return _models[path]
+
+
+def preload(path=DEFAULT_MODEL_PATH):
+    """Start loading ``path`` in a background thread so it is ready before the first request."""
+    if path in _models or not os.path.exists(path):
+        return None
+    thread = threading.Thread(target=get_model, args=(path,), name="model-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-256 of the file at ``path`` (hex)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def check_compatible(current, new):
+    """Raise ValueError unless ``new`` takes the same inputs as ``current`` and scores a profile.
+
+    Column order may differ, since every LoadedModel builds its own encoder.
+    """
+    known = set(NUMERIC_COLUMNS) | {INTEREST_PREFIX + interest for interest in INTERESTS}
+    unknown = sorted(set(new.feature_names) - known)
+    if unknown:
+        raise ValueError(f"new model expects inputs the app does not collect: {unknown}")
+    if set(new.feature_names) != set(current.feature_names):
+        added = sorted(set(new.feature_names) - set(current.feature_names))
+        removed = sorted(set(current.feature_names) - set(new.feature_names))
+        raise ValueError(f"new model's features differ: added {added}, removed {removed}")
+    profile = {name: 5 for name in NUMERIC_COLUMNS}
+    profile[INTEREST_COLUMN] = INTERESTS[0]
+    probs = new.model.predict_proba(new.encoder.encode(profile))
+    if probs.shape != (1, len(new.classes)) or not np.isfinite(probs).all() or abs(probs.sum() - 1) > 1e-6:
+        raise ValueError(f"new model returned invalid probabilities {probs.shape} for a test profile")
+
+
+class ModelWatcher:
+    """Reloads ``path`` in the background when its contents change (see ``watch``)."""
+
+    def __init__(self, path, interval=DEFAULT_RELOAD_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.reloads = 0
+        self.last_checked = None
+        self.last_error = None
+        self._rejected_token = None
+        # (mtime_ns, size) of a source pickle whose export was rejected
+        self._rejected_source = None
+        self._callbacks = []
+        self._retired = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def on_swap(self, callback):
+        """Call ``callback(old, new)`` after each swap (from the watcher thread)."""
+        self._callbacks.append(callback)
+
+    def _hash_current(self, current):
+        # Hash only while the file on disk is still the one the model came from
+        if current.digest is None and artifact_token(self.path) == current.token:
+            digest = file_digest(self.path)
+            if artifact_token(self.path) == current.token:
+                current.digest = digest
+
+    def _refresh_export(self, current):
+        # Re-export a .cfa whose source pickle was retrained; the swap below then loads it
+        source = stale_source(self.path)
+        if source is None:
+            return
+        token = artifact_token(source)
+        if token == self._rejected_source:
+            return
+        staged = os.path.splitext(self.path)[0] + ".staging.cfa"
+        try:
+            export_artifact(source, staged)
+            if artifact_token(source) != token:
+                # Still being written; try again on the next check
+                return
+            check_compatible(current, load_artifact(staged))
+            os.replace(staged, self.path)
+        except Exception as e:
+            # Unreadable or incompatible; retried once the pickle changes again
+            self._rejected_source = token
+            self.last_error = str(e) if isinstance(e, ValueError) else f"{type(e).__name__}: {e}"
+        finally:
+            if os.path.exists(staged):
+                os.remove(staged)
+
+    def check(self):
+        """Reload now if the artifact changed; returns True when a new model was swapped in."""
+        self.last_checked = time.time()
+        current = _models.get(self.path)
+        if current is None:
+            return False
+        if self.path.endswith(".cfa"):
+            self._refresh_export(current)
+        self._hash_current(current)
+        token = artifact_token(self.path)
+        if token is None or token == current.token or token == self._rejected_token:
+            return False
+        digest = file_digest(self.path)
+        if digest == current.digest:
+            # Touched or copied over with identical bytes: nothing to reload
+            current.token = token
+            return False
+        new = load_artifact(self.path)
+        if new.token != token or artifact_token(self.path) != token:
+            # Still being written; try again on the next check
+            return False
+        new.digest = digest
+        try:
+            check_compatible(current, new)
+        except ValueError as e:
+            self._rejected_token = token
+            self.last_error = str(e)
+            return False
+        with _lock:
+            _models[self.path] = new
+        self.reloads += 1
+        self.last_error = None
+        self._retired = [ref for ref in self._retired if ref() is not None]
+        self._retired.append(weakref.ref(current))
+        for callback in self._callbacks:
+            callback(current, new)
+        # Requests still running keep their reference; the old arrays go when the last one finishes
+        del current
+        gc.collect()
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                # Keep serving the current model; a broken file is retried once it changes again
+                self._rejected_token = artifact_token(self.path)
+                self.last_error = f"{type(e).__name__}: {e}"
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="model-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5)
+
+    def status(self):
+        current = _models.get(self.path)
+        return {
+            "version": current.version if current else None,
+            "digest": current.digest if current else None,
+            "loaded_at": current.loaded_at if current else None,
+            "reloads": self.reloads,
+            "last_checked": self.last_checked,
+            "last_error": self.last_error,
+            "retired_in_memory": sum(ref() is not None for ref in self._retired),
+        }
+
+
+def watch(path=DEFAULT_MODEL_PATH, interval=DEFAULT_RELOAD_INTERVAL):
+    """Start (once per path) and return the background watcher that hot-reloads ``path``."""
+    with _lock:
+        watcher = _watchers.get(path)
+        if watcher is None:
+            watcher = _watchers[path] = ModelWatcher(path, interval).start()
+    return watcher
+
+
+def benchmark(path=DEFAULT_MODEL_PATH, reruns=20):
+    """Compare the old st.cache_data loader with the shared loader (milliseconds)."""
+    # Warm the page cache and import sklearn so both cold timings start level
+    import sklearn.ensemble  # noqa: F401
+
+    with open(path, "rb") as f:
+        f.read()
+    start = time.perf_counter()
+    with open(path, "rb") as f:
+        saved_objects = pickle.load(f)
+    old_cold = (time.perf_counter() - start) * 1e3
+    # st.cache_data keeps the pickled value and unpickles a copy on every hit
+    cached_bytes = pickle.dumps(
+        (saved_objects["model"], saved_objects["label_encoder"], saved_objects["features"])
+    )
+    start = time.perf_counter()
+    for _ in range(reruns):
+        pickle.loads(cached_bytes)
+    old_warm = (time.perf_counter() - start) / reruns * 1e3
+
+    _models.pop(path, None)
+    loaded = get_model(path)
+    start = time.perf_counter()
+    for _ in range(reruns):
+        get_model(path)
+    new_warm = (time.perf_counter() - start) / reruns * 1e3
+    return {
+        "cache_data_cold_ms": old_cold,
+        "cache_data_warm_ms": old_warm,
+        "shared_cold_ms": loaded.load_seconds * 1e3,
+        "shared_warm_ms": new_warm,
+        "shared_memory_mb": loaded.memory_bytes / 2**20,
+    }
+
+
+def reload_check(path=DEFAULT_MODEL_PATH, interval=0.2, seconds=2.0):
+    """Hot-reload a copy of ``path`` (pickle or ``.cfa``) while a thread keeps scoring; returns what happened.
+
+    The copy is rewritten with the same model and one extra metadata entry:
+    a pickle key, or for a ``.cfa`` a key in the header's source record.
+    """
+    import shutil
+    import tempfile
+
+    workdir = tempfile.mkdtemp(prefix="career-reload-")
+    try:
+        copy = os.path.join(workdir, os.path.basename(path))
+        shutil.copyfile(path, copy)
+        first = get_model(copy)
+        first_ref = weakref.ref(first)
+        watcher = watch(copy, interval)
+        swapped = threading.Event()
+        watcher.on_swap(lambda old, new: swapped.set())
+
+        profile = {name: 5 for name in NUMERIC_COLUMNS}
+        profile[INTEREST_COLUMN] = INTERESTS[0]
+        stop = threading.Event()
+        stats = {"requests": 0, "errors": [], "versions": set()}
+
+        def score():
+            cgpa = 6.0
+            while not stop.is_set():
+                try:
+                    # Each request pins the model it started with, as Recommender.predict_proba does
+                    loaded = get_model(copy)
+                    cgpa = 6.0 if cgpa >= 10.0 else round(cgpa + 0.1, 1)
+                    loaded.model.predict_proba(loaded.encoder.encode({**profile, "CGPA": cgpa}))
+                    stats["versions"].add(loaded.generation)
+                    stats["requests"] += 1
+                except Exception as e:
+                    stats["errors"].append(f"{type(e).__name__}: {e}")
+
+        worker = threading.Thread(target=score, daemon=True)
+        worker.start()
+
+        # Same bytes, new mtime: hashed, not reloaded
+        time.sleep(interval * 3)
+        os.utime(copy)
+        time.sleep(interval * 3)
+        touched_reloads = watcher.reloads
+
+        # Same model with an extra metadata entry, as a retrain would write: new bytes, same inputs
+        if copy.endswith(".cfa"):
+            flat, labels, feature_names, header = open_artifact(path)
+            written = time.perf_counter()
+            # write_artifact stages the file and renames it into place
+            write_artifact(copy, flat, labels.classes_, feature_names,
+                           {**header["source"], "reload_check": time.time()})
+            del flat
+        else:
+            with open(path, "rb") as f:
+                saved_objects = pickle.load(f)
+            saved_objects["reload_check"] = time.time()
+            staged = copy + ".tmp"
+            with open(staged, "wb") as f:
+                pickle.dump(saved_objects, f)
+            del saved_objects
+            written = time.perf_counter()
+            os.replace(staged, copy)
+        swapped.wait(timeout=seconds + 60)
+        reload_s = time.perf_counter() - written
+        time.sleep(seconds)
+        stop.set()
+        worker.join()
+        watcher.stop()
+
+        del first
+        gc.collect()
+        return {
+            "touch_reloads": touched_reloads,
+            "reloads": watcher.reloads,
+            "reload_seconds": reload_s,
+            "requests": stats["requests"],
+            "errors": stats["errors"],
+            "last_error": watcher.last_error,
+            "generations_served": len(stats["versions"]),
+            "version": get_model(copy).version,
+            "old_released": first_ref() is None,
+        }
+    finally:
+        with _lock:
+            _models.pop(os.path.join(workdir, os.path.basename(path)), None)
+            _watchers.pop(os.path.join(workdir, os.path.basename(path)), None)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold start and warm reruns of the model loader.")
+    parser.add_argument("--model", default=DEFAULT_MODEL_PATH,
+                        help="Pickled model artifact (a .cfa is accepted with --reload-check)")
+    parser.add_argument("--reruns", type=int, default=20, help="Warm reruns to average over")
+    parser.add_argument("--reload-check", action="store_true",
+                        help="Hot-reload a copy of the model while it is serving requests")
+    args = parser.parse_args()
+
+    if not args.reload_check and args.model.endswith(".cfa"):
+        parser.error("the cold/warm benchmark compares pickle loaders; pass the .pkl (or use --reload-check)")
+    if args.reload_check:
+        result = reload_check(args.model)
+        print(f"touch with unchanged bytes: {result['touch_reloads']} reload(s)")
+        print(f"rewritten artifact: {result['reloads']} reload(s), swapped in {result['reload_seconds']:.2f}s "
+              f"after the write, now serving {result['version']}")
+        print(f"{result['requests']:,} requests across {result['generations_served']} model version(s), "
+              f"{len(result['errors'])} errors")
+        for error in result["errors"][:5]:
+            print(f"  {error}")
+        if result["last_error"]:
+            print(f"watcher error: {result['last_error']}")
+        print(f"old model released: {result['old_released']}")
+        return
+
+    result = benchmark(args.model, args.reruns)
+    print(f"st.cache_data loader: cold {result['cache_data_cold_ms']:9.1f} ms   "
+          f"warm rerun {result['cache_data_warm_ms']:9.3f} ms")
+    print(f"shared loader:        cold {result['shared_cold_ms']:9.1f} ms   "
+          f"warm rerun {result['shared_warm_ms']:9.3f} ms")
+    print(f"shared model memory:  {result['shared_memory_mb']:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
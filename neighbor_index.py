@@ -0,0 +1,303 @@
+"""Prebuilt "students like you" nearest-neighbour index over the career dataset.
+
+Built once over the model's encoded ``feature_names`` vectors and pickled
+next to the model as ``<model>.neighbors.pkl``, together with the indexed
+rows' compact profile arrays and careers, so results can be shown without
+the CSV.
+
+Up to ``EXACT_MAX_ROWS`` rows (the shipped dataset) the index is an exact
+KD-tree. The 16 uniform 1-10 skills make the space too high-dimensional
+for tree pruning on large generated sets: a KD-tree over 1M rows costs
+~25 ms a query, no better than a scan. Larger sets therefore use an
+inverted-file grid instead. Rows are bucketed into ~sqrt(n) k-means cells,
+and a query scans only the ``n_probe`` nearest cells (approximate; the CLI
+reports recall).
+
+The interest one-hot columns are scaled by ``interest_weight`` so a
+different preferred interest weighs like a few skill points rather than
+less than one.
+
+    python neighbor_index.py --data BTech_Career_Path_Dataset.csv --model career_suggestion.pkl
+    python neighbor_index.py --model career_suggestion.pkl --query-csv cohort.csv --out like_you.csv
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import threading
+import time
+
+import numpy as np
+
+from career_schema import CAREERS, ID_COLUMN, INTEREST_COLUMN, INTEREST_PREFIX, INTERESTS
+from compact_profiles import SKILL_NAMES, CompactProfiles, read_compact_chunks
+
+INDEX_SUFFIX = ".neighbors.pkl"
+DEFAULT_INTEREST_WEIGHT = 3.0
+DEFAULT_LEAF_SIZE = 30
+# Largest dataset indexed with the exact KD-tree; above it the cell grid is used
+EXACT_MAX_ROWS = 20_000
+DEFAULT_N_PROBE = 12
+KMEANS_ITERATIONS = 6
+_BLOCK = 65_536
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def index_path_for(model_path):
+    return os.path.splitext(model_path)[0] + INDEX_SUFFIX
+
+
+def _nearest_centroid(X, centroids):
+    sq_norms = (centroids ** 2).sum(axis=1)
+    out = np.empty(len(X), dtype=np.int64)
+    for start in range(0, len(X), _BLOCK):
+        out[start:start + _BLOCK] = np.argmin(sq_norms - 2 * X[start:start + _BLOCK] @ centroids.T, axis=1)
+    return out
+
+
+def build_cells(X, n_cells, iterations=KMEANS_ITERATIONS, seed=0):
+    """A few Lloyd iterations; returns (centroids, row order grouped by cell, cell offsets)."""
+    rng = np.random.default_rng(seed)
+    centroids = X[rng.choice(len(X), n_cells, replace=False)].copy()
+    for _ in range(iterations):
+        assign = _nearest_centroid(X, centroids)
+        counts = np.bincount(assign, minlength=n_cells)
+        for j in range(X.shape[1]):
+            sums = np.bincount(assign, weights=X[:, j], minlength=n_cells)
+            # Empty cells keep their previous centroid
+            centroids[:, j] = np.where(counts > 0, sums / np.maximum(counts, 1), centroids[:, j])
+    assign = _nearest_centroid(X, centroids)
+    order = np.argsort(assign, kind="stable")
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=n_cells))])
+    return centroids, order, offsets
+
+
+class NeighborIndex:
+    def __init__(self, profiles, feature_names, weights, tree=None, cells=None, source=None):
+        self.profiles = profiles        # CompactProfiles of the indexed rows, with target codes
+        self.feature_names = list(feature_names)
+        self.weights = weights          # per-feature scale applied before indexing/querying
+        self.tree = tree                # exact KDTree, or None
+        self.cells = cells              # (centroids, order, offsets) for the cell grid, or None
+        self.source = source or {}
+        self.n_probe = DEFAULT_N_PROBE
+        from feature_encoder import FeatureEncoder
+
+        self._encoder = FeatureEncoder(self.feature_names)
+        if cells is not None:
+            # Rows regrouped by cell so each probed cell is one contiguous slice
+            order = cells[1]
+            self._X = (profiles.feature_matrix(self.feature_names) * weights)[order]
+            self._sq_norms = (self._X ** 2).sum(axis=1)
+
+    def __len__(self):
+        return len(self.profiles)
+
+    @property
+    def exact(self):
+        return self.tree is not None
+
+    @classmethod
+    def build(cls, profiles, feature_names, interest_weight=DEFAULT_INTEREST_WEIGHT,
+              leaf_size=DEFAULT_LEAF_SIZE, exact=None, source=None):
+        weights = np.array([interest_weight if name.startswith(INTEREST_PREFIX) else 1.0
+                            for name in feature_names], dtype=np.float32)
+        X = profiles.feature_matrix(feature_names) * weights
+        if exact is None:
+            exact = len(profiles) <= EXACT_MAX_ROWS
+        if exact:
+            from sklearn.neighbors import KDTree
+
+            return cls(profiles, feature_names, weights, tree=KDTree(X, leaf_size=leaf_size), source=source)
+        cells = build_cells(X, max(int(np.sqrt(len(X))), 1))
+        return cls(profiles, feature_names, weights, cells=cells, source=source)
+
+    def _query_cells(self, q, k):
+        centroids, order, offsets = self.cells
+        probe = min(self.n_probe, len(centroids))
+        nearest = np.argpartition(((centroids - q) ** 2).sum(axis=1), probe - 1)[:probe]
+        positions = np.concatenate([np.arange(offsets[c], offsets[c + 1]) for c in nearest])
+        dist = self._sq_norms[positions] - 2 * (self._X[positions] @ q) + q @ q
+        k = min(k, len(positions))
+        best = np.argpartition(dist, k - 1)[:k]
+        best = best[np.argsort(dist[best], kind="stable")]
+        return np.sqrt(np.maximum(dist[best], 0)), order[positions[best]]
+
+    def query_matrix(self, X, k=5):
+        """``(distances, row indices)`` of the ``k`` nearest indexed rows for each encoded row of X."""
+        X = np.asarray(X, dtype=np.float32) * self.weights
+        k = min(k, len(self))
+        if self.tree is not None:
+            return self.tree.query(X, k=k)
+        dist = np.full((len(X), k), np.inf)
+        idx = np.zeros((len(X), k), dtype=np.int64)
+        for i, q in enumerate(X):
+            d, j = self._query_cells(q, k)
+            dist[i, :len(d)], idx[i, :len(j)] = d, j
+        return dist, idx
+
+    def query(self, profile, k=5):
+        """The ``k`` most similar indexed profiles to one profile dict, nearest first."""
+        dist, idx = self.query_matrix(self._encoder.encode(profile), k)
+        return [self.describe_row(i, d) for i, d in zip(idx[0], dist[0])]
+
+    def query_batch(self, profiles, k=5):
+        """Batched form of :meth:`query` for a list of profile dicts or a CompactProfiles."""
+        if isinstance(profiles, CompactProfiles):
+            X = profiles.feature_matrix(self.feature_names)
+        else:
+            X = self._encoder.encode_batch(profiles)
+        return self.query_matrix(X, k)
+
+    def describe_row(self, i, distance=None):
+        p = self.profiles
+        row = {
+            "row": int(i),
+            "CGPA": float(p.cgpa[i]),
+            INTEREST_COLUMN: INTERESTS[p.interest[i]],
+            "career": CAREERS[p.target[i]],
+            "top_skills": [SKILL_NAMES[j] for j in np.argsort(-p.skills[i], kind="stable")[:3]],
+        }
+        if distance is not None:
+            row["distance"] = float(distance)
+        return row
+
+    def career_votes(self, idx):
+        """Per-query career counts among neighbours: (n, len(CAREERS)) int array."""
+        codes = self.profiles.target[np.asarray(idx)]
+        votes = np.zeros((codes.shape[0], len(CAREERS)), dtype=np.int64)
+        np.add.at(votes, (np.arange(codes.shape[0])[:, None], codes), 1)
+        return votes
+
+    def save(self, path):
+        # Plain arrays and the tree only, so loading does not depend on this module's import name
+        p = self.profiles
+        state = {
+            "tree": self.tree, "cells": self.cells, "skills": p.skills, "cgpa": p.cgpa, "interest": p.interest,
+            "target": p.target, "feature_names": self.feature_names, "weights": self.weights,
+            "source": self.source,
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return path
+
+
+def build_index(data_path, model_path, interest_weight=DEFAULT_INTEREST_WEIGHT, out_path=None, exact=None):
+    """Index ``data_path`` in ``model_path``'s feature order and save it next to the model."""
+    from model_loader import get_model
+
+    profiles = CompactProfiles.load(data_path)
+    source = {"data": os.path.abspath(data_path), "rows": len(profiles)}
+    index = NeighborIndex.build(profiles, get_model(model_path).feature_names, interest_weight,
+                                exact=exact, source=source)
+    return index.save(out_path or index_path_for(model_path)), index
+
+
+def load_index(path):
+    with open(path, "rb") as f:
+        state = pickle.load(f)
+    profiles = CompactProfiles(state["skills"], state["cgpa"], state["interest"], state["target"])
+    return NeighborIndex(profiles, state["feature_names"], state["weights"], tree=state["tree"],
+                         cells=state["cells"], source=state["source"])
+
+
+def get_index(model_path):
+    """The shared index saved next to ``model_path``, or None if none has been built."""
+    path = index_path_for(model_path)
+    index = _indexes.get(path)
+    if index is not None or not os.path.exists(path):
+        return index
+    with _lock:
+        if path not in _indexes:
+            _indexes[path] = load_index(path)
+        return _indexes[path]
+
+
+def query_file(index, input_path, output, k=5, chunk_size=100_000):
+    """Write the ``k`` neighbours' careers and the majority career for every row of a cohort CSV."""
+    import pandas as pd
+
+    careers = np.asarray(CAREERS, dtype=object)
+    rows = 0
+    for i, (_, compact) in enumerate(read_compact_chunks(input_path, chunk_size)):
+        dist, idx = index.query_batch(compact, k)
+        out = pd.DataFrame({ID_COLUMN: compact.ids})
+        for rank in range(idx.shape[1]):
+            out[f"neighbor_{rank + 1}_career"] = careers[index.profiles.target[idx[:, rank]]]
+            out[f"neighbor_{rank + 1}_distance"] = np.round(dist[:, rank], 3)
+        out["majority_career"] = careers[index.career_votes(idx).argmax(axis=1)]
+        out.to_csv(output, header=(i == 0), index=False)
+        rows += len(out)
+    return rows
+
+
+def measure(index, k=5, queries=1000, seed=0):
+    """Single/batched query latency and recall@k against a brute-force scan."""
+    rng = np.random.default_rng(seed)
+    X = index.profiles.feature_matrix(index.feature_names)
+    Q = X[rng.integers(0, len(index), queries)]
+    # Nudge the skills so queries are new profiles rather than indexed rows
+    skill_cols = [i for i, name in enumerate(index.feature_names) if name in SKILL_NAMES]
+    Q[:, skill_cols] = np.clip(Q[:, skill_cols] + rng.integers(-1, 2, (queries, len(skill_cols))), 1, 10)
+    index.query_matrix(Q[:1], k)
+    start = time.perf_counter()
+    for row in Q:
+        index.query_matrix(row[None, :], k)
+    single_us = (time.perf_counter() - start) / queries * 1e6
+    start = time.perf_counter()
+    dist, _ = index.query_matrix(Q, k)
+    batch_us = (time.perf_counter() - start) / queries * 1e6
+
+    # A neighbour counts as found if it is no farther than the exact k-th distance
+    Xw = X * index.weights
+    hits = 0
+    for q, d in zip(Q[:100] * index.weights, dist[:100]):
+        kth = np.sqrt(np.partition(((Xw - q) ** 2).sum(axis=1), k - 1)[k - 1])
+        hits += int((d <= kth + 1e-4).sum())
+    return {"single_us": single_us, "batch_us": batch_us, "recall": hits / (min(queries, 100) * k)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the 'students like you' index.")
+    parser.add_argument("--model", default="career_suggestion.pkl", help="Model whose feature order is indexed")
+    parser.add_argument("--data", help="Dataset CSV to (re)build the index from")
+    parser.add_argument("--interest-weight", type=float, default=DEFAULT_INTEREST_WEIGHT)
+    parser.add_argument("--exact", choices=["auto", "yes", "no"], default="auto",
+                        help=f"KD-tree (exact) or cell grid; auto = exact up to {EXACT_MAX_ROWS:,} rows")
+    parser.add_argument("--n-probe", type=int, default=DEFAULT_N_PROBE, help="Cells scanned per grid query")
+    parser.add_argument("--query-csv", help="Cohort CSV to query in batch")
+    parser.add_argument("--out", default="-", help="Output CSV for --query-csv ('-' for stdout)")
+    parser.add_argument("-k", type=int, default=5, help="Neighbours per profile")
+    args = parser.parse_args()
+
+    if args.data:
+        start = time.perf_counter()
+        exact = {"auto": None, "yes": True, "no": False}[args.exact]
+        path, index = build_index(args.data, args.model, args.interest_weight, exact=exact)
+        print(f"Indexed {len(index):,} profiles into {path} in {time.perf_counter() - start:.2f}s",
+              file=sys.stderr)
+    else:
+        index = load_index(index_path_for(args.model))
+    index.n_probe = args.n_probe
+
+    if args.query_csv:
+        if args.out == "-":
+            query_file(index, args.query_csv, sys.stdout, args.k)
+        else:
+            with open(args.out, "w", newline="") as f:
+                query_file(index, args.query_csv, f, args.k)
+        return
+
+    report = measure(index, args.k)
+    kind = "exact KD-tree" if index.exact else f"cell grid, {args.n_probe} probes"
+    print(f"{kind}, k={args.k}: {report['single_us']:.0f} us per single query, "
+          f"{report['batch_us']:.1f} us per row batched, recall {report['recall']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Bounded LRU cache for career predictions.
+
+The app's input space is discrete (integer sliders, CGPA in 0.1 steps, 7
+interests), so resubmitted profiles can reuse the class probabilities of an
+earlier call instead of rerunning the forest. One cache instance is meant to
+be shared by every session in the process; it clears itself when a newer
+model is loaded, and ignores lookups and stores made for an older one.
+"""
+
+import threading
+from collections import OrderedDict
+
+from career_schema import INTEREST_COLUMN, NUMERIC_COLUMNS
+
+DEFAULT_MAXSIZE = 4096
+
+
+def profile_key(profile):
+    """Normalize a profile dict into a hashable tuple in a fixed column order.
+
+    Numeric inputs are kept exact (as floats, so 5 and 5.0 share a key): the
+    encoder passes them to the model unrounded, so two profiles may only
+    share an entry when the model would see the same row.
+    """
+    key = [float(profile.get(name, 0)) for name in NUMERIC_COLUMNS]
+    key.append(profile.get(INTEREST_COLUMN))
+    return tuple(key)
+
+
+class PredictionCache:
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        # Load generation of the model the entries came from
+        self._generation = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, generation=None):
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self.misses += 1
+                return None
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __contains__(self, key):
+        """Membership test that leaves the LRU order and hit/miss counters alone."""
+        with self._lock:
+            return key in self._data
+
+    def put(self, key, value, generation=None):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                # Scored by a model that has since been replaced
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def check_model(self, loaded):
+        """Clear the cache when ``loaded`` is newer than the model its entries came from."""
+        with self._lock:
+            if self._generation is None or loaded.generation > self._generation:
+                if self._generation is not None:
+                    self._data.clear()
+                self._generation = loaded.generation
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
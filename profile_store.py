@@ -0,0 +1,262 @@
+"""Indexed SQLite store for saved profiles, replacing the append-only user_profile.csv.
+
+Each saved profile is one row keyed by ``Profile_ID`` (the primary key, so
+lookups are an index seek instead of a CSV scan). The row also holds the
+last top-k prediction and the model version that produced it, so a
+returning profile is answered without rescoring until the model changes.
+Appends are batched into one transaction; WAL mode lets readers continue
+while a writer commits.
+
+    python profile_store.py --db profiles.db --import user_profile.csv
+    python profile_store.py --db profiles.db --lookup 03a7e4fb
+    python profile_store.py --benchmark 1000000
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from career_schema import ID_COLUMN, INTEREST_COLUMN, SKILL_COLUMNS
+
+DEFAULT_DB_PATH = "profiles.db"
+DEFAULT_BATCH_SIZE = 10_000
+NAME_COLUMN = "Name"
+
+# SQL column name -> profile dict key
+_FIELDS = {"name": NAME_COLUMN, "cgpa": "CGPA", **SKILL_COLUMNS, "interest": INTEREST_COLUMN}
+_PREDICTION_FIELDS = ("prediction", "model_version", "predicted_at")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS profiles (
+    profile_id TEXT PRIMARY KEY,
+    name TEXT,
+    cgpa REAL NOT NULL,
+    {", ".join(f"{name} INTEGER NOT NULL" for name in SKILL_COLUMNS)},
+    interest TEXT NOT NULL,
+    prediction TEXT,
+    model_version TEXT,
+    predicted_at REAL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def _profile_row(profile_id, profile, now):
+    row = [str(profile_id), profile.get(NAME_COLUMN), float(profile["CGPA"])]
+    row.extend(int(profile[column]) for column in SKILL_COLUMNS.values())
+    row.append(profile[INTEREST_COLUMN])
+    row.append(now)
+    return row
+
+
+class ProfileStore:
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        # One connection shared by every session; the lock serializes its use
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._columns = ["profile_id", *_FIELDS, *_PREDICTION_FIELDS]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def _write(self, sql, rows, batch_size):
+        rows = iter(rows)
+        total = 0
+        with self._lock:
+            while True:
+                batch = [row for _, row in zip(range(batch_size), rows)]
+                if not batch:
+                    return total
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany(sql, batch)
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._conn.execute("COMMIT")
+                total += len(batch)
+
+    def save_many(self, profiles, batch_size=DEFAULT_BATCH_SIZE):
+        """Insert or replace ``(profile_id, profile_dict)`` pairs, ``batch_size`` per transaction.
+
+        Saving a profile clears its stored prediction, since the inputs may have changed.
+        """
+        columns = ["profile_id", *_FIELDS, "updated_at"]
+        updates = ", ".join(f"{c} = excluded.{c}" for c in columns[1:])
+        sql = (f"INSERT INTO profiles ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+               f"ON CONFLICT(profile_id) DO UPDATE SET {updates}, "
+               "prediction = NULL, model_version = NULL, predicted_at = NULL")
+        now = time.time()
+        return self._write(sql, (_profile_row(pid, p, now) for pid, p in profiles), batch_size)
+
+    def save(self, profile_id, profile):
+        self.save_many([(profile_id, profile)])
+
+    def set_predictions(self, predictions, model_version, batch_size=DEFAULT_BATCH_SIZE):
+        """Store ``(profile_id, [(career, probability), ...])`` results made by ``model_version``."""
+        sql = "UPDATE profiles SET prediction = ?, model_version = ?, predicted_at = ? WHERE profile_id = ?"
+        now = time.time()
+        rows = ((json.dumps(careers), model_version, now, str(pid)) for pid, careers in predictions)
+        return self._write(sql, rows, batch_size)
+
+    def _to_dict(self, row):
+        record = dict(zip(self._columns, row))
+        out = {ID_COLUMN: record["profile_id"]}
+        out.update({key: record[column] for column, key in _FIELDS.items()})
+        prediction = record["prediction"]
+        out["prediction"] = None if prediction is None else [tuple(p) for p in json.loads(prediction)]
+        out["model_version"] = record["model_version"]
+        out["predicted_at"] = record["predicted_at"]
+        return out
+
+    def get(self, profile_id):
+        """The saved profile (with its last prediction) for ``profile_id``, or None."""
+        sql = f"SELECT {', '.join(self._columns)} FROM profiles WHERE profile_id = ?"
+        with self._lock:
+            row = self._conn.execute(sql, (str(profile_id),)).fetchone()
+        return None if row is None else self._to_dict(row)
+
+    def get_many(self, profile_ids):
+        """``{profile_id: record}`` for the IDs that exist."""
+        ids = [str(pid) for pid in profile_ids]
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(ids), 900):
+                part = ids[start:start + 900]
+                sql = (f"SELECT {', '.join(self._columns)} FROM profiles "
+                       f"WHERE profile_id IN ({', '.join('?' * len(part))})")
+                for row in self._conn.execute(sql, part):
+                    found[row[0]] = row
+        return {pid: self._to_dict(row) for pid, row in found.items()}
+
+    def recommend(self, profile_ids, recommender, k=3):
+        """Top-``k`` careers per saved ID, rescoring only rows without a current prediction.
+
+        Returns ``{profile_id: [(career, probability), ...]}``; unknown IDs are left out.
+        """
+        version = recommender.model_version
+        records = self.get_many(profile_ids)
+        results = {}
+        stale = []
+        for pid, record in records.items():
+            prediction = record["prediction"]
+            # A shorter list is complete when it already holds all the probability
+            # (the rules engine returns only the one career it picks)
+            complete = prediction is not None and (
+                len(prediction) >= k or sum(p for _, p in prediction) >= 1 - 1e-9)
+            if complete and record["model_version"] == version:
+                results[pid] = prediction[:k]
+            else:
+                stale.append(pid)
+        if stale:
+            scored = recommender.recommend_batch([records[pid] for pid in stale], k)
+            self.set_predictions(zip(stale, scored), version)
+            results.update(zip(stale, scored))
+        return results
+
+
+def import_csv(csv_path, store, chunk_size=DEFAULT_BATCH_SIZE):
+    """Load a user_profile.csv-style file into ``store``; returns the number of rows saved."""
+    import pandas as pd
+
+    header = pd.read_csv(csv_path, nrows=0).columns.tolist()
+    total = 0
+    # usecols + index_col=False drops the unlabelled career some rows carry at the end
+    for chunk in pd.read_csv(csv_path, usecols=header, index_col=False, chunksize=chunk_size,
+                             dtype={ID_COLUMN: str}):
+        records = chunk.to_dict("records")
+        total += store.save_many(((r[ID_COLUMN], r) for r in records), batch_size=chunk_size)
+    return total
+
+
+def benchmark(rows=1_000_000, lookups=20_000, batch_size=DEFAULT_BATCH_SIZE, seed=0):
+    """Insert ``rows`` generated profiles into a scratch store, then time random ID lookups."""
+    import numpy as np
+
+    from dataset_generator import generate_chunks
+
+    tmpdir = tempfile.mkdtemp(prefix="profile-store-")
+    path = os.path.join(tmpdir, "bench.db")
+    try:
+        with ProfileStore(path) as store:
+            start = time.perf_counter()
+            offset = 0
+            for chunk in generate_chunks(rows, chunk_size=100_000, seed=seed):
+                records = chunk.to_dict("records")
+                store.save_many(((f"{offset + i:08x}", r) for i, r in enumerate(records)), batch_size)
+                offset += len(records)
+            insert_s = time.perf_counter() - start
+
+            ids = [f"{i:08x}" for i in np.random.default_rng(seed).integers(0, rows, lookups)]
+            start = time.perf_counter()
+            for pid in ids:
+                store.get(pid)
+            lookup_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for i in range(0, lookups, 500):
+                store.get_many(ids[i:i + 500])
+            batch_lookup_s = time.perf_counter() - start
+        size = os.path.getsize(path)
+    finally:
+        for name in os.listdir(tmpdir):
+            os.remove(os.path.join(tmpdir, name))
+        os.rmdir(tmpdir)
+    return {
+        "rows": rows,
+        "insert_rows_per_s": rows / insert_s,
+        "lookup_per_s": lookups / lookup_s,
+        "lookup_us": lookup_s / lookups * 1e6,
+        "batch_lookup_per_s": lookups / batch_lookup_s,
+        "db_bytes": size,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Indexed SQLite store for saved profiles.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite database path")
+    parser.add_argument("--import", dest="import_csv", metavar="CSV", help="Import a user_profile.csv-style file")
+    parser.add_argument("--lookup", metavar="PROFILE_ID", help="Print one saved profile")
+    parser.add_argument("--benchmark", type=int, metavar="ROWS",
+                        help="Insert ROWS generated profiles into a scratch DB and time lookups")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        report = benchmark(args.benchmark)
+        print(f"{report['rows']:,} rows, {report['db_bytes'] / 2 ** 20:.1f} MB on disk")
+        print(f"  insert:        {report['insert_rows_per_s']:10,.0f} rows/s")
+        print(f"  lookup by ID:  {report['lookup_per_s']:10,.0f} /s ({report['lookup_us']:.1f} us each)")
+        print(f"  batched (500): {report['batch_lookup_per_s']:10,.0f} IDs/s")
+        return
+    with ProfileStore(args.db) as store:
+        if args.import_csv:
+            start = time.perf_counter()
+            count = import_csv(args.import_csv, store)
+            print(f"Imported {count} profiles into {args.db} in {time.perf_counter() - start:.2f}s "
+                  f"({len(store)} total)")
+        if args.lookup:
+            print(json.dumps(store.get(args.lookup), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""The dataset's labelling rules as a vectorized classifier.
+
+``BTech_Career_Path_Dataset.csv`` was labelled by the deterministic if/elif
+cascade in the notebook (``dataset_generator.rule_conditions``).
+``RuleClassifier`` evaluates that cascade on the same encoded float32
+batches the forest takes: one boolean mask per rule over the whole batch,
+then one ``np.select``. It exposes the forest's ``predict_proba`` /
+``predict`` / ``classes_`` interface, so the recommender can use it as a
+fast path (``CAREER_ENGINE=rules``) or a sanity check.
+
+Its probabilities are one-hot: the cascade's career gets 1.0. The top-1
+career is exact for rule-labelled data, and lower ranks carry 0.
+
+    python rule_engine.py --model career_suggestion.pkl --rows 200000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from career_schema import CAREERS, INTEREST_PREFIX, SKILL_COLUMNS
+from dataset_generator import DEFAULT_CAREER, rule_conditions
+
+
+class _InterestColumn:
+    """Stands in for the raw interest column: ``col == "Research"`` reads the one-hot column."""
+
+    def __init__(self, X, index):
+        self._X = X
+        self._index = index
+
+    def __eq__(self, value):
+        j = self._index.get(value)
+        if j is None:
+            return np.zeros(len(self._X), dtype=bool)
+        return self._X[:, j] > 0.5
+
+
+class RuleClassifier:
+    def __init__(self, feature_names, class_labels):
+        """``class_labels`` are the careers in model class order (the LabelEncoder's ``classes_``)."""
+        self.feature_names = list(feature_names)
+        self.class_labels = np.asarray(class_labels)
+        self.classes_ = np.arange(len(self.class_labels))
+        position = {name: i for i, name in enumerate(self.feature_names)}
+        missing = [c for c in SKILL_COLUMNS.values() if c not in position]
+        if missing:
+            raise ValueError(f"feature_names lack rule inputs: {missing}")
+        self._skill_index = {short: position[column] for short, column in SKILL_COLUMNS.items()}
+        self._interest_index = {name[len(INTEREST_PREFIX):]: i for name, i in position.items()
+                                if name.startswith(INTEREST_PREFIX)}
+        code = {str(label): i for i, label in enumerate(self.class_labels)}
+        careers = [career for career, _ in rule_conditions(self._columns(np.zeros((1, len(position)))))]
+        # Careers of every rule in cascade order, then the default, as class codes
+        self._rule_codes = np.array([code[c] for c in careers], dtype=np.intp)
+        self._default_code = code[DEFAULT_CAREER]
+
+    @classmethod
+    def from_loaded(cls, loaded):
+        return cls(loaded.feature_names, loaded.classes)
+
+    def _columns(self, X):
+        c = {short: X[:, j] for short, j in self._skill_index.items()}
+        c["interest"] = _InterestColumn(X, self._interest_index)
+        return c
+
+    def predict_codes(self, X):
+        """Class code of the first matching rule for each row of the encoded batch X."""
+        X = np.asarray(X)
+        masks = [mask for _, mask in rule_conditions(self._columns(X))]
+        return np.select(masks, self._rule_codes, default=self._default_code)
+
+    def predict_proba(self, X):
+        codes = self.predict_codes(X)
+        probs = np.zeros((len(codes), len(self.classes_)), dtype=np.float64)
+        probs[np.arange(len(codes)), codes] = 1.0
+        return probs
+
+    def predict(self, X):
+        return self.classes_[self.predict_codes(X)]
+
+
+def agreement_report(rules, forest, X, y=None, k=3):
+    """How often the rules and the forest agree on X (and, given labels y, how often each is right)."""
+    rule_codes = rules.predict_codes(X)
+    probs = forest.predict_proba(X)
+    forest_top1 = probs.argmax(axis=1)
+    top = np.argsort(probs, axis=1)[:, -k:]
+    report = {
+        "rows": int(len(X)),
+        "top1_agreement": float((rule_codes == forest_top1).mean()),
+        f"rule_in_forest_top{k}": float((top == rule_codes[:, None]).any(axis=1).mean()),
+        "per_career": {},
+    }
+    if y is not None:
+        y = np.asarray(y)
+        report["rules_accuracy"] = float((rule_codes == y).mean())
+        report["forest_accuracy"] = float((forest_top1 == y).mean())
+    for code, label in enumerate(rules.class_labels):
+        mask = rule_codes == code
+        if mask.any():
+            report["per_career"][str(label)] = {
+                "rows": int(mask.sum()),
+                "forest_agrees": float((forest_top1[mask] == code).mean()),
+            }
+    return report
+
+
+def throughput(model, X, batch_size):
+    """Rows per second for ``model.predict_proba`` over X in ``batch_size`` slices."""
+    model.predict_proba(X[:batch_size])
+    start = time.perf_counter()
+    for i in range(0, len(X), batch_size):
+        model.predict_proba(X[i:i + batch_size])
+    return len(X) / (time.perf_counter() - start)
+
+
+def main():
+    from compact_profiles import CompactProfiles
+    from dataset_generator import generate_btech_career_data
+    from model_loader import get_model
+
+    parser = argparse.ArgumentParser(description="Compare the rule engine with the forest.")
+    parser.add_argument("--model", default="career_suggestion.pkl", help="Model artifact (.pkl or .cfa)")
+    parser.add_argument("--rows", type=int, default=200_000, help="Generated rows to compare on")
+    parser.add_argument("--data", default="BTech_Career_Path_Dataset.csv",
+                        help="Labelled CSV for the accuracy comparison")
+    args = parser.parse_args()
+
+    loaded = get_model(args.model)
+    rules = RuleClassifier.from_loaded(loaded)
+    code = {str(label): i for i, label in enumerate(loaded.classes)}
+
+    matrices = {}
+    for name, profiles in [("generated", CompactProfiles.from_frame(generate_btech_career_data(args.rows, seed=1))),
+                           (args.data, CompactProfiles.load(args.data))]:
+        X = matrices[name] = profiles.feature_matrix(loaded.feature_names)
+        y = np.array([code[c] for c in np.asarray(CAREERS)[profiles.target]])
+        report = agreement_report(rules, loaded.model, X, y)
+        print(f"{name} ({report['rows']:,} rows): rules accuracy {report['rules_accuracy']:.2%}, "
+              f"forest accuracy {report['forest_accuracy']:.2%}, top-1 agreement "
+              f"{report['top1_agreement']:.2%}, rule career in forest top-3 {report['rule_in_forest_top3']:.2%}")
+        worst = sorted(report["per_career"].items(), key=lambda kv: kv[1]["forest_agrees"])[:3]
+        print("  least agreement: " + ", ".join(f"{c} {v['forest_agrees']:.0%}" for c, v in worst))
+
+    X = matrices["generated"]
+    print("throughput (rows/s):")
+    for batch_size in (1, 64, 4096):
+        n = min(len(X), 2000 if batch_size == 1 else 50_000)
+        r = throughput(rules, X[:n], batch_size)
+        f = throughput(loaded.model, X[:n], batch_size)
+        print(f"  batch {batch_size:5d}: rules {r:12,.0f}   forest {f:10,.0f}   ({r / f:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
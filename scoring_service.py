@@ -0,0 +1,323 @@
+"""Local HTTP JSON scoring service with request micro-batching.
+
+Concurrent single-profile requests are collected for a short window and
+scored together with one batched model call through the career engine.
+
+    python scoring_service.py --port 8765 --window-ms 5 --model career_suggestion.cfa
+    curl -s localhost:8765/recommend -d '{"profile": {...}, "k": 3}'
+    curl -s localhost:8765/stats
+    curl -s localhost:8765/metrics        # per-stage latency, with CAREER_METRICS=1
+
+    python scoring_service.py --load-test 5000 --concurrency 64   # against a running service
+"""
+
+import argparse
+import json
+import math
+import queue
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from career_engine import Recommender
+from career_schema import INTEREST_COLUMN, INTERESTS, NUMERIC_COLUMNS, VALUE_RANGES
+from latency_metrics import recorder as latency
+
+DEFAULT_WINDOW_MS = 5.0
+DEFAULT_MAX_BATCH = 512
+# Number of recent requests/batches kept for the latency and batch-size stats
+STATS_WINDOW = 4096
+
+
+class _Pending:
+    __slots__ = ("profile", "k", "done", "result", "error", "start")
+
+    def __init__(self, profile, k):
+        self.profile = profile
+        self.k = k
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.start = time.perf_counter()
+
+
+def parse_profile(profile):
+    """Validate a request profile and coerce its numeric inputs to float; raises ValueError.
+
+    Numeric inputs must lie in the dataset's ranges (``VALUE_RANGES``); the
+    model was never trained on anything outside them.
+    """
+    if not isinstance(profile, dict):
+        raise ValueError("profile must be a JSON object")
+    unknown = sorted(set(profile) - set(NUMERIC_COLUMNS) - {INTEREST_COLUMN})
+    if unknown:
+        raise ValueError(f"unknown inputs: {', '.join(unknown)}")
+    missing = [name for name in NUMERIC_COLUMNS + [INTEREST_COLUMN] if name not in profile]
+    if missing:
+        raise ValueError(f"missing inputs: {', '.join(missing)}")
+    parsed = {}
+    for name in NUMERIC_COLUMNS:
+        value = profile[name]
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            raise ValueError(f"{name} must be a number")
+        try:
+            value = float(value)
+        except ValueError:
+            raise ValueError(f"{name} must be a number") from None
+        if not math.isfinite(value):
+            raise ValueError(f"{name} must be finite")
+        low, high = VALUE_RANGES[name]
+        if not low <= value <= high:
+            raise ValueError(f"{name} must be between {low} and {high}")
+        parsed[name] = value
+    if profile[INTEREST_COLUMN] not in INTERESTS:
+        raise ValueError(f"{INTEREST_COLUMN} must be one of: {', '.join(INTERESTS)}")
+    parsed[INTEREST_COLUMN] = profile[INTEREST_COLUMN]
+    return parsed
+
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+class MicroBatcher:
+    def __init__(self, recommender, window_ms=DEFAULT_WINDOW_MS, max_batch=DEFAULT_MAX_BATCH):
+        self.recommender = recommender
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._latencies_ms = deque(maxlen=STATS_WINDOW)
+        self._batch_sizes = deque(maxlen=STATS_WINDOW)
+        self.requests = 0
+        self.batches = 0
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, profile, k=3, timeout=30.0):
+        """Queue one profile and block until its batch has been scored."""
+        pending = _Pending(profile, k)
+        self._queue.put(pending)
+        if not pending.done.wait(timeout):
+            raise TimeoutError("scoring timed out")
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            try:
+                k = max(p.k for p in batch)
+                results = self.recommender.recommend_batch([p.profile for p in batch], k)
+                for pending, result in zip(batch, results):
+                    pending.result = result[:pending.k]
+            except Exception:
+                # Score the rows one at a time so only the failing request gets the error
+                for pending in batch:
+                    try:
+                        pending.result = self.recommender.recommend_batch([pending.profile], pending.k)[0]
+                    except Exception as e:
+                        pending.error = e
+            now = time.perf_counter()
+            with self._lock:
+                self.requests += len(batch)
+                self.batches += 1
+                self._batch_sizes.append(len(batch))
+                self._latencies_ms.extend((now - p.start) * 1e3 for p in batch)
+            for pending in batch:
+                pending.done.set()
+
+    def stats(self):
+        with self._lock:
+            latencies = list(self._latencies_ms)
+            sizes = list(self._batch_sizes)
+            requests, batches = self.requests, self.batches
+        return {
+            "requests": requests,
+            "batches": batches,
+            "window_ms": self.window * 1000,
+            "max_batch": self.max_batch,
+            "batch_size": {
+                "mean": sum(sizes) / len(sizes) if sizes else 0.0,
+                "p50": _percentile(sizes, 50),
+                "max": max(sizes) if sizes else 0,
+            },
+            "latency_ms": {
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "p99": _percentile(latencies, 99),
+            },
+            "cache": self.recommender.cache.stats(),
+        }
+
+
+def make_handler(batcher):
+    class ScoringHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_text(self, status, text):
+            body = text.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/stats":
+                self._send_json(200, batcher.stats())
+            elif self.path == "/health":
+                self._send_json(200, {"status": "ok", "model": batcher.recommender.model_path})
+            elif self.path == "/metrics":
+                self._send_text(200, latency.prometheus_text())
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/recommend":
+                self._send_json(404, {"error": "not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+                if "profile" in request:
+                    profile = request["profile"]
+                else:
+                    # A bare profile body, optionally with "k" alongside the inputs
+                    profile = {name: value for name, value in request.items() if name != "k"}
+                profile = parse_profile(profile)
+                k = request.get("k", 3)
+                n_classes = len(batcher.recommender.loaded.classes)
+                if isinstance(k, bool) or not isinstance(k, int) or not 1 <= k <= n_classes:
+                    raise ValueError(f"k must be an integer from 1 to {n_classes}")
+            except ValueError as e:
+                self._send_json(400, {"error": f"invalid request: {e}"})
+                return
+            try:
+                careers = batcher.submit(profile, k)
+            except Exception as e:
+                self._send_json(500, {"error": str(e)})
+                return
+            self._send_json(200, {
+                "careers": [{"career": c, "probability": p} for c, p in careers],
+            })
+
+        def log_message(self, format, *args):
+            # Keep the console quiet under load; /stats has the numbers
+            pass
+
+    return ScoringHandler
+
+
+class ScoringServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default listen backlog of 5 resets connections under bursty load
+    request_queue_size = 1024
+
+
+def serve(host="127.0.0.1", port=8765, window_ms=DEFAULT_WINDOW_MS, max_batch=DEFAULT_MAX_BATCH,
+          model_path=None):
+    recommender = Recommender(model_path)
+    # Load before accepting connections so the first request does not pay for it
+    loaded = recommender.loaded
+    batcher = MicroBatcher(recommender, window_ms, max_batch)
+    server = ScoringServer((host, port), make_handler(batcher))
+    print(f"Model {recommender.model_path} loaded in {loaded.load_seconds:.2f}s; "
+          f"serving on http://{host}:{port} (window {window_ms} ms, max batch {max_batch})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def load_test(url, requests=2000, concurrency=32, seed=0):
+    """Fire ``requests`` random profiles at ``url`` from ``concurrency`` threads; returns req/s."""
+    import urllib.request
+
+    import numpy as np
+
+    from career_schema import INTEREST_COLUMN, SKILL_COLUMNS
+    from dataset_generator import draw_columns
+
+    c = draw_columns(np.random.default_rng(seed), requests)
+    bodies = []
+    for i in range(requests):
+        profile = {"CGPA": float(c["cgpa"][i]), INTEREST_COLUMN: str(c["interest"][i])}
+        profile.update({column: int(c[name][i]) for name, column in SKILL_COLUMNS.items()})
+        bodies.append(json.dumps({"profile": profile, "k": 3}).encode("utf-8"))
+
+    counter = iter(range(requests))
+    counter_lock = threading.Lock()
+
+    def worker():
+        while True:
+            with counter_lock:
+                i = next(counter, None)
+            if i is None:
+                return
+            req = urllib.request.Request(url.rstrip("/") + "/recommend", data=bodies[i],
+                                         headers={"Content-Type": "application/json"})
+            with urllib.request.urlopen(req) as resp:
+                resp.read()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local HTTP scoring service for career recommendations.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--model",
+                        help="Model artifact (.pkl or .cfa); defaults to career_suggestion.cfa when current, else .pkl")
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW_MS,
+                        help="How long to gather requests into one batch")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="Largest batch to score at once")
+    parser.add_argument("--load-test", type=int, metavar="REQUESTS",
+                        help="Instead of serving, send REQUESTS random profiles to a running service")
+    parser.add_argument("--concurrency", type=int, default=32, help="Client threads for --load-test")
+    args = parser.parse_args()
+
+    if args.load_test:
+        url = f"http://{args.host}:{args.port}"
+        rate = load_test(url, args.load_test, args.concurrency)
+        print(f"{args.load_test} requests at concurrency {args.concurrency}: {rate:,.0f} req/s")
+        return
+    serve(args.host, args.port, args.window_ms, args.max_batch, args.model)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Replay a user's slider-then-predict interaction against a live ``streamlit run`` server.
+
+The probe connects to the app's websocket like a browser does, moves
+``--moves`` sliders one step each and presses "Get My Career Suggestions".
+Without a form, every slider change is sent to the server straight away;
+inside the form, nothing is sent until the button is pressed. It then
+reads the server's own stage counts from the sidebar's latency panel, so
+the server must run with ``CAREER_METRICS=1``. It reports how many full
+script reruns and ``prediction_panel`` fragment runs the interaction cost.
+
+    CAREER_METRICS=1 streamlit run career_suggestion.py --server.port 8501
+    python session_probe.py --port 8501 --moves 5
+"""
+
+import argparse
+import asyncio
+import re
+
+# Both ship with Streamlit
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+PREDICT_LABEL = "Get My Career Suggestions"
+_STAGE_LINE = re.compile(r"\*\*(\w+)\*\* \((\d+)\): p50 ([\d.]+) ms")
+
+
+class _Session:
+    def __init__(self, ws):
+        self.ws = ws
+        # (widget id, default value, fragment id) per slider, in page order
+        self.sliders = []
+        # label -> (widget id, fragment id)
+        self.buttons = {}
+        self.markdown = []
+
+    async def run(self, states, fragment_id=""):
+        """Send one rerun request and read the page it produces until the script finishes."""
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        msg.rerun_script.widget_states.widgets.extend(states)
+        if fragment_id:
+            msg.rerun_script.fragment_id = fragment_id
+        await self.ws.send(msg.SerializeToString())
+        self.markdown = []
+        sliders = []
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await self.ws.recv())
+            kind = forward.WhichOneof("type")
+            if kind == "script_finished":
+                break
+            if kind != "delta" or forward.delta.WhichOneof("type") != "new_element":
+                continue
+            element = forward.delta.new_element
+            element_type = element.WhichOneof("type")
+            if element_type == "slider":
+                sliders.append((element.slider.id, element.slider.default[0], forward.delta.fragment_id))
+            elif element_type == "button":
+                self.buttons[element.button.label] = (element.button.id, forward.delta.fragment_id)
+            elif element_type == "markdown":
+                self.markdown.append(element.markdown.body)
+        if not fragment_id:
+            self.sliders = sliders
+
+    def stages(self):
+        """``{stage: (count, p50_ms)}`` from the sidebar's latency panel."""
+        out = {}
+        for body in self.markdown:
+            match = _STAGE_LINE.match(body)
+            if match:
+                out[match.group(1)] = (int(match.group(2)), float(match.group(3)))
+        return out
+
+
+def _slider(widget_id, value):
+    state = WidgetState(id=widget_id)
+    state.double_array_value.data.append(value)
+    return state
+
+
+async def probe(url, moves=5):
+    """Run the interaction once; returns the messages sent and the server-side runs it caused."""
+    async with websockets.connect(url, subprotocols=["streamlit"], max_size=None) as ws:
+        session = _Session(ws)
+        await session.run([])
+        # The panel is drawn before the run that draws it is recorded, so read the
+        # counts from a second run: they then include the first one
+        await session.run([])
+        before = session.stages()
+        if "rerun" not in before:
+            raise RuntimeError("no stage counts on the page; start the server with CAREER_METRICS=1")
+        predict_id, predict_fragment = next(value for label, value in session.buttons.items()
+                                            if PREDICT_LABEL in label)
+        chosen = session.sliders[:moves]
+        in_form = bool(predict_fragment) and all(fragment == predict_fragment for _, _, fragment in chosen)
+
+        moved = {}
+        messages = 0
+        for widget_id, default, fragment in chosen:
+            moved[widget_id] = default + 1
+            if not in_form:
+                await session.run([_slider(i, v) for i, v in moved.items()], fragment)
+                messages += 1
+        press = WidgetState(id=predict_id, trigger_value=True)
+        await session.run([_slider(i, v) for i, v in moved.items()] + [press], predict_fragment)
+        messages += 1
+
+        await session.run([_slider(i, v) for i, v in moved.items()])
+        after = session.stages()
+
+    def runs(name):
+        count_after = after.get(name, (0, 0.0))[0]
+        count_before = before.get(name, (0, 0.0))[0]
+        # The second setup run is counted in ``after`` but not in ``before``
+        return count_after - count_before - (1 if name in after else 0)
+
+    return {
+        "form": in_form,
+        "moves": len(chosen),
+        "messages": messages,
+        "full_reruns": runs("rerun"),
+        "panel_runs": max(runs("prediction_panel"), 0),
+        "rerun_p50_ms": after["rerun"][1],
+        "panel_p50_ms": after.get("prediction_panel", (0, 0.0))[1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count server-side reruns for one slider-then-predict interaction.")
+    parser.add_argument("--host", default="localhost", help="Host of the running Streamlit server")
+    parser.add_argument("--port", type=int, default=8501, help="Port of the running Streamlit server")
+    parser.add_argument("--moves", type=int, default=5, help="Sliders moved before pressing predict")
+    args = parser.parse_args()
+
+    result = asyncio.run(probe(f"ws://{args.host}:{args.port}/_stcore/stream", args.moves))
+    server_ms = result["full_reruns"] * result["rerun_p50_ms"] + result["panel_runs"] * result["panel_p50_ms"]
+    print(f"{'form' if result['form'] else 'no form'}: {result['moves']} slider moves + predict -> "
+          f"{result['messages']} message(s) to the server, {result['full_reruns']} full rerun(s) "
+          f"(p50 {result['rerun_p50_ms']:.1f} ms), {result['panel_runs']} prediction_panel run(s) "
+          f"(p50 {result['panel_p50_ms']:.1f} ms); ~{server_ms:.0f} ms of script time")
+
+
+if __name__ == "__main__":
+    main()
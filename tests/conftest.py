@@ -0,0 +1,37 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def dataset_path(tmp_path_factory):
+    """A small generated training CSV."""
+    from dataset_generator import write_btech_career_data
+
+    path = str(tmp_path_factory.mktemp("data") / "careers.csv")
+    write_btech_career_data(path, 3_000, seed=0)
+    return path
+
+
+@pytest.fixture(scope="session")
+def model_path(dataset_path, tmp_path_factory):
+    """A small forest trained on ``dataset_path``, as career_suggestion.pkl would be."""
+    from train_model import train
+
+    path = str(tmp_path_factory.mktemp("model") / "career_suggestion.pkl")
+    train(dataset_path, path, params={"n_estimators": 20, "max_depth": 8, "n_jobs": 1})
+    return path
+
+
+@pytest.fixture
+def profile():
+    """One mid-range profile: CGPA 8.0, every skill 5, interest Coding."""
+    from career_schema import INTEREST_COLUMN, NUMERIC_COLUMNS
+
+    out = {name: 5 for name in NUMERIC_COLUMNS}
+    out["CGPA"] = 8.0
+    out[INTEREST_COLUMN] = "Coding"
+    return out
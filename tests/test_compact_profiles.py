@@ -0,0 +1,30 @@
+import io
+
+import pandas as pd
+
+from batch_score import score_file
+from career_schema import ID_COLUMN
+from compact_profiles import read_compact_chunks
+
+
+def test_rows_are_numbered_across_chunks_without_an_id_column(dataset_path):
+    ids = [compact.ids for _, compact in read_compact_chunks(dataset_path, chunk_size=700)]
+    assert [len(part) for part in ids][:2] == [700, 700]
+    assert [i for part in ids for i in part] == list(range(1, 3_001))
+
+
+def test_profile_ids_are_kept(tmp_path, dataset_path):
+    df = pd.read_csv(dataset_path, nrows=50)
+    df.insert(0, ID_COLUMN, [f"P{i:03d}" for i in range(50)])
+    path = tmp_path / "with_ids.csv"
+    df.to_csv(path, index=False)
+    ids = [i for _, compact in read_compact_chunks(str(path), chunk_size=20) for i in compact.ids]
+    assert ids == list(df[ID_COLUMN])
+
+
+def test_batch_score_numbers_rows(dataset_path, model_path):
+    out = io.StringIO()
+    assert score_file(dataset_path, out, model_path, top_k_count=2, chunk_size=1_000) == 3_000
+    scored = pd.read_csv(io.StringIO(out.getvalue()))
+    assert list(scored[ID_COLUMN]) == list(range(1, 3_001))
+    assert list(scored.columns) == [ID_COLUMN, "career_1", "prob_1", "career_2", "prob_2"]
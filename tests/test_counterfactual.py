@@ -0,0 +1,40 @@
+import pytest
+
+from career_engine import Recommender
+from counterfactual import PathSearch
+
+
+def _apply(profile, changes):
+    return dict(profile, **{column: after for column, _, after in changes})
+
+
+@pytest.mark.parametrize("engine", ["forest", "rules"])
+def test_found_path_reaches_the_target_with_the_same_engine(model_path, profile, engine):
+    recommender = Recommender(model_path, engine=engine)
+    search = PathSearch(recommender)
+    found = 0
+    for target in (str(c) for c in recommender.loaded.classes):
+        result = search.search(profile, target, goal_rank=1, max_candidates=500)
+        if result["found"]:
+            found += 1
+            assert recommender.recommend(_apply(profile, result["changes"]), 1)[0][0] == target
+            assert all(after > before for _, before, after in result["changes"])
+    assert found > 1
+
+
+def test_search_scores_through_the_recommender(model_path, profile):
+    recommender = Recommender(model_path, engine="forest")
+    calls = []
+    score_matrix = recommender.score_matrix
+    recommender.score_matrix = lambda X, loaded=None: calls.append(len(X)) or score_matrix(X, loaded)
+    result = PathSearch(recommender).search(profile, "Project Manager", max_candidates=200)
+    assert sum(calls) == result["evaluations"] > 0
+
+
+def test_repeated_search_is_deterministic(model_path, profile):
+    search = PathSearch(Recommender(model_path, engine="forest"))
+    first = search.search(profile, "Data Scientist", goal_rank=3, max_candidates=300)
+    again = search.search(profile, "Data Scientist", goal_rank=3, max_candidates=300)
+    assert (first["changes"], first["found"], first["candidates"]) == \
+        (again["changes"], again["found"], again["candidates"])
+    assert again["evaluations"] == 0
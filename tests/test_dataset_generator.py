@@ -0,0 +1,13 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset_generator import check_rule_order
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vectorized_rules_match_the_cascade(seed):
+    assert check_rule_order(num_samples=2_000, seed=seed) == 0
@@ -0,0 +1,20 @@
+import numpy as np
+
+from distill import choose, distill, save_student
+from model_artifact import read_header, stale_source
+from model_loader import load_artifact
+
+
+def test_saved_student_artifact_is_current(tmp_path, model_path, profile):
+    report, students, saved_objects = distill(model_path, samples=2_000, holdout=500, candidates=["tree-d10"])
+    chosen = choose(report)
+    out_path = str(tmp_path / "student.pkl")
+    cfa_path = save_student(students[chosen], saved_objects, out_path, {"student": chosen})
+
+    assert stale_source(cfa_path) is None
+    assert read_header(cfa_path)["source"]["distilled"] == {"student": chosen}
+    from_pickle = load_artifact(out_path)
+    from_cfa = load_artifact(cfa_path)
+    X = from_pickle.encoder.encode_batch([profile])
+    assert list(from_cfa.classes) == list(from_pickle.classes)
+    np.testing.assert_allclose(from_cfa.model.predict_proba(X), from_pickle.model.predict_proba(X), atol=1e-6)
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+
+from career_engine import Recommender
+from explain import Explainer
+
+
+def test_explanation_adds_up_to_the_prediction(model_path, profile):
+    recommender = Recommender(model_path, engine="forest")
+    entries = Explainer(recommender).explain(profile, k=3, top=100)
+    expected = recommender.recommend(profile, 3)
+    assert [e["career"] for e in entries] == [career for career, _ in expected]
+    assert [e["probability"] for e in entries] == pytest.approx([p for _, p in expected])
+    for entry in entries:
+        total = entry["base"] + sum(value for _, value in entry["drivers"])
+        assert total == pytest.approx(entry["probability"])
+
+
+def test_rules_engine_is_not_explained(model_path, profile):
+    explainer = Explainer(Recommender(model_path, engine="rules"))
+    with pytest.raises(ValueError):
+        explainer.explain(profile)
+    with pytest.raises(ValueError):
+        explainer.explain_batch(np.zeros((1, 1), dtype=np.float32))
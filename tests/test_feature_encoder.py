@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+from career_schema import INTEREST_COLUMN, INTERESTS
+from compact_profiles import training_feature_names
+from feature_encoder import FeatureEncoder, _pandas_encode
+
+
+def test_encoders_match_the_pandas_encoding(profile):
+    features = training_feature_names()
+    encoder = FeatureEncoder(features)
+    profiles = [dict(profile, **{INTEREST_COLUMN: interest, "CGPA": 6.0 + i / 2})
+                for i, interest in enumerate(INTERESTS)]
+    expected = np.vstack([_pandas_encode(p, features).to_numpy(dtype=np.float32) for p in profiles])
+    np.testing.assert_array_equal(np.vstack([encoder.encode(p) for p in profiles]), expected)
+    np.testing.assert_array_equal(encoder.encode_batch(profiles), expected)
+    np.testing.assert_array_equal(encoder.encode_frame(pd.DataFrame(profiles)), expected)
+
+
+def test_unknown_interest_sets_no_one_hot_column(profile):
+    encoder = FeatureEncoder(training_feature_names())
+    row = encoder.encode({**profile, INTEREST_COLUMN: "Cooking"})[0]
+    assert row[list(encoder.interest_index.values())].sum() == 0
@@ -0,0 +1,39 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from dataset_generator import generate_btech_career_data
+from feature_encoder import FeatureEncoder
+from forest_engine import FlatForest, rank_classes, top_k
+
+
+@pytest.fixture(scope="module")
+def forest(model_path):
+    with open(model_path, "rb") as f:
+        saved_objects = pickle.load(f)
+    X = FeatureEncoder(saved_objects["features"]).encode_frame(generate_btech_career_data(2_000, seed=1))
+    return saved_objects["model"], FlatForest.from_sklearn(saved_objects["model"]), X
+
+
+def test_ties_go_to_the_lower_class_index():
+    probs = np.array([[0.2, 0.4, 0.2, 0.4 + 1e-15]])
+    assert rank_classes(probs, 4).tolist() == [[1, 3, 0, 2]]
+    assert top_k(probs, 2)[0].tolist() == [[1, 3]]
+
+
+@pytest.mark.parametrize("k", [1, 3])
+def test_early_exit_matches_the_full_forest(forest, k):
+    _, flat, X = forest
+    idx, partial, used = flat.predict_top_k_early(X, k)
+    assert (idx == top_k(flat.predict_proba(X), k)[0]).all()
+    assert used.max() == flat.n_trees
+    full = used == flat.n_trees
+    np.testing.assert_allclose(partial[full], flat.predict_proba(X[full]), atol=1e-12)
+
+
+def test_flat_forest_matches_sklearn(forest):
+    model, flat, X = forest
+    np.testing.assert_allclose(flat.predict_proba(X), model.predict_proba(X), rtol=0, atol=1e-9)
+    np.testing.assert_allclose(flat.predict_proba(X[0]), model.predict_proba(X[:1]), rtol=0, atol=1e-9)
+
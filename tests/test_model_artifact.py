@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pytest
+
+from forest_engine import FlatForest
+from model_artifact import export_artifact, open_artifact, read_header, stale_source
+from model_loader import load_artifact
+
+
+@pytest.fixture
+def exported(model_path, tmp_path):
+    pickle_path = str(tmp_path / "career_suggestion.pkl")
+    with open(model_path, "rb") as src, open(pickle_path, "wb") as dst:
+        dst.write(src.read())
+    return pickle_path, export_artifact(pickle_path, str(tmp_path / "career_suggestion.cfa"))
+
+
+def test_round_trip_matches_the_pickle(exported, profile):
+    pickle_path, cfa_path = exported
+    flat, labels, feature_names, header = open_artifact(cfa_path)
+    from_pickle = load_artifact(pickle_path)
+    assert isinstance(flat, FlatForest)
+    assert feature_names == from_pickle.feature_names
+    assert list(labels.classes_) == [str(c) for c in from_pickle.classes]
+    X = from_pickle.encoder.encode_batch([profile, {**profile, "CGPA": 9.5}])
+    np.testing.assert_array_equal(flat.predict_proba(X), from_pickle.model.predict_proba(X))
+    # Mapped read-only from the file
+    assert not flat.value.flags.writeable
+
+
+def test_staleness_follows_the_source_pickle(exported):
+    pickle_path, cfa_path = exported
+    assert stale_source(cfa_path) is None
+    source = read_header(cfa_path)["source"]
+    assert source["size"] == os.path.getsize(pickle_path)
+
+    with open(pickle_path, "ab") as f:
+        f.write(b"\0")
+    assert stale_source(cfa_path) == pickle_path
+    os.remove(pickle_path)
+    # A missing source counts as current
+    assert stale_source(cfa_path) is None
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not.cfa"
+    path.write_bytes(b"NOTACFA!" + bytes(8))
+    with pytest.raises(ValueError):
+        read_header(str(path))
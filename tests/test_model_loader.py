@@ -0,0 +1,16 @@
+import pytest
+
+from model_artifact import export_artifact
+from model_loader import reload_check
+
+
+@pytest.mark.parametrize("suffix", [".pkl", ".cfa"])
+def test_reload_check_swaps_in_the_rewritten_artifact(model_path, tmp_path, suffix):
+    path = model_path
+    if suffix == ".cfa":
+        path = export_artifact(model_path, str(tmp_path / "career_suggestion.cfa"))
+    result = reload_check(path, interval=0.05, seconds=0.3)
+    assert result["touch_reloads"] == 0
+    assert result["reloads"] == 1
+    assert result["errors"] == [] and result["last_error"] is None
+    assert result["old_released"]
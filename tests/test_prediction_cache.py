@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+from career_engine import Recommender
+from prediction_cache import PredictionCache, profile_key
+
+
+def test_profile_key_is_exact(profile):
+    assert profile_key({**profile, "CGPA": 8}) == profile_key({**profile, "CGPA": 8.0})
+    assert profile_key({**profile, "CGPA": 8.04}) != profile_key({**profile, "CGPA": 8.0})
+    assert profile_key(dict(reversed(list(profile.items())))) == profile_key(profile)
+
+
+def test_newer_model_clears_the_cache_and_older_results_are_ignored():
+    cache = PredictionCache(maxsize=10)
+    old, new = SimpleNamespace(generation=1), SimpleNamespace(generation=2)
+    cache.check_model(old)
+    cache.put("a", "old", old.generation)
+    assert cache.get("a", old.generation) == "old"
+
+    cache.check_model(new)
+    assert cache.get("a", new.generation) is None
+    # A request still pinned to the old model neither reads nor writes
+    cache.put("b", "stale", old.generation)
+    assert cache.get("b", new.generation) is None
+    cache.check_model(old)
+    cache.put("c", "new", new.generation)
+    assert cache.get("c", new.generation) == "new"
+
+
+def test_lru_eviction():
+    cache = PredictionCache(maxsize=2)
+    for key in "abc":
+        cache.put(key, key)
+    assert cache.get("a") is None and cache.get("c") == "c"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cached_predictions_match_direct_scoring(model_path, profile):
+    recommender = Recommender(model_path, engine="forest")
+    profiles = [{**profile, "CGPA": 6.0 + i / 10} for i in range(20)]
+    first = recommender.predict_proba(profiles)
+    again = recommender.predict_proba(profiles[::-1])[::-1]
+    assert (first == again).all()
+    assert recommender.cache.stats()["hits"] == 20
+    loaded = recommender.loaded
+    assert (first == loaded.model.predict_proba(loaded.encoder.encode_batch(profiles))).all()
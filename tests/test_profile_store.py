@@ -0,0 +1,29 @@
+from career_engine import Recommender
+from profile_store import ProfileStore
+
+
+def _store(tmp_path, profile, n=3):
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+    store.save_many((str(i), dict(profile, CGPA=6.0 + i)) for i in range(n))
+    return store
+
+
+def test_predictions_are_reused_for_the_same_model(tmp_path, model_path, profile):
+    recommender = Recommender(model_path, engine="forest")
+    with _store(tmp_path, profile) as store:
+        first = store.recommend(["0", "1", "2"], recommender)
+        assert store.get("0")["model_version"] == recommender.model_version
+        calls = []
+        recommender.recommend_batch = lambda *args: calls.append(args) or []
+        assert store.recommend(["0", "1", "2"], recommender) == first
+        assert calls == []
+
+
+def test_predictions_from_another_engine_are_stale(tmp_path, model_path, profile):
+    forest = Recommender(model_path, engine="forest")
+    rules = Recommender(model_path, engine="rules")
+    assert forest.model_version != rules.model_version
+    with _store(tmp_path, profile) as store:
+        store.recommend(["0"], rules)
+        assert store.recommend(["0"], forest)["0"] == forest.recommend(store.get("0"), 3)
+        assert store.recommend(["0"], rules)["0"] == rules.recommend(store.get("0"), 3)
@@ -0,0 +1,22 @@
+import numpy as np
+
+from career_engine import Recommender
+from compact_profiles import CompactProfiles, read_compact_chunks
+from rule_engine import RuleClassifier
+
+
+def test_rules_reproduce_the_generator_labels(dataset_path, model_path):
+    loaded = Recommender(model_path).loaded
+    rules = RuleClassifier.from_loaded(loaded)
+    profiles = CompactProfiles.concat([compact for _, compact in read_compact_chunks(dataset_path)])
+    X = profiles.feature_matrix(loaded.feature_names)
+    predicted = rules.class_labels[rules.predict(X)]
+    assert (predicted == np.asarray(profiles.target_labels())).all()
+    probs = rules.predict_proba(X[:10])
+    assert (probs.sum(axis=1) == 1).all() and (probs.max(axis=1) == 1).all()
+
+
+def test_rules_engine_recommends_only_its_career(model_path, profile):
+    careers = Recommender(model_path, engine="rules").recommend(profile, k=3)
+    assert len(careers) == 1 and careers[0][1] == 1.0
+    assert len(Recommender(model_path, engine="forest").recommend(profile, k=3)) == 3
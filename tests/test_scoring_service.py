@@ -0,0 +1,66 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from career_engine import Recommender
+from scoring_service import MicroBatcher, ScoringServer, make_handler, parse_profile
+
+
+@pytest.mark.parametrize("change, message", [
+    ({"CGPA": 1000}, "between"),
+    ({"CGPA": -0.5}, "between"),
+    ({"Math Skill (1-10)": -50}, "between"),
+    ({"Math Skill (1-10)": 11}, "between"),
+    ({"Math Skill (1-10)": float("nan")}, "finite"),
+    ({"Math Skill (1-10)": True}, "number"),
+    ({"Math Skill (1-10)": "high"}, "number"),
+    ({"Preferred Interest": "Cooking"}, "one of"),
+    ({"Favourite Colour": "blue"}, "unknown"),
+])
+def test_invalid_profiles_are_rejected(profile, change, message):
+    with pytest.raises(ValueError, match=message):
+        parse_profile({**profile, **change})
+
+
+def test_missing_input_is_rejected(profile):
+    del profile["CGPA"]
+    with pytest.raises(ValueError, match="missing"):
+        parse_profile(profile)
+
+
+def test_valid_profile_is_coerced_to_float(profile):
+    parsed = parse_profile({**profile, "CGPA": "9.5", "Math Skill (1-10)": 10})
+    assert parsed["CGPA"] == 9.5 and parsed["Math Skill (1-10)"] == 10.0
+    assert parsed["Preferred Interest"] == profile["Preferred Interest"]
+
+
+@pytest.fixture
+def service(model_path):
+    server = ScoringServer(("127.0.0.1", 0), make_handler(MicroBatcher(Recommender(model_path), window_ms=1)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _post(url, body):
+    req = urllib.request.Request(url + "/recommend", data=json.dumps(body).encode("utf-8"))
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_service_scores_valid_and_rejects_out_of_range(service, model_path, profile):
+    status, body = _post(service, {"profile": profile, "k": 2})
+    assert status == 200
+    expected = Recommender(model_path).recommend(profile, 2)
+    assert [c["career"] for c in body["careers"]] == [career for career, _ in expected]
+    assert [c["probability"] for c in body["careers"]] == pytest.approx([p for _, p in expected])
+    status, body = _post(service, {"profile": {**profile, "CGPA": 1000}, "k": 3})
+    assert status == 400 and "CGPA" in body["error"]
@@ -0,0 +1,17 @@
+import json
+import os
+import pickle
+
+
+def test_manifest_embedded_and_json_copy(model_path):
+    with open(model_path, "rb") as f:
+        saved_objects = pickle.load(f)
+    with open(os.path.splitext(model_path)[0] + ".manifest.json") as f:
+        manifest_json = json.load(f)
+    embedded = saved_objects["manifest"]
+
+    assert set(embedded["timings_s"]) == {"load", "encode", "fit", "evaluate"}
+    assert set(manifest_json["timings_s"]) == {"load", "encode", "fit", "evaluate", "serialize"}
+    assert {**embedded, "timings_s": None} == {**manifest_json, "timings_s": None}
+    assert manifest_json["classes"] == [str(c) for c in saved_objects["label_encoder"].classes_]
+    assert not os.path.exists(model_path + ".tmp")
@@ -0,0 +1,34 @@
+import pytest
+
+from career_engine import Recommender
+from career_schema import INTEREST_COLUMN, INTERESTS, NUMERIC_COLUMNS
+from what_if import perturbations, sensitivity
+
+
+def test_perturbations_stay_within_the_slider_ranges(profile):
+    edge = {**profile, "CGPA": 10.0, "Math Skill (1-10)": 1}
+    labels = [label for label, *_ in perturbations(edge)]
+    assert "CGPA +1" not in labels and "Math Skill -1" not in labels
+    assert "CGPA -1" in labels and "Math Skill +1" in labels
+    assert len(perturbations(profile)) == 2 * len(NUMERIC_COLUMNS) + len(INTERESTS) - 1
+
+
+def test_sensitivity_matches_scoring_each_variant(model_path, profile):
+    recommender = Recommender(model_path, engine="forest")
+    report = sensitivity(recommender, profile, budget_ms=None)
+    assert report["skipped"] == 0
+    assert report["career"] == recommender.recommend(profile, 1)[0][0]
+    assert len(report["changes"]) == len(perturbations(profile))
+    for change in report["changes"]:
+        variant = {**profile, change["column"]: change["value"]}
+        career, probability = recommender.recommend(variant, 1)[0]
+        assert change["top_career"] == career
+        assert change["top_probability"] == pytest.approx(probability)
+        assert change["delta"] == pytest.approx(change["current_probability"] - report["probability"])
+    switched = [c["top_career"] != report["career"] for c in report["changes"]]
+    assert switched == sorted(switched, reverse=True)
+
+
+def test_interest_changes_are_included(profile):
+    interests = {value for _, column, value, _ in perturbations(profile) if column == INTEREST_COLUMN}
+    assert interests == set(INTERESTS) - {profile[INTEREST_COLUMN]}
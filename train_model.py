@@ -0,0 +1,172 @@
+"""Reproducible training pipeline for the career model.
+
+Replaces the notebook cells: read the CSV into the compact uint8/float32
+form, build the one-hot float32 matrix in ``pd.get_dummies`` column order,
+fit the ``LabelEncoder``, ``train_test_split`` and fit
+``RandomForestClassifier(n_estimators=300, max_depth=15)``, this time on all
+cores. Every stage (load, encode, fit, evaluate, serialize) is timed. The
+metrics/timing manifest is stored inside the pickle, so the artifact and its
+manifest are replaced in one atomic rename. A JSON copy, which adds the
+serialize time, is written next to it afterwards for humans and CI.
+
+    python train_model.py --data BTech_Career_Path_Dataset.csv --out career_suggestion.pkl
+"""
+
+import argparse
+import json
+import os
+import pickle
+import platform
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from compact_profiles import CompactProfiles, training_feature_names
+from data_ingest import load_csv
+
+DEFAULT_PARAMS = {"n_estimators": 300, "max_depth": 15, "random_state": 42, "n_jobs": -1}
+
+
+class StageTimer:
+    def __init__(self):
+        self.seconds = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = time.perf_counter() - start
+            print(f"[{name}] {self.seconds[name]:.2f}s")
+
+
+def load_dataset(path):
+    """Repaired, validated dataset as CompactProfiles (via the columnar cache) and its report."""
+    df, report = load_csv(path)
+    return CompactProfiles.from_frame(df), report
+
+
+def encode_dataset(profiles):
+    """Notebook encoding from the compact arrays: one-hot interest, label-encode the target."""
+    from sklearn.preprocessing import LabelEncoder
+
+    features = training_feature_names()
+    x = profiles.feature_matrix(features)
+    le = LabelEncoder()
+    y = le.fit_transform(profiles.target_labels())
+    return x, y, le, features
+
+
+def top_k_accuracy(probs, y, k=3):
+    top = np.argsort(probs, axis=1)[:, -k:]
+    return float((top == np.asarray(y)[:, None]).any(axis=1).mean())
+
+
+def write_artifact_atomic(path, saved_objects):
+    """Pickle ``saved_objects`` (manifest included) to ``path`` via fsync and rename."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(saved_objects, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def write_manifest_json(path, manifest):
+    """Write the JSON copy of the manifest next to the artifact at ``path``."""
+    manifest_path = os.path.splitext(path)[0] + ".manifest.json"
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return manifest_path
+
+
+def train(data_path, out_path, test_size=0.2, params=None, export_cfa=False):
+    from sklearn import __version__ as sklearn_version
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.model_selection import train_test_split
+
+    params = {**DEFAULT_PARAMS, **(params or {})}
+    timer = StageTimer()
+
+    with timer.stage("load"):
+        profiles, ingest_report = load_dataset(data_path)
+
+    with timer.stage("encode"):
+        x, y, le, features = encode_dataset(profiles)
+        train_x, test_x, train_y, test_y = train_test_split(
+            x, y, test_size=test_size, random_state=params["random_state"]
+        )
+
+    with timer.stage("fit"):
+        model = RandomForestClassifier(**params)
+        model.fit(train_x, train_y)
+
+    with timer.stage("evaluate"):
+        probs = model.predict_proba(test_x)
+        metrics = {
+            "accuracy": float((probs.argmax(axis=1) == test_y).mean()),
+            "top3_accuracy": top_k_accuracy(probs, test_y, 3),
+            "train_rows": int(len(train_x)),
+            "test_rows": int(len(test_x)),
+        }
+        print(f"accuracy {metrics['accuracy']:.4f}, top-3 accuracy {metrics['top3_accuracy']:.4f}")
+
+    manifest = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "data": {"path": os.path.abspath(data_path), "rows": len(profiles), "ingest": ingest_report,
+                 "compact_bytes": profiles.nbytes},
+        "params": {**params, "test_size": test_size},
+        "features": features,
+        "classes": [str(c) for c in le.classes_],
+        "metrics": metrics,
+        "environment": {
+            "python": platform.python_version(),
+            "sklearn": sklearn_version,
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "cpu_count": os.cpu_count(),
+        },
+    }
+
+    manifest["timings_s"] = dict(timer.seconds)
+    saved_objects = {"model": model, "label_encoder": le, "features": features, "manifest": manifest}
+    with timer.stage("serialize"):
+        write_artifact_atomic(out_path, saved_objects)
+    # The embedded manifest is the record of the artifact. The JSON copy is a
+    # convenience for humans and CI, written afterwards, and also has the
+    # serialize time (pickle, write and fsync) the embedded one cannot contain.
+    manifest = {**manifest, "timings_s": dict(timer.seconds)}
+    write_manifest_json(out_path, manifest)
+    if export_cfa:
+        from model_artifact import export_artifact
+
+        export_artifact(out_path, os.path.splitext(out_path)[0] + ".cfa")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the career suggestion model.")
+    parser.add_argument("--data", default="BTech_Career_Path_Dataset.csv", help="Training CSV")
+    parser.add_argument("--out", default="career_suggestion.pkl", help="Output pickle path")
+    parser.add_argument("--test-size", type=float, default=0.2, help="Held-out fraction")
+    parser.add_argument("--n-estimators", type=int, default=DEFAULT_PARAMS["n_estimators"])
+    parser.add_argument("--max-depth", type=int, default=DEFAULT_PARAMS["max_depth"])
+    parser.add_argument("--n-jobs", type=int, default=DEFAULT_PARAMS["n_jobs"],
+                        help="Cores used for fitting (-1 = all)")
+    parser.add_argument("--export-cfa", action="store_true",
+                        help="Also write the memory-mappable .cfa artifact")
+    args = parser.parse_args()
+
+    params = {"n_estimators": args.n_estimators, "max_depth": args.max_depth, "n_jobs": args.n_jobs}
+    manifest = train(args.data, args.out, args.test_size, params, args.export_cfa)
+    total = sum(manifest["timings_s"].values())
+    print(f"Wrote {args.out} in {total:.2f}s total")
+
+
+if __name__ == "__main__":
+    main()